@@ -6,9 +6,14 @@ Removes readings that are clearly incorrect (not in expected range)
 
 import json
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from snapshot_manager import SnapshotManager
+
 # Expected range for water meter readings (2000-3000 m³)
 MIN_VALID_READING = 2000
 MAX_VALID_READING = 3000
@@ -98,6 +103,9 @@ def cleanup_wrong_readings(meter_name="water_main", dry_run=True):
                     jpg_file.unlink()
                     print(f"  ✓ Deleted: {jpg_file.name}")
 
+            # Drop the deleted readings from the history index
+            SnapshotManager(base_dir=str(base_dir.parent)).rebuild_index(meter_name)
+
             print(f"\n✅ Cleanup complete! Deleted {len(wrong_readings)} wrong readings.")
         else:
             print(f"\n⚠️  DRY RUN - No files were deleted. Run with dry_run=False to delete.")
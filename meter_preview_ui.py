@@ -552,6 +552,7 @@ def api_reprocess_snapshot(meter_type):
         # Import and run analysis
         sys.path.insert(0, str(Path(__file__).parent / "src"))
         from gemini_reader import read_meter
+        from snapshot_manager import SnapshotManager
 
         # Use Gemini (free) with Claude fallback
         reading = read_meter(str(image_path), fallback_to_claude=True)
@@ -567,8 +568,9 @@ def api_reprocess_snapshot(meter_type):
 
             metadata['meter_reading'] = reading
 
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            SnapshotManager(base_dir=str(LOG_DIR / 'meter_snapshots')).write_metadata(
+                image_path, metadata
+            )
 
         # Log to JSONL
         log_file = LOG_DIR / f"{meter_type}_readings.jsonl"
@@ -704,6 +706,7 @@ def api_reanalyze_snapshot(meter_type):
         # Import and use llm_reader
         sys.path.insert(0, str(Path(__file__).parent / "src"))
         from llm_reader import read_meter_with_claude
+        from snapshot_manager import SnapshotManager
 
         # Analyze the existing snapshot
         result = read_meter_with_claude(str(latest_snapshot))
@@ -717,7 +720,6 @@ def api_reanalyze_snapshot(meter_type):
 
         # Update metadata file
         snapshot_path = Path(latest_snapshot)
-        metadata_path = snapshot_path.with_suffix('.json')
 
         metadata = {
             "snapshot": {
@@ -743,8 +745,9 @@ def api_reanalyze_snapshot(meter_type):
             "reanalyzed_at": datetime.now().isoformat()
         }
 
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        SnapshotManager(base_dir=str(LOG_DIR / 'meter_snapshots')).write_metadata(
+            snapshot_path, metadata
+        )
 
         # Also update the readings JSONL file
         log_file = LOG_DIR / f"{meter_type}_readings.jsonl"
@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from utils.config_loader import load_config
 from gemini_reader import read_meter
+from snapshot_manager import SnapshotManager
 
 def main():
     # Load config
@@ -94,7 +95,6 @@ def main():
     timestamp_str = reading.get('timestamp', datetime.now().isoformat())
     snapshot_filename = f"{meter_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
     snapshot_path = archive_dir / snapshot_filename
-    metadata_path = archive_dir / f"{snapshot_filename.replace('.jpg', '.json')}"
 
     # Copy image to archive
     shutil.copy2(temp_path, snapshot_path)
@@ -108,8 +108,9 @@ def main():
         },
         'meter_reading': reading
     }
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    metadata_path = SnapshotManager(base_dir='logs/meter_snapshots').write_metadata(
+        snapshot_path, metadata
+    )
 
     # Step 4: Log to JSONL
     print(f"📝 Logging to JSONL...", file=sys.stderr)
@@ -11,6 +11,13 @@ from pathlib import Path
 from typing import Union, Tuple, Optional
 from PIL import Image, ImageOps, ExifTags
 
+try:
+    import cv2
+    import numpy as np
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
 
 def rotate_image(image: Union[str, Path, bytes, Image.Image], degrees: int) -> Image.Image:
     """
@@ -130,26 +137,113 @@ def save_rotated_image(image: Image.Image,
     return output_path
 
 
-def image_to_bytes(image: Image.Image, format: str = 'JPEG', quality: int = 95) -> bytes:
+def image_to_bytes(image: Image.Image, format: str = 'JPEG', quality: int = 95,
+                   **save_options) -> bytes:
     """
     Convert PIL Image to bytes.
 
     Args:
         image: PIL Image object
-        format: Output format (JPEG, PNG, etc.)
-        quality: Image quality for JPEG (1-100)
+        format: Output format (JPEG, PNG, WEBP, etc.)
+        quality: Image quality for lossy formats (1-100)
+        **save_options: Extra encoder options passed to PIL (e.g. method=6 for WEBP)
 
     Returns:
         Image as bytes
     """
     buffer = io.BytesIO()
-    image.save(buffer, format=format, quality=quality, optimize=True)
+    image.save(buffer, format=format, quality=quality, optimize=True, **save_options)
     return buffer.getvalue()
 
 
+def find_meter_roi(image: Image.Image, detect_size: int = 512,
+                   min_red_fraction: float = 0.002) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Locate the meter face by detecting the red-needle dial.
+
+    Runs a Hough circle transform on a small grayscale copy of the image and
+    keeps the smallest circle containing red pixels (the sweep hand), then
+    expands its bounding box upward to include the digit display above it.
+
+    Args:
+        image: PIL Image object
+        detect_size: Long edge (pixels) of the copy used for detection
+        min_red_fraction: Minimum share of red pixels inside a circle for it
+                          to count as the dial
+
+    Returns:
+        (left, top, right, bottom) crop box in original image coordinates,
+        or None if OpenCV is unavailable or no dial was found
+    """
+    if not OPENCV_AVAILABLE:
+        return None
+
+    # Detect on a downscaled copy (cheap)
+    small = image.convert('RGB')
+    small.thumbnail((detect_size, detect_size))
+    scale = image.width / small.width
+    rgb = np.asarray(small)
+    gray = cv2.medianBlur(cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY), 5)
+
+    min_dim = min(gray.shape)
+    circles = cv2.HoughCircles(
+        gray,
+        cv2.HOUGH_GRADIENT,
+        dp=1.2,
+        minDist=min_dim / 16,
+        param1=100,
+        param2=40,
+        minRadius=min_dim // 30,
+        maxRadius=min_dim // 2
+    )
+    if circles is None:
+        return None
+
+    # Same red thresholds as the OpenCV needle reader
+    hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+    red_mask = cv2.bitwise_or(
+        cv2.inRange(hsv, (0, 100, 100), (10, 255, 255)),
+        cv2.inRange(hsv, (160, 100, 100), (180, 255, 255))
+    )
+
+    dial = None
+    for x, y, r in circles[0]:
+        circle_mask = np.zeros_like(red_mask)
+        cv2.circle(circle_mask, (int(x), int(y)), int(r), 255, -1)
+        area = cv2.countNonZero(circle_mask)
+        red = cv2.countNonZero(cv2.bitwise_and(red_mask, circle_mask))
+        if area and red / area >= min_red_fraction and (dial is None or r < dial[2]):
+            dial = (x, y, r)
+
+    # No circle with a red hand - low confidence, keep the full image
+    if dial is None:
+        return None
+
+    cx, cy, r = (float(v) * scale for v in dial)
+
+    # Dial bbox, widened slightly and extended upward over the digit display
+    left = max(0, int(cx - 1.5 * r))
+    right = min(image.width, int(cx + 1.5 * r))
+    top = max(0, int(cy - 2.5 * r))
+    bottom = min(image.height, int(cy + 1.2 * r))
+
+    # A crop covering nearly the whole frame isn't worth doing
+    if (right - left) * (bottom - top) > 0.9 * image.width * image.height:
+        return None
+
+    return left, top, right, bottom
+
+
+# Long-edge cap matching the Claude vision resize target; larger images are
+# downscaled server-side anyway, so sending more pixels only costs bandwidth
+MAX_LONG_EDGE = 1568
+
+
 def preprocess_meter_image(image_path: Union[str, Path],
                           rotation: Optional[int] = None,
-                          auto_orient: bool = True) -> Tuple[Image.Image, dict]:
+                          auto_orient: bool = True,
+                          max_long_edge: Optional[int] = MAX_LONG_EDGE,
+                          crop_to_meter: bool = False) -> Tuple[Image.Image, dict]:
     """
     Preprocess meter image for analysis.
 
@@ -160,6 +254,10 @@ def preprocess_meter_image(image_path: Union[str, Path],
         image_path: Path to meter image
         rotation: Manual rotation angle (0, 90, 180, 270) or None
         auto_orient: Automatically correct orientation from EXIF
+        max_long_edge: Downscale so the longest side is at most this many
+                       pixels (None keeps full resolution)
+        crop_to_meter: Crop to the detected meter face (falls back to the
+                       full image if no dial is found)
 
     Returns:
         Tuple of (processed_image, metadata)
@@ -168,7 +266,9 @@ def preprocess_meter_image(image_path: Union[str, Path],
         'original_path': str(image_path),
         'auto_oriented': False,
         'manual_rotation': 0,
-        'flipped': False
+        'flipped': False,
+        'downscaled': False,
+        'meter_roi': None
     }
 
     # Load image
@@ -188,6 +288,18 @@ def preprocess_meter_image(image_path: Union[str, Path],
         img = rotate_image(img, rotation)
         metadata['manual_rotation'] = rotation
 
+    # Crop to the meter face before downscaling so detail is preserved
+    if crop_to_meter:
+        roi = find_meter_roi(img)
+        if roi:
+            img = img.crop(roi)
+            metadata['meter_roi'] = roi
+
+    # Cap resolution before upload
+    if max_long_edge and max(img.size) > max_long_edge:
+        img.thumbnail((max_long_edge, max_long_edge), Image.Resampling.LANCZOS)
+        metadata['downscaled'] = True
+
     metadata['final_size'] = img.size
 
     return img, metadata
@@ -212,7 +324,8 @@ def main():
     img, metadata = preprocess_meter_image(
         args.image,
         rotation=args.rotate,
-        auto_orient=args.auto_orient
+        auto_orient=args.auto_orient,
+        max_long_edge=None
     )
 
     # Determine output path
@@ -5,15 +5,59 @@ Write water meter readings to InfluxDB for Grafana visualization
 Usage:
     from influxdb_writer import write_reading_to_influxdb
     write_reading_to_influxdb(reading_dict, influxdb_url="http://localhost:8086")
+
+    # Several readings in one request
+    from influxdb_writer import write_readings_batch_to_influxdb
+    write_readings_batch_to_influxdb([reading_dict, ...])
 """
 
 import os
-from typing import Dict
+from typing import Dict, List
 from datetime import datetime
 
 
-def write_reading_to_influxdb(reading: Dict, influxdb_url: str = None):
-    """Write a meter reading to InfluxDB"""
+def _reading_to_point(reading: Dict) -> Dict:
+    """Build an InfluxDB point dict for a meter reading (or reading error)"""
+    if "error" in reading:
+        # Log errors separately
+        return {
+            "measurement": "meter_reading_error",
+            "tags": {
+                "camera": os.getenv("WYZE_CAM_IP", "unknown"),
+                "meter_type": reading.get("meter_type", "water"),
+                "error_type": reading.get("error", "unknown")
+            },
+            "fields": {
+                "value": 1
+            },
+            "time": reading.get("timestamp", datetime.now().isoformat())
+        }
+
+    # Log successful reading
+    return {
+        "measurement": "meter_reading",
+        "tags": {
+            "camera": os.getenv("WYZE_CAM_IP", "unknown"),
+            "meter_type": reading.get("meter_type", "water"),
+            "confidence": reading.get("confidence", "unknown")
+        },
+        "fields": {
+            "value": float(reading.get("total_reading", 0)),
+            "total_reading": float(reading.get("total_reading", 0)),
+            "digital_reading": int(reading.get("digital_reading", 0)),
+            "dial_reading": float(reading.get("dial_reading", 0)),
+            "api_input_tokens": reading.get("api_usage", {}).get("input_tokens", 0),
+            "api_output_tokens": reading.get("api_usage", {}).get("output_tokens", 0)
+        },
+        "time": reading.get("timestamp", datetime.now().isoformat())
+    }
+
+
+def write_readings_batch_to_influxdb(readings: List[Dict], influxdb_url: str = None):
+    """Write several meter readings to InfluxDB in a single request"""
+
+    if not readings:
+        return True
 
     if influxdb_url is None:
         influxdb_url = os.getenv("INFLUXDB_URL", "http://localhost:8086")
@@ -40,46 +84,11 @@ def write_reading_to_influxdb(reading: Dict, influxdb_url: str = None):
 
         write_api = client.write_api(write_options=SYNCHRONOUS)
 
-        # Prepare data point
-        if "error" in reading:
-            # Log errors separately
-            point = {
-                "measurement": "meter_reading_error",
-                "tags": {
-                    "camera": os.getenv("WYZE_CAM_IP", "unknown"),
-                    "meter_type": reading.get("meter_type", "water"),
-                    "error_type": reading.get("error", "unknown")
-                },
-                "fields": {
-                    "value": 1
-                },
-                "time": reading.get("timestamp", datetime.now().isoformat())
-            }
-        else:
-            # Log successful reading
-            point = {
-                "measurement": "meter_reading",
-                "tags": {
-                    "camera": os.getenv("WYZE_CAM_IP", "unknown"),
-                    "meter_type": reading.get("meter_type", "water"),
-                    "confidence": reading.get("confidence", "unknown")
-                },
-                "fields": {
-                    "value": float(reading.get("total_reading", 0)),
-                    "total_reading": float(reading.get("total_reading", 0)),
-                    "digital_reading": int(reading.get("digital_reading", 0)),
-                    "dial_reading": float(reading.get("dial_reading", 0)),
-                    "api_input_tokens": reading.get("api_usage", {}).get("input_tokens", 0),
-                    "api_output_tokens": reading.get("api_usage", {}).get("output_tokens", 0)
-                },
-                "time": reading.get("timestamp", datetime.now().isoformat())
-            }
-
-        # Write to InfluxDB
+        # One write call with every point (sent as a single line-protocol body)
         write_api.write(
             bucket=bucket,
             org=org,
-            record=point
+            record=[_reading_to_point(reading) for reading in readings]
         )
 
         client.close()
@@ -90,6 +99,11 @@ def write_reading_to_influxdb(reading: Dict, influxdb_url: str = None):
         return False
 
 
+def write_reading_to_influxdb(reading: Dict, influxdb_url: str = None):
+    """Write a meter reading to InfluxDB"""
+    return write_readings_batch_to_influxdb([reading], influxdb_url)
+
+
 if __name__ == "__main__":
     # Test
     test_reading = {
@@ -12,13 +12,209 @@ import os
 import sys
 import json
 import base64
+import io
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+
+# Sibling modules (prompts/parsers, cache) - path set up once at import.
+# llm_reader needs the anthropic SDK, so it is only imported by the Claude path.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from meter_prompts import (
+    parse_simple_response,
+    METER_READING_PROMPT,
+    METER_READING_PROMPT_SIMPLE,
+)
+from vision_cache import VisionCache, make_cache_key
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Load API keys from .env once (existing environment variables win)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+
+# Vision payload settings - meter digits stay legible well below full
+# camera resolution, and smaller images mean fewer prompt tokens
+VISION_MAX_SIDE = 1024
+VISION_JPEG_QUALITY = 85
+
+# Set VISION_FULL_RES=1 (or pass --full-res) to send original images for debugging
+FULL_RES_IMAGES = os.getenv('VISION_FULL_RES', '').lower() in ('1', 'true', 'yes')
+
+# Cache API results by (image, prompt, model). Off for library callers (the
+# meter readers need a fresh answer each time); set VISION_CACHE=1 to enable.
+# The comparison CLI turns it on unless given --no-cache or VISION_CACHE=0.
+CACHE_ENABLED = os.getenv('VISION_CACHE', '').lower() in ('1', 'true', 'yes')
+
+_vision_cache = None
+
+# Finds where a streamed JSON object ends (braces inside strings included)
+_JSON_DECODER = json.JSONDecoder()
+
+# TurboJPEG decoder, created on first use (False if the native library is missing)
+_turbojpeg = None
+
+# API clients are built once and reused so later calls ride the existing
+# keep-alive connection instead of paying a fresh TCP+TLS handshake
+_openai_client = None
+_gemini_model = None
+
+
+def _get_openai_client(api_key: str):
+    """Lazily build the shared OpenAI client"""
+    global _openai_client
+    if _openai_client is None or _openai_client.api_key != api_key:
+        import httpx
+        import openai
+        _openai_client = openai.OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(limits=httpx.Limits(max_keepalive_connections=20))
+        )
+    return _openai_client
+
+
+def _get_gemini_model(api_key: str):
+    """Lazily configure Gemini and build the shared model"""
+    global _gemini_model
+    if _gemini_model is None:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        # Use latest stable flash model
+        _gemini_model = genai.GenerativeModel('gemini-2.5-flash')
+    return _gemini_model
+
+
+def _get_vision_cache():
+    """Lazily open the shared vision response cache"""
+    global _vision_cache
+    if _vision_cache is None:
+        _vision_cache = VisionCache()
+    return _vision_cache
+
 
+def _read_image_bytes(image_path: str, image_bytes: Optional[bytes] = None) -> bytes:
+    """Return the raw image file bytes, reading the file only if not already given"""
+    if image_bytes is None:
+        with open(image_path, 'rb') as f:
+            image_bytes = f.read()
+    return image_bytes
+
+
+def _cache_lookup(
+    image_path: str,
+    prompt: str,
+    model: str,
+    image_bytes: Optional[bytes] = None,
+    vision_payload: bool = True
+) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    Look up a cached vision result
+
+    A hit is returned with a fresh timestamp and zeroed token counts, since
+    no API call was made for it.
+
+    Args:
+        image_path: Path to meter image
+        prompt: Prompt text sent with the image
+        model: Model identifier
+        image_bytes: Raw image file bytes if already read
+        vision_payload: Whether the method sends _prepare_vision_payload's
+                        image (whose settings then become part of the key)
+
+    Returns:
+        Tuple of (cache_key, cached_result); cache_key is None when caching
+        is disabled or the image isn't a local file
+    """
+    if not CACHE_ENABLED or (image_bytes is None and not os.path.isfile(image_path)):
+        return None, None
+
+    # The payload settings change what the model sees, so they're part of the key
+    if vision_payload:
+        variant = 'full' if FULL_RES_IMAGES else f'{VISION_MAX_SIDE}px-q{VISION_JPEG_QUALITY}'
+        model = f'{model}|{variant}'
+    cache_key = make_cache_key(_read_image_bytes(image_path, image_bytes), prompt, model)
+
+    cached = _get_vision_cache().get(cache_key)
+    if cached is not None:
+        cached['cache_hit'] = True
+        cached['timestamp'] = datetime.now().isoformat()
+        usage = cached.get('api_usage')
+        if isinstance(usage, dict):
+            for field in ('input_tokens', 'output_tokens', 'total_tokens'):
+                if field in usage:
+                    usage[field] = 0
+    return cache_key, cached
+
+
+def _holds_json_object(text: str) -> bool:
+    """Check whether text contains a complete JSON object (from its first '{')"""
+    start = text.find('{')
+    if start < 0:
+        return False
+    try:
+        _JSON_DECODER.raw_decode(text, start)
+    except ValueError:
+        return False
+    return True
+
+
+def _cache_store(cache_key: Optional[str], result: Dict):
+    """Store a successful vision result under its cache key"""
+    if cache_key and 'error' not in result:
+        _get_vision_cache().put(cache_key, result)
+
+
+def _prepare_vision_payload(
+    image_path: str,
+    max_side: int = VISION_MAX_SIDE,
+    quality: int = VISION_JPEG_QUALITY,
+    image_bytes: Optional[bytes] = None
+) -> bytes:
+    """
+    Load an image for a vision API, downscaled and JPEG-recompressed
+
+    Args:
+        image_path: Path to meter image
+        max_side: Longest side in pixels after downscaling
+        quality: JPEG quality (1-100)
+        image_bytes: Raw image file bytes if already read (skips the file read)
+
+    Returns:
+        Image bytes (JPEG unless full-resolution mode is on)
+    """
+    if FULL_RES_IMAGES:
+        image_bytes = _read_image_bytes(image_path, image_bytes)
+    else:
+        from io import BytesIO
+        from PIL import Image
 
-def test_with_openai(image_path: str, prompt_format: str = "simple") -> Dict:
+        source = BytesIO(image_bytes) if image_bytes is not None else image_path
+        img = Image.open(source).convert('RGB')
+        img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        img.save(buffer, 'JPEG', quality=quality, optimize=True)
+        image_bytes = buffer.getvalue()
+
+    return image_bytes
+
+
+def test_with_openai(
+    image_path: str,
+    prompt_format: str = "simple",
+    image_bytes: Optional[bytes] = None
+) -> Dict:
     """Test using OpenAI API (GPT-4o-mini)"""
     try:
         import openai
@@ -29,22 +225,23 @@ def test_with_openai(image_path: str, prompt_format: str = "simple") -> Dict:
     if not api_key:
         return {'error': 'Set OPENAI_API_KEY environment variable'}
 
-    # Load prompts
-    import sys
-    sys.path.insert(0, os.path.dirname(__file__))
-    from llm_reader import METER_READING_PROMPT_SIMPLE, parse_simple_response
+    cache_key, cached = _cache_lookup(image_path, METER_READING_PROMPT_SIMPLE, 'gpt-4o-mini',
+                                      image_bytes)
+    if cached is not None:
+        return cached
 
-    # Encode image
-    with open(image_path, 'rb') as f:
-        image_data = base64.b64encode(f.read()).decode('utf-8')
+    # Encode image (base64 is required by the data URL; ASCII decode is enough)
+    image_data = base64.b64encode(
+        _prepare_vision_payload(image_path, image_bytes=image_bytes)
+    ).decode('ascii')
 
-    client = openai.OpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
 
     try:
         print(f"🚀 Calling OpenAI GPT-4o-mini...")
         print(f"📝 Using {prompt_format} prompt")
         
-        response = client.chat.completions.create(
+        stream = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
@@ -52,7 +249,10 @@ def test_with_openai(image_path: str, prompt_format: str = "simple") -> Dict:
                     "content": [
                         {
                             "type": "image_url",
-                            "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{image_data}",
+                                "detail": "high" if FULL_RES_IMAGES else "low"
+                            }
                         },
                         {
                             "type": "text",
@@ -61,20 +261,44 @@ def test_with_openai(image_path: str, prompt_format: str = "simple") -> Dict:
                     ]
                 }
             ],
-            max_tokens=1024
+            max_tokens=1024,
+            stream=True,
+            stream_options={"include_usage": True}
         )
 
-        response_text = response.choices[0].message.content
+        # Stop as soon as the text holds a complete JSON object - anything
+        # the model adds after it is discarded by the parser anyway. Closing
+        # the stream early means the final usage chunk never arrives.
+        parts = []
+        usage = None
+        for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            delta = chunk.choices[0].delta.content
+            parts.append(delta)
+            if '}' in delta and _holds_json_object(''.join(parts)):
+                break
+        stream.close()
+
+        response_text = ''.join(parts)
         print(f"\n📄 Raw response:\n{response_text}\n")
 
         # Parse response
         result = parse_simple_response(response_text)
 
-        # Add usage info and model tracking
+        # Add usage info and model tracking (token counts are None when the
+        # stream was closed before its usage chunk)
+        if usage is not None:
+            input_tokens, output_tokens = usage.prompt_tokens, usage.completion_tokens
+            total_tokens = input_tokens + output_tokens
+        else:
+            input_tokens = output_tokens = total_tokens = None
         result['api_usage'] = {
-            'input_tokens': response.usage.prompt_tokens,
-            'output_tokens': response.usage.completion_tokens,
-            'total_tokens': response.usage.total_tokens,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': total_tokens,
             'model': 'gpt-4o-mini'
         }
 
@@ -82,44 +306,41 @@ def test_with_openai(image_path: str, prompt_format: str = "simple") -> Dict:
         result['vision_model'] = 'gpt-4o-mini'
         result['vision_provider'] = 'openai'
 
+        _cache_store(cache_key, result)
         return result
 
     except Exception as e:
         return {'error': f'OpenAI API error: {str(e)}'}
 
 
-def test_with_gemini(image_path: str, prompt_format: str = "simple") -> Dict:
+def test_with_gemini(
+    image_path: str,
+    prompt_format: str = "simple",
+    image_bytes: Optional[bytes] = None
+) -> Dict:
     """Test using Google Gemini Flash (free tier available)"""
     try:
         import google.generativeai as genai
     except ImportError:
         return {'error': 'Run: pip install google-generativeai'}
 
-    # Load API key from .env if not in environment
     api_key = os.getenv('GOOGLE_API_KEY')
-    if not api_key:
-        from dotenv import load_dotenv
-        load_dotenv()
-        api_key = os.getenv('GOOGLE_API_KEY')
-
     if not api_key:
         return {'error': 'Set GOOGLE_API_KEY environment variable or add to .env file'}
 
-    # Load prompts
-    sys.path.insert(0, os.path.dirname(__file__))
-    from llm_reader import METER_READING_PROMPT_SIMPLE, parse_simple_response
+    cache_key, cached = _cache_lookup(image_path, METER_READING_PROMPT_SIMPLE, 'gemini-2.5-flash',
+                                      image_bytes)
+    if cached is not None:
+        return cached
 
-    genai.configure(api_key=api_key)
-    # Use latest stable flash model
-    model = genai.GenerativeModel('gemini-2.5-flash')
+    model = _get_gemini_model(api_key)
 
     try:
         print(f"🚀 Calling Google Gemini Flash...", file=sys.stderr)
         print(f"📝 Using {prompt_format} prompt", file=sys.stderr)
 
         # Upload image
-        with open(image_path, 'rb') as f:
-            image_data = f.read()
+        image_data = _prepare_vision_payload(image_path, image_bytes=image_bytes)
 
         response = model.generate_content([
             METER_READING_PROMPT_SIMPLE,
@@ -145,6 +366,7 @@ def test_with_gemini(image_path: str, prompt_format: str = "simple") -> Dict:
         result['vision_model'] = 'gemini-2.5-flash'
         result['vision_provider'] = 'google'
 
+        _cache_store(cache_key, result)
         return result
 
     except Exception as e:
@@ -154,7 +376,8 @@ def test_with_gemini(image_path: str, prompt_format: str = "simple") -> Dict:
 def test_with_ollama(
     image_path: str,
     model: str = "llama3.2-vision:11b",
-    prompt_format: str = "simple"
+    prompt_format: str = "simple",
+    image_bytes: Optional[bytes] = None
 ) -> Dict:
     """
     Test using Ollama with local vision model (TRULY LOCAL, NO API!)
@@ -173,18 +396,28 @@ def test_with_ollama(
     except ImportError:
         return {'error': 'Run: pip install ollama'}
 
-    # Load prompts
-    sys.path.insert(0, os.path.dirname(__file__))
-    from llm_reader import METER_READING_PROMPT_SIMPLE, parse_simple_response
+    # Check the server and model before touching the image
+    installed = _list_ollama_models()
+    if installed is None:
+        return {'error': 'Ollama not running. Start with: ollama serve'}
+    tag = model if ':' in model else f'{model}:latest'
+    if tag not in installed:
+        # The model may have been pulled since the list was cached
+        installed = _list_ollama_models(refresh=True)
+        if installed is None or tag not in installed:
+            return {'error': f'Model not found. Pull with: ollama pull {model}'}
+
+    cache_key, cached = _cache_lookup(image_path, METER_READING_PROMPT_SIMPLE, model, image_bytes)
+    if cached is not None:
+        return cached
 
     try:
         print(f"🚀 Calling Ollama ({model})...")
         print(f"📝 Using {prompt_format} prompt")
         print(f"🏠 Running LOCALLY (no API, no internet needed)")
 
-        # Read image as base64
-        with open(image_path, 'rb') as f:
-            image_data = base64.b64encode(f.read()).decode('utf-8')
+        # The ollama client accepts raw bytes, so skip the base64 round trip
+        image_data = _prepare_vision_payload(image_path, image_bytes=image_bytes)
 
         response = ollama.chat(
             model=model,
@@ -214,6 +447,7 @@ def test_with_ollama(
         result['vision_model'] = model
         result['vision_provider'] = 'ollama'
 
+        _cache_store(cache_key, result)
         return result
 
     except Exception as e:
@@ -230,7 +464,55 @@ def test_with_ollama(
             return {'error': f'Ollama error: {error_msg}'}
 
 
-def test_with_opencv(image_path: str) -> Dict:
+@lru_cache(maxsize=1)
+def _red_hue_lut():
+    """256-entry lookup table mapping OpenCV hue (0-179) to 255 for red, 0 otherwise"""
+    import numpy as np
+    hues = np.arange(256)
+    return np.where((hues <= 10) | (hues >= 160), 255, 0).astype(np.uint8)
+
+
+def _decode_half_scale(image_path: str, image_bytes: Optional[bytes] = None):
+    """
+    Decode an image to a BGR array at half resolution
+
+    JPEGs are scaled during decoding (libjpeg-turbo DCT scaling), so the
+    full-resolution frame is never materialized. Uses PyTurboJPEG when
+    installed, otherwise OpenCV's reduced-size decode.
+
+    Args:
+        image_path: Path to image
+        image_bytes: Raw image file bytes if already read
+
+    Returns:
+        BGR numpy array, or None if the image couldn't be decoded
+    """
+    import cv2
+    import numpy as np
+
+    global _turbojpeg
+    if TURBOJPEG_AVAILABLE and _turbojpeg is None:
+        try:
+            _turbojpeg = TurboJPEG()
+        except Exception:
+            _turbojpeg = False  # libturbojpeg missing - don't retry
+
+    if _turbojpeg:
+        try:
+            return _turbojpeg.decode(
+                _read_image_bytes(image_path, image_bytes),
+                pixel_format=TJPF_BGR,
+                scaling_factor=(1, 2)
+            )
+        except Exception:
+            pass  # Not a JPEG (or corrupt) - let OpenCV try
+
+    if image_bytes is not None:
+        return cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_REDUCED_COLOR_2)
+    return cv2.imread(image_path, cv2.IMREAD_REDUCED_COLOR_2)
+
+
+def test_with_opencv(image_path: str, image_bytes: Optional[bytes] = None) -> Dict:
     """Fallback: Pure OpenCV approach (no ML, basic CV only)"""
     try:
         import cv2
@@ -242,35 +524,38 @@ def test_with_opencv(image_path: str) -> Dict:
         print(f"🚀 Using OpenCV (basic computer vision)...")
         print(f"🏠 Running LOCALLY (no ML models needed)")
 
-        img = cv2.imread(image_path)
+        # Needle angle is scale-invariant, so decode straight to half resolution
+        img = _decode_half_scale(image_path, image_bytes)
         if img is None:
             return {'error': f'Could not read image: {image_path}'}
 
-        # Very basic approach - detect bright regions (odometer digits)
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-        # Detect red needle for dial reading
+        # Detect red needle for dial reading - red hue wraps around 0/180,
+        # so a lookup table covers both ends of the range in one pass
         hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
-        lower_red1 = np.array([0, 100, 100])
-        upper_red1 = np.array([10, 255, 255])
-        lower_red2 = np.array([160, 100, 100])
-        upper_red2 = np.array([180, 255, 255])
-
-        mask1 = cv2.inRange(hsv, lower_red1, upper_red1)
-        mask2 = cv2.inRange(hsv, lower_red2, upper_red2)
-        red_mask = cv2.bitwise_or(mask1, mask2)
+        hue_mask = cv2.LUT(cv2.extractChannel(hsv, 0), _red_hue_lut())
+        sv_mask = cv2.inRange(hsv, (0, 100, 100), (255, 255, 255))
+        red_mask = cv2.bitwise_and(hue_mask, sv_mask)
 
-        # Find needle angle
-        contours, _ = cv2.findContours(red_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Find needle angle from the mask's edges rather than every mask pixel,
+        # so the pivot blob doesn't bias the fit
+        edges = cv2.Canny(red_mask, 50, 150)
+        lines = cv2.HoughLinesP(edges, 1, np.pi / 180, threshold=30,
+                                minLineLength=20, maxLineGap=5)
 
         needle_angle = 0.0
-        if contours:
-            # Get largest red contour (likely needle)
-            largest = max(contours, key=cv2.contourArea)
-            # Fit line to contour
-            [vx, vy, x, y] = cv2.fitLine(largest, cv2.DIST_L2, 0, 0.01, 0.01)
-            # Convert numpy types to Python float
-            angle = float(np.arctan2(float(vy), float(vx)))
+        if lines is not None:
+            # Longest segment is the needle edge
+            x1, y1, x2, y2 = max(
+                lines.reshape(-1, 4),
+                key=lambda l: (l[2] - l[0]) ** 2 + (l[3] - l[1]) ** 2
+            ).astype(float)
+
+            # Point from the end nearest the red mass (pivot hub) toward the tip
+            cy, cx = (float(c.mean()) for c in np.nonzero(red_mask))
+            if (x1 - cx) ** 2 + (y1 - cy) ** 2 > (x2 - cx) ** 2 + (y2 - cy) ** 2:
+                x1, y1, x2, y2 = x2, y2, x1, y1
+
+            angle = float(np.arctan2(y2 - y1, x2 - x1))
             needle_angle = float((np.degrees(angle) + 90) % 360)
 
         # Estimate dial value from needle angle
@@ -297,6 +582,42 @@ def test_with_opencv(image_path: str) -> Dict:
         return {'error': f'OpenCV error: {str(e)}'}
 
 
+# Preferred Ollama vision models, best first
+OLLAMA_MODEL_PREFERENCE = ('llava:13b', 'llama3.2-vision:11b', 'llava:7b')
+DEFAULT_OLLAMA_MODEL = 'llama3.2-vision:11b'
+
+
+# Installed Ollama model tags from the last successful query
+_ollama_models: Optional[frozenset] = None
+
+
+def _list_ollama_models(refresh: bool = False) -> Optional[frozenset]:
+    """
+    Installed Ollama model tags, or None if the server isn't reachable
+
+    A successful query is reused for the rest of the process (unless
+    refresh is set); failures are not cached, so a server started later
+    is picked up on the next call.
+    """
+    global _ollama_models
+    if _ollama_models is not None and not refresh:
+        return _ollama_models
+    try:
+        import ollama
+        # Newer clients report the tag as 'model', older ones as 'name'
+        models = frozenset(m.get('model') or m.get('name') for m in ollama.list()['models'])
+    except Exception:
+        return None
+    _ollama_models = models
+    return models
+
+
+def _detect_ollama_model() -> str:
+    """Pick the best installed Ollama vision model"""
+    installed = _list_ollama_models() or ()
+    return next((m for m in OLLAMA_MODEL_PREFERENCE if m in installed), DEFAULT_OLLAMA_MODEL)
+
+
 def compare_all_methods(image_path: str, ollama_model: str = None) -> Dict[str, Dict]:
     """
     Compare all available vision methods
@@ -307,26 +628,21 @@ def compare_all_methods(image_path: str, ollama_model: str = None) -> Dict[str,
     """
     # Auto-detect available Ollama model if not specified
     if ollama_model is None:
-        try:
-            import subprocess
-            result = subprocess.run(['ollama', 'list'], capture_output=True, text=True)
-            if 'llava:13b' in result.stdout:
-                ollama_model = 'llava:13b'
-            elif 'llama3.2-vision:11b' in result.stdout:
-                ollama_model = 'llama3.2-vision:11b'
-            elif 'llava:7b' in result.stdout:
-                ollama_model = 'llava:7b'
-            else:
-                ollama_model = 'llama3.2-vision:11b'  # Default
-        except:
-            ollama_model = 'llama3.2-vision:11b'
+        ollama_model = _detect_ollama_model()
+
+    # Read the image once and hand the bytes to every method; if that fails,
+    # each method reads (and reports on) the file itself
+    try:
+        image_bytes = Path(image_path).read_bytes()
+    except OSError:
+        image_bytes = None
 
     methods = {
-        'claude': lambda: test_with_claude(image_path),
-        'openai': lambda: test_with_openai(image_path),
-        'gemini': lambda: test_with_gemini(image_path),
-        'ollama': lambda: test_with_ollama(image_path, model=ollama_model),
-        'opencv': lambda: test_with_opencv(image_path)
+        'claude': lambda: test_with_claude(image_path, image_bytes=image_bytes),
+        'openai': lambda: test_with_openai(image_path, image_bytes=image_bytes),
+        'gemini': lambda: test_with_gemini(image_path, image_bytes=image_bytes),
+        'ollama': lambda: test_with_ollama(image_path, model=ollama_model, image_bytes=image_bytes),
+        'opencv': lambda: test_with_opencv(image_path, image_bytes=image_bytes)
     }
 
     results = {}
@@ -335,48 +651,150 @@ def compare_all_methods(image_path: str, ollama_model: str = None) -> Dict[str,
     print("COMPARING ALL VISION METHODS")
     print("="*60 + "\n")
 
-    for name, method_func in methods.items():
-        print(f"\n{'='*60}")
-        print(f"Testing: {name.upper()}")
-        print('='*60)
-
-        start = time.time()
-        try:
-            result = method_func()
-            elapsed = time.time() - start
-
-            if 'error' not in result:
-                result['elapsed_time'] = round(elapsed, 2)
-                print(f"✅ Success in {elapsed:.2f}s")
-                if 'total_reading' in result:
-                    print(f"   Reading: {result['total_reading']} m³")
-                    print(f"   Confidence: {result.get('confidence', 'N/A')}")
-            else:
-                result['elapsed_time'] = round(elapsed, 2)
-                print(f"❌ {result['error']}")
-        except Exception as e:
-            result = {
-                'error': str(e),
-                'elapsed_time': round(time.time() - start, 2)
+    # Each method's own prints are held back and shown with its banner
+    stdout, stderr = _ThreadOutput(sys.stdout), _ThreadOutput(sys.stderr)
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        # Providers are independent network/IO-bound calls, so run them
+        # concurrently; wall time is the slowest provider rather than the sum
+        with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+            futures = {
+                executor.submit(_run_timed, method_func, (stdout, stderr)): name
+                for name, method_func in methods.items()
             }
-            print(f"❌ Exception: {e}")
 
-        results[name] = result
+            # Output is printed from this thread only, so it never interleaves
+            for future in as_completed(futures):
+                name = futures[future]
+                result, (out, err) = future.result()
+                elapsed = result['elapsed_time']
+
+                print(f"\n{'='*60}")
+                print(f"Testing: {name.upper()}")
+                print('='*60)
+                stdout.stream.write(out)
+                stderr.stream.write(err)
+
+                if 'error' not in result:
+                    print(f"✅ Success in {elapsed:.2f}s")
+                    if 'total_reading' in result:
+                        print(f"   Reading: {result['total_reading']} m³")
+                        print(f"   Confidence: {result.get('confidence', 'N/A')}")
+                else:
+                    print(f"❌ {result['error']}")
+
+                results[name] = result
+    finally:
+        sys.stdout, sys.stderr = stdout.stream, stderr.stream
+
+    # Keep the summary in the usual method order
+    return {name: results[name] for name in methods}
+
+
+class _ThreadOutput:
+    """Stream wrapper that sends a thread's writes to its own buffer while capturing"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> None:
+        """Start buffering the calling thread's writes"""
+        self._local.buffer = io.StringIO()
+
+    def release(self) -> str:
+        """Stop buffering the calling thread's writes and return them"""
+        buffer, self._local.buffer = self._local.buffer, None
+        return buffer.getvalue()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
 
-    return results
+
+def _run_timed(method_func, outputs: Tuple[_ThreadOutput, ...] = ()) -> Tuple[Dict, List[str]]:
+    """
+    Run a vision method and record its elapsed time on the result
+
+    Returns:
+        Tuple of (result, text the method wrote to each of outputs)
+    """
+    for output in outputs:
+        output.capture()
+    start = time.perf_counter()
+    try:
+        result = method_func()
+    except Exception as e:
+        result = {'error': str(e)}
+    finally:
+        captured = [output.release() for output in outputs]
+    result['elapsed_time'] = round(time.perf_counter() - start, 2)
+    return result, captured
 
 
-def test_with_claude(image_path: str) -> Dict:
+def test_with_claude(image_path: str, image_bytes: Optional[bytes] = None) -> Dict:
     """Test with Claude (reference implementation)"""
-    sys.path.insert(0, os.path.dirname(__file__))
     try:
-        from llm_reader import read_meter_with_claude
+        import anthropic  # noqa: F401 - llm_reader exits at import without it
+    except ImportError:
+        return {'error': 'Run: pip install anthropic'}
+
+    if not os.getenv('ANTHROPIC_API_KEY'):
+        return {'error': 'No API key provided. Set ANTHROPIC_API_KEY environment variable.'}
+
+    try:
+        from llm_reader import read_meter_with_claude, MODEL as CLAUDE_MODEL
+
+        # read_meter_with_claude picks its prompt from METER_READER_PROMPT
+        if os.getenv('METER_READER_PROMPT', 'detailed') == 'simple':
+            prompt = METER_READING_PROMPT_SIMPLE
+        else:
+            prompt = METER_READING_PROMPT
+        cache_key, cached = _cache_lookup(image_path, prompt, CLAUDE_MODEL, image_bytes,
+                                          vision_payload=False)
+        if cached is not None:
+            return cached
+
         print(f"🚀 Calling Claude Sonnet...")
-        return read_meter_with_claude(image_path)
+        result = read_meter_with_claude(image_path, image_bytes=image_bytes)
+        _cache_store(cache_key, result)
+        return result
     except Exception as e:
         return {'error': f'Claude error: {str(e)}'}
 
 
+# Per-model cost estimate from token usage, matched by model-name prefix
+COST_FN = {
+    # ~$0.15 per 1M input tokens, $0.60 per 1M output
+    'gpt-4o-mini': lambda u: f"${(u.get('input_tokens', 0) * 0.15 + u.get('output_tokens', 0) * 0.6) / 1000000:.4f}",
+    # ~$3 per 1M input tokens, $15 per 1M output for Sonnet
+    'claude': lambda u: f"${(u.get('input_tokens', 0) * 3 + u.get('output_tokens', 0) * 15) / 1000000:.4f}",
+    'gemini': lambda u: "$0*",  # Free tier
+}
+
+SUMMARY_ROW = "{:<12}  {:<15}  {:<12}  {:<10}  {:<10}  {:<8}"
+
+
+def _estimate_cost(usage: Dict) -> str:
+    """Format the estimated API cost for a result's usage block"""
+    if usage.get('local'):
+        return "$0"
+    model = usage.get('model', '')
+    if usage.get('input_tokens', 0) is None:
+        return "N/A"  # Usage unknown
+    for prefix, cost_fn in COST_FN.items():
+        if model.startswith(prefix):
+            return cost_fn(usage)
+    return "N/A"
+
+
 def print_comparison_summary(results: Dict[str, Dict]):
     """Print a nice comparison table"""
 
@@ -384,62 +802,29 @@ def print_comparison_summary(results: Dict[str, Dict]):
     print("COMPARISON SUMMARY")
     print("="*80)
 
-    headers = ["Method", "Reading", "Confidence", "Time", "Cost", "Local"]
-    widths = [12, 15, 12, 10, 10, 8]
-
-    # Print header
-    header_row = "  ".join(h.ljust(w) for h, w in zip(headers, widths))
-    print(header_row)
+    print(SUMMARY_ROW.format("Method", "Reading", "Confidence", "Time", "Cost", "Local"))
     print("-"*80)
 
-    # Print results
     for method, result in results.items():
-        if 'error' in result:
-            row = [
-                method.upper().ljust(widths[0]),
-                "ERROR".ljust(widths[1]),
-                "N/A".ljust(widths[2]),
-                f"{result.get('elapsed_time', 0):.2f}s".ljust(widths[3]),
-                "N/A".ljust(widths[4]),
-                "N/A".ljust(widths[5])
-            ]
-        else:
-            reading = f"{result.get('total_reading', 'N/A')} m³"
-            # Handle confidence as either string or number
-            conf_val = result.get('confidence', 0)
-            if isinstance(conf_val, str):
-                confidence = conf_val
-            else:
-                confidence = f"{conf_val:.2f}"
-            elapsed = f"{result.get('elapsed_time', 0):.2f}s"
-
-            # Estimate cost
-            usage = result.get('api_usage', {})
-            if usage.get('local'):
-                cost = "$0"
-            elif 'gpt-4o-mini' in usage.get('model', ''):
-                # ~$0.00015 per 1K input tokens, $0.0006 per 1K output
-                cost = f"${(usage.get('input_tokens', 0) * 0.15 + usage.get('output_tokens', 0) * 0.6) / 1000000:.4f}"
-            elif 'gemini' in usage.get('model', ''):
-                cost = "$0*"  # Free tier
-            elif 'claude' in usage.get('model', ''):
-                # ~$3 per 1M input tokens, $15 per 1M output for Sonnet
-                cost = f"${(usage.get('input_tokens', 0) * 3 + usage.get('output_tokens', 0) * 15) / 1000000:.4f}"
-            else:
-                cost = "N/A"
-
-            local = "✓" if usage.get('local') else "✗"
-
-            row = [
-                method.upper().ljust(widths[0]),
-                reading.ljust(widths[1]),
-                confidence.ljust(widths[2]),
-                elapsed.ljust(widths[3]),
-                cost.ljust(widths[4]),
-                local.ljust(widths[5])
-            ]
+        elapsed = f"{result.get('elapsed_time', 0):.2f}s"
 
-        print("  ".join(row))
+        if 'error' in result:
+            print(SUMMARY_ROW.format(method.upper(), "ERROR", "N/A", elapsed, "N/A", "N/A"))
+            continue
+
+        # Handle confidence as either string or number
+        conf_val = result.get('confidence', 0)
+        confidence = conf_val if isinstance(conf_val, str) else f"{conf_val:.2f}"
+
+        usage = result.get('api_usage', {})
+        print(SUMMARY_ROW.format(
+            method.upper(),
+            f"{result.get('total_reading', 'N/A')} m³",
+            confidence,
+            elapsed,
+            _estimate_cost(usage),
+            "✓" if usage.get('local') else "✗"
+        ))
 
     print("="*80)
     print("* Gemini has free tier (rate limited)")
@@ -468,9 +853,26 @@ def main():
         '--output',
         help='Save result to JSON file'
     )
+    parser.add_argument(
+        '--full-res',
+        action='store_true',
+        help='Send original full-resolution images (default: downscale to '
+             f'{VISION_MAX_SIDE}px)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the APIs instead of reusing cached results'
+    )
 
     args = parser.parse_args()
 
+    global FULL_RES_IMAGES, CACHE_ENABLED
+    if args.full_res:
+        FULL_RES_IMAGES = True
+    CACHE_ENABLED = (not args.no_cache and
+                     os.getenv('VISION_CACHE', '1').lower() not in ('0', 'false', 'no'))
+
     if not Path(args.image_path).exists():
         print(f"❌ Error: Image not found: {args.image_path}")
         sys.exit(1)
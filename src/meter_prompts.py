@@ -0,0 +1,377 @@
+"""
+Meter Reading Prompts
+
+Prompts and response parsing shared by the vision readers. Nothing here
+needs an API SDK, so the Gemini, OpenAI and Ollama readers can use it
+without anthropic installed.
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Dict
+
+
+# Prompt for water meter reading
+METER_READING_PROMPT = """You are analyzing a Badger Meter "Absolute Digital" residential water meter.
+
+**DISPLAY FORMAT - CRITICAL:**
+This meter has:
+- 5 WHITE digits (whole m³): "02271" = 2271 m³
+- 1 BLACK digit (tenths): "2" = 0.2 m³
+- Red dial (hundredths): position "5" = 0.05 m³
+- **Total: 2271.25 cubic meters**
+
+**THE THREE COMPONENTS:**
+
+1. **WHITE ROLLER DIGITS (Left portion of display):**
+   - Shows EXACTLY 5 WHITE digits representing whole cubic meters
+   - Example: "0 2 2 7 1" = 2271 m³ (integer part)
+   - Example: "0 0 1 5 8" = 158 m³ (integer part)
+   - Ignore leading zeros
+   - COUNT CAREFULLY: Read from LEFT to RIGHT
+
+2. **BLACK DIGIT (6th digit, right side of display - SEPARATE from white digits):**
+   - This is a SINGLE WHITE DIGIT ON BLACK BACKGROOUND (0-9) on the RIGHT side of the display
+   - It is PHYSICALLY SEPARATED from the 5 white digits with a small gap
+   - The white digit with black background shows TENTHS of a cubic meter (first decimal place)
+   - **CRITICAL - DO NOT CONFUSE:**
+     * The rightmost WHITE digit and the BLACK digit are DIFFERENT
+     * If you see "02271  5" → white digits = "02271", black digit = "5"
+     * If you see "02271  1" → white digits = "02271", black digit = "1"
+     * The black digit has its own housing/frame, slightly separated
+   - Examples:
+     * Black digit "5" = 0.5 m³
+     * Black digit "2" = 0.2 m³
+     * Black digit "7" = 0.7 m³
+     * Black digit "0" = 0.0 m³
+
+3. **RED SWEEP HAND DIAL (Bottom circular gauge):**
+
+   **IMPORTANT: USE A STEP-BY-STEP VISUAL ANALYSIS APPROACH**
+
+   The dial has a RED SWEEP HAND (the ONLY red element on the meter) that rotates like a clock hand.
+   The dial face has numbers 0-10 printed around the edge, with 0 at the TOP (12 o'clock position).
+
+   **STEP 1: LOCATE THE DIAL AND ORIENT YOURSELF - CRITICAL ORIENTATION CHECKS**
+
+   **HOW TO IDENTIFY "UP" ON THE METER:**
+   - Look for the "BADGER METER" brand text - this should be at the TOP of the meter face
+   - The digital display (white and black digits) should be horizontal and readable from left to right
+   - **KEY ORIENTATION MARKER:** The rolling digits are ABOVE the center-mounted red dial needle - this helps determine which way is up
+   - The M³ label on the dial is at the TOP (12 o'clock position) of the dial circle
+   - If you need to tilt your head to read "BADGER METER" or the digits, the image may be rotated
+   - The circular dial is BELOW the digital display (at the bottom of the meter face)
+
+   **NOW ORIENT THE DIAL:**
+   - Find the circular dial at the bottom of the meter face
+   - Identify where "0" is marked on the dial edge (this should be at TOP/12 o'clock position of the dial)
+   - Identify where "5" is marked on the dial edge (this should be at BOTTOM/6 o'clock position of the dial)
+   - The numbers go clockwise: 0→1→2→3→4→5→6→7→8→9→10 (then back to 0)
+   - This establishes the reference frame for angle measurement
+
+   **VERIFICATION:**
+   - If "BADGER METER" is readable and at the top, and "0" on the dial is at the top of the dial circle, your orientation is CORRECT
+   - If something seems wrong, describe what you see and where the text/numbers are positioned
+
+   **STEP 2: FIND THE RED HAND**
+   - Look for the RED sweep hand - it's the ONLY red element on the entire meter
+   - It's a triangular or arrow-shaped pointer that rotates around the center
+   - One end is the POINTED TIP (this is what indicates the reading)
+   - The other end is the BASE/TAIL (attached near the center)
+   - CRITICAL: Make sure you're reading the POINTED TIP, not the base!
+
+   **STEP 3: IDENTIFY WHICH NUMBER THE TIP IS POINTING TO**
+   - Look at where the POINTED TIP of the red hand is aimed
+   - Which number (0-10) on the dial edge is it closest to?
+   - If it's between two numbers, estimate the fraction (e.g., "between 1 and 2, closer to 1")
+   - Remember: The dial goes 0→1→2→3→4→5→6→7→8→9→10 clockwise around the circle
+   - The "0" and "10" positions are the same (both at top/12 o'clock)
+
+   **STEP 4: DETERMINE THE CLOCK POSITION**
+   - Based on the number the tip is pointing to, determine the clock position:
+     * Pointing at "0" → 12 o'clock (TOP)
+     * Pointing at "2.5" → 3 o'clock (RIGHT)
+     * Pointing at "5" → 6 o'clock (BOTTOM)
+     * Pointing at "7.5" → 9 o'clock (LEFT)
+
+   **STEP 5: CONVERT TO DEGREES**
+   - 12 o'clock (TOP, pointing at "0") = 0°
+   - 1 o'clock = 30°
+   - 2 o'clock = 60°
+   - 3 o'clock (RIGHT, pointing at "2.5") = 90°
+   - 4 o'clock = 120°
+   - 5 o'clock = 150°
+   - 6 o'clock (BOTTOM, pointing at "5") = 180°
+   - 7 o'clock = 210°
+   - 8 o'clock = 240°
+   - 9 o'clock (LEFT, pointing at "7.5") = 270°
+   - 10 o'clock = 300°
+   - 11 o'clock = 330°
+
+   **STEP 6: VERIFY YOUR ANSWER**
+   Before finalizing, double-check:
+   - If you said 0-45°, is the hand pointing UP-RIGHT? (between 12 and 3 o'clock)
+   - If you said 45-135°, is the hand pointing RIGHT? (between 3 and 6 o'clock)
+   - If you said 135-225°, is the hand pointing DOWN? (between 6 and 9 o'clock)
+   - If you said 225-315°, is the hand pointing LEFT? (between 9 and 12 o'clock)
+   - If you said 315-360°, is the hand pointing UP-LEFT? (between 9 and 12 o'clock)
+
+   **CRITICAL: COMMON MISTAKES TO AVOID**
+   - DON'T confuse the pointed tip with the base/tail of the hand
+   - DON'T assume the dial is rotated - "0" is always at the top
+   - DON'T report the angle of the BASE - we need the angle of the POINTED TIP
+   - DO verify that your degrees match the visual direction (UP/DOWN/LEFT/RIGHT)
+
+   **CALCULATION:**
+   - Dial scale number = angle_degrees × 10 / 360
+   - Example: 90° → 90×10/360 = 2.5 on dial scale
+   - Example: 180° → 180×10/360 = 5.0 on dial scale
+
+   Set dial_reading to (dial_angle_degrees / 3600) and dial_angle_degrees to your angle estimate
+
+**STEP-BY-STEP READING:**
+
+Example: White digits "02271", black digit "2", red dial at "5"
+
+Step 1: Read white roller digits (integer part)
+- White digits: "0 2 2 7 1"
+- Remove leading zeros: "2271"
+- Integer part: 2271 m³
+
+Step 2: Read black digit (tenths)
+- Black digit: "2"
+- Tenths: 0.2 m³
+
+Step 3: Read red dial (hundredths)
+- Dial position: "5"
+- Calculation: 5 ÷ 100 = 0.05 m³
+
+Step 4: Calculate total
+- 2271 + 0.2 + 0.05 = **2271.25 m³**
+
+**MORE EXAMPLES:**
+
+Example 1: White "00158" + Black "7" + Dial "3"
+- Integer: 158 m³
+- Tenths: 0.7 m³
+- Hundredths: 0.03 m³
+- Total: **158.73 m³**
+
+Example 2: White "02315" + Black "4" + Dial "0"
+- Integer: 2315 m³
+- Tenths: 0.4 m³
+- Hundredths: 0.00 m³
+- Total: **2315.40 m³**
+
+Example 3: White "00995" + Black "9" + Dial "8"
+- Integer: 995 m³
+- Tenths: 0.9 m³
+- Hundredths: 0.08 m³
+- Total: **995.98 m³**
+
+**CRITICAL: COUNT AND DESCRIBE ALL COMPONENTS - REQUIRED FORMAT**
+In your notes, you MUST describe what you see in this EXACT format:
+
+"Meter orientation check: [BADGER METER text position (top/sideways/etc.), digital display readable (yes/no)].
+White digits (5 digits on left): [digit] [digit] [digit] [digit] [digit] = [value] m³.
+Black digit (single digit on right, separated): [digit] = [value] m³.
+Red dial analysis:
+  - Dial orientation: '0' mark at [position on dial], '5' mark at [position on dial]
+  - Dial number scale position: pointing at [number 0-10 on dial face]
+  - Clock position: [X] o'clock
+  - Degrees: [angle]° ([direction: UP/DOWN/LEFT/RIGHT or UP-RIGHT/DOWN-RIGHT/etc.])
+  - Verification: Hand is pointing [direction] ✓
+Dial reading: [angle]/3600 = [value] m³.
+Total: [sum]"
+
+Example: "Meter orientation check: BADGER METER text at top, digital display readable left-to-right. White digits (5 digits on left): 0 2 2 7 1 = 2271 m³. Black digit (single digit on right, separated): 5 = 0.5 m³. Red dial analysis: Dial orientation: '0' mark at top of dial, '5' mark at bottom of dial. Dial number scale position: pointing at 2.5, Clock position: 3 o'clock, Degrees: 90° (pointing RIGHT), Verification: Hand is pointing RIGHT ✓. Dial reading: 90/3600 = 0.025 m³. Total: 2271.525 m³"
+
+**CRITICAL OUTPUT FORMAT - STRICT JSON SCHEMA REQUIRED:**
+
+You MUST return ONLY valid JSON. No markdown, no code blocks, no extra text before or after.
+Your entire response must be parseable as JSON.
+
+**REQUIRED JSON STRUCTURE (all fields mandatory):**
+```json
+{
+    "digital_reading": <type: integer, value: 5 white digits with leading zeros removed, example: 2271>,
+    "black_digit": <type: integer, value: single black digit 0-9, example: 5>,
+    "dial_reading": <type: float, value: dial_angle_degrees / 3600, range: 0.000-0.099, example: 0.025>,
+    "dial_angle_degrees": <type: integer, value: angle 0-359 where 0°=UP/12-o'clock, 90°=RIGHT/3-o'clock, 180°=DOWN/6-o'clock, 270°=LEFT/9-o'clock, example: 90>,
+    "total_reading": <type: float, value: digital_reading + (black_digit/10) + dial_reading, example: 2271.525>,
+    "confidence": <type: string, value: one of exactly "high", "medium", or "low", example: "high">,
+    "notes": <type: string, value: must follow the format specified above with all required sections, example: "White digits...">
+}
+```
+
+**VALIDATION REQUIREMENTS:**
+- `digital_reading`: Must be integer, typically 1000-5000 for this meter
+- `black_digit`: Must be integer 0-9 (inclusive)
+- `dial_reading`: Must be float 0.000 to 0.099 (hundredths precision only)
+- `dial_angle_degrees`: Must be integer 0-359 (inclusive)
+- `total_reading`: Must equal digital_reading + (black_digit/10) + dial_reading
+- `confidence`: Must be exactly one of: "high", "medium", "low" (lowercase)
+- `notes`: Must be string containing the required format sections
+
+**EXAMPLE VALID OUTPUT:**
+```json
+{
+    "digital_reading": 2271,
+    "black_digit": 5,
+    "dial_reading": 0.025,
+    "dial_angle_degrees": 90,
+    "total_reading": 2271.525,
+    "confidence": "high",
+    "notes": "Meter orientation check: BADGER METER text at top, digital display readable left-to-right. White digits (5 digits on left): 0 2 2 7 1 = 2271 m³. Black digit (single digit on right, separated): 5 = 0.5 m³. Red dial analysis: Dial orientation: '0' mark at top of dial, '5' mark at bottom of dial. Dial number scale position: pointing at 2.5, Clock position: 3 o'clock, Degrees: 90° (pointing RIGHT), Verification: Hand is pointing RIGHT ✓. Dial reading: 90/3600 = 0.025 m³. Total: 2271.525 m³"
+}
+```
+
+**CRITICAL:**
+- Do NOT wrap the JSON in markdown code blocks (no ```json ... ```)
+- Do NOT add any text before or after the JSON
+- Your response must START with { and END with }
+- All string values must use double quotes, not single quotes
+- All numbers must be valid JSON numbers (no NaN, no Infinity)
+
+**VALIDATION CHECKS - CRITICAL FOR CONFIDENCE:**
+- Water meters only increase, never decrease
+- THIS SPECIFIC METER: Expected range is 2000-3000 m³ (NOT 20,000+!)
+- If your total_reading is outside 1000-5000 m³ range, you likely miscounted digits - RECOUNT!
+- **BLACK DIGIT CHECK:**
+  * black_digit MUST be 0-9 (single digit)
+  * If black_digit is not in response, YOU MADE AN ERROR - there is ALWAYS a black digit
+- **DIAL READING SANITY CHECK:**
+  * dial_reading MUST be between 0.00 and 0.099 (hundredths only!)
+  * If dial_reading is >= 0.10, YOU ARE WRONG (that would be in the black digit)
+  * If you see "hand between 0 and 1" → dial position ~0.5 → reading should be ~0.005 m³
+  * Your notes MUST show: dial position ÷ 100 = dial_reading value
+- **TOTAL CALCULATION CHECK:**
+  * total_reading = digital_reading + (black_digit ÷ 10) + dial_reading
+  * Example: 2271 + (2÷10) + 0.05 = 2271 + 0.2 + 0.05 = 2271.25 m³
+- If you read exactly 5 white digits + 1 black digit + dial, and result is in expected range (2000-3000 m³), confidence should be HIGH
+- Only mark confidence as LOW if the image is blurry, digits are unclear, or you're uncertain
+"""
+
+# Alternate prompt for GPT-4o-mini style vision models (simpler, odometer-based approach)
+METER_READING_PROMPT_SIMPLE = """You are analyzing an analog Bourdon-Water style water meter.
+Your task is to read the entire meter—including the white-background odometer wheels (which display the whole and tenths of cubic meters) and the small red pointer (which indicates hundredths of a cubic meter).
+
+METER CHARACTERISTICS:
+• The odometer wheels (white background) have six digits in total.
+• The leftmost five wheels show whole cubic meters and tenths (0–99999.0 m³).
+• The rightmost white wheel (black digits) shows the tenths place (0.0–0.9 m³).
+• The small red pointer needle on the circular dial (0–9 scale) shows hundredths of a cubic meter (0.00–0.09 m³).
+• **ORIENTATION MARKERS:** The rolling digits are ABOVE the center-mounted red dial needle. The M³ label is at the top of the dial (12 o'clock position). These markers help determine correct image orientation.
+• Ignore any extra markings or branding.
+• Wheels advance clockwise; dial numbers increase clockwise.
+• Camera angle may be off-axis; compensate for perspective and glare.
+
+READING RULES:
+1. Read the six white odometer wheels left to right to get the reading in whole cubic meters plus tenths (e.g. 2271.3).
+2. Locate the red needle on the small circular dial and determine its position between 0 and 9.
+3. Convert that to hundredths by dividing by 100 (e.g. needle at "1" → 0.01 m³).
+4. If the needle is between marks, interpolate to one decimal tick (0.01 resolution).
+5. Sum wheel reading and dial reading for the final value (e.g. 2271.30 + 0.07 = 2271.37 m³).
+6. If ambiguous, choose the closest value and lower your confidence.
+
+OUTPUT FORMAT (strict JSON):
+
+{
+  "odometer_value": <number>,       // from wheels, e.g. 2271.3
+  "dial_value": <number>,           // from red pointer, e.g. 0.07
+  "total_reading": <number>,        // sum of the above, e.g. 2271.37
+  "needle_angle_degrees": <number>, // angle of red needle relative to 0 on dial
+  "confidence": <0–1>,              // 0.0 to 1.0, where 1.0 is highest confidence
+  "notes": "<short explanation>"
+}
+
+CRITICAL:
+- Return ONLY valid JSON, no markdown blocks
+- confidence must be a decimal between 0.0 and 1.0
+- All numbers must be valid JSON numbers
+- Expected range: 2000-3000 m³ for this meter
+"""
+
+
+def parse_simple_response(response_text: str) -> Dict:
+    """
+    Parse simple format response (odometer-based) and convert to standard format
+
+    Args:
+        response_text: Raw text response with simple JSON format
+
+    Returns:
+        Dictionary with reading data in standard format
+    """
+    try:
+        # Try to find JSON in the response
+        text = response_text.strip()
+
+        # Remove markdown code blocks if present
+        if '```json' in text:
+            text = text.split('```json')[1].split('```')[0].strip()
+        elif '```' in text:
+            text = text.split('```')[1].split('```')[0].strip()
+
+        # Remove // comments (Ollama and other models sometimes add these)
+        text = re.sub(r'//.*$', '', text, flags=re.MULTILINE)
+
+        # Parse JSON
+        data = json.loads(text)
+
+        # Validate required fields for simple format
+        required_fields = ['odometer_value', 'dial_value', 'total_reading', 'confidence']
+        for field in required_fields:
+            if field not in data:
+                return {
+                    'error': f'Missing required field: {field}',
+                    'raw_response': response_text
+                }
+
+        # Convert to standard format (handle string or number values)
+        odometer = float(data['odometer_value'])
+        dial_val = float(data['dial_value'])
+
+        # Extract digital_reading (whole number part) and black_digit (tenths)
+        digital_reading = int(odometer)
+        black_digit = int(round((odometer - digital_reading) * 10))
+
+        # Convert confidence from 0-1 to high/medium/low
+        conf_num = float(data['confidence'])
+        if conf_num >= 0.8:
+            confidence = 'high'
+        elif conf_num >= 0.5:
+            confidence = 'medium'
+        else:
+            confidence = 'low'
+
+        # Build standard format result
+        result = {
+            'digital_reading': digital_reading,
+            'black_digit': black_digit,
+            'dial_reading': dial_val,
+            'total_reading': data['total_reading'],
+            'confidence': confidence,
+            'confidence_numeric': conf_num,
+            'notes': data.get('notes', 'Simple format response'),
+            'timestamp': datetime.now().isoformat(),
+            'format': 'simple'  # Tag to indicate which format was used
+        }
+
+        # Add dial angle if present
+        if 'needle_angle_degrees' in data:
+            result['dial_angle_degrees'] = int(data['needle_angle_degrees'])
+
+        return result
+
+    except json.JSONDecodeError as e:
+        return {
+            'error': f'Failed to parse JSON: {str(e)}',
+            'raw_response': response_text
+        }
+    except Exception as e:
+        return {
+            'error': f'Unexpected error: {str(e)}',
+            'raw_response': response_text
+        }
@@ -3,14 +3,34 @@ Meter implementations package
 
 This package contains all meter type implementations:
 - BaseMeter: Abstract base class for all meters
+- Reading: Compact record used for a meter's reading history
+- MeterType: Integer enum of the supported meter types
 - WaterMeter: Water meter implementation
 - ElectricMeter: Electric meter implementation
 - GasMeter: Gas meter implementation
+
+The meter type classes are imported on first access, so a process only
+loads the modules for the meter types it actually uses.
 """
 
-from .base_meter import BaseMeter
-from .water_meter import WaterMeter
-from .electric_meter import ElectricMeter
-from .gas_meter import GasMeter
+from importlib import import_module
+
+from .base_meter import BaseMeter, MeterType, Reading
+
+# Lazily imported names -> submodule defining them (PEP 562)
+_LAZY_IMPORTS = {
+    'WaterMeter': '.water_meter',
+    'ElectricMeter': '.electric_meter',
+    'GasMeter': '.gas_meter',
+}
+
+__all__ = ['BaseMeter', 'MeterType', 'Reading', 'WaterMeter', 'ElectricMeter', 'GasMeter']
+
 
-__all__ = ['BaseMeter', 'WaterMeter', 'ElectricMeter', 'GasMeter']
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -6,19 +6,157 @@ for all meter implementations (water, electric, gas, etc.).
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import io
 import os
+import math
+import mmap
+import time
+import atexit
+import errno
 import sys
 import json
 import shutil
+import threading
+import weakref
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from ciso8601 import parse_datetime as _parse_ts
+    CISO8601_AVAILABLE = True
+except ImportError:
+    _parse_ts = datetime.fromisoformat
+    CISO8601_AVAILABLE = False
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from llm_reader import read_meter_with_claude
-from influxdb_writer import write_reading_to_influxdb
+from influxdb_writer import write_readings_batch_to_influxdb
+from .schemas import check_reading_fields
+
+
+def timestamp_to_epoch(timestamp: str) -> float:
+    """Convert an ISO 8601 reading timestamp to epoch seconds"""
+    return _parse_ts(timestamp).timestamp()
+
+
+def is_finite_number(value: Any) -> bool:
+    """Check that a reading field holds a finite int or float"""
+    return isinstance(value, (int, float)) and math.isfinite(value)
+
+
+def field_array(readings: List[Dict[str, Any]], field: str) -> "np.ndarray":
+    """Collect a numeric reading field as a float array (NaN if missing/invalid)"""
+    return np.fromiter(
+        (r.get(field) if is_finite_number(r.get(field)) else math.nan for r in readings),
+        dtype=np.float64, count=len(readings)
+    )
+
+
+# Meters with InfluxDB buffers to flush at exit (weak, so the registry
+# doesn't keep meters alive)
+_open_meters: "weakref.WeakSet[BaseMeter]" = weakref.WeakSet()
+
+
+def _flush_meter(ref: "weakref.ref[BaseMeter]") -> None:
+    """Flush a meter's InfluxDB buffer if the meter is still alive (flush timer)"""
+    meter = ref()
+    if meter is not None:
+        meter._flush_influx()
+
+
+def _flush_open_meters() -> None:
+    """Flush every live meter's InfluxDB buffer"""
+    for meter in list(_open_meters):
+        meter._flush_influx()
+
+
+atexit.register(_flush_open_meters)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+class MeterType(IntEnum):
+    """Meter type as stored on in-memory Reading records"""
+
+    ELECTRIC = 1
+    GAS = 2
+    WATER = 3
+
+    @property
+    def label(self) -> str:
+        """Name used in reading dictionaries, log files and MQTT topics"""
+        return _METER_TYPE_LABELS[self]
+
+
+_METER_TYPE_LABELS = {t: sys.intern(t.name.lower()) for t in MeterType}
+_METER_TYPES_BY_LABEL = {label: t for t, label in _METER_TYPE_LABELS.items()}
+
+
+class Reading:
+    """
+    Compact in-memory record of a successful meter reading
+
+    Readings travel as dicts (JSON log, InfluxDB, MQTT); the meter history
+    stores them as slotted objects, which are smaller and give attribute
+    access instead of dict lookups in the rate and validation paths.
+    meter_type is held as a MeterType and the unit string is interned, so
+    records share those values instead of each carrying its own copy.
+    """
+
+    __slots__ = ("total_reading", "digital_reading", "dial_reading", "confidence",
+                 "timestamp", "ts_epoch", "meter_type", "notes", "multiplier", "unit")
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_dict(cls, reading: Dict[str, Any]) -> "Reading":
+        """Build a record from a parsed reading dictionary"""
+        record = cls(**reading)
+        record.ts_epoch = reading.get("_ts_epoch")
+        if record.ts_epoch is None:
+            record.ts_epoch = timestamp_to_epoch(record.timestamp)
+        record.meter_type = _METER_TYPES_BY_LABEL.get(record.meter_type, record.meter_type)
+        if isinstance(record.unit, str):
+            record.unit = sys.intern(record.unit)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to a reading dictionary (omitting unset fields)"""
+        reading = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                if isinstance(value, MeterType):
+                    value = value.label
+                reading["_ts_epoch" if name == "ts_epoch" else name] = value
+        return reading
+
+    def __repr__(self) -> str:
+        return f"Reading({self.to_dict()!r})"
 
 
 class BaseMeter(ABC):
@@ -29,6 +167,29 @@ class BaseMeter(ABC):
     and implement the abstract methods for meter-specific behavior.
     """
 
+    # Fixed attribute layout (no per-instance __dict__); subclasses list only
+    # the attributes they add
+    __slots__ = (
+        "config", "meter_type", "display_name", "camera_ip", "camera_user",
+        "camera_pass", "reading_interval", "stream_url", "snapshot_mode", "snapshot_url",
+        "log_dir", "log_file", "snapshot_dir", "temp_image", "_log_fd",
+        "_influx_buffer", "_influx_flush_size", "_influx_flush_interval",
+        "_influx_last_flush", "_influx_lock", "_influx_timer", "_mqtt",
+        "max_history", "readings", "_totals",
+        "_times", "_series_len", "_summary_cache", "_summary_json",
+        "_num_readings", "_start_anchor", "consecutive_errors", "unit",
+        "max_change_per_reading", "_claude_prompt", "__weakref__",
+    )
+
+    # Response schema (msgspec Struct or None) and the fields checked by hand
+    # when msgspec isn't installed
+    _READING_SCHEMA = None
+    _REQUIRED_FIELDS: Tuple[str, ...] = ("total_reading", "confidence")
+
+    # Whether uploads are cropped to the detected meter face by default (the
+    # detector looks for a red-needle dial, so only water meters opt in)
+    _CROP_TO_METER = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize base meter with configuration
@@ -46,9 +207,16 @@ class BaseMeter(ABC):
                     - snapshot_url: Static snapshot URL (fallback)
                     - log_dir: Directory for logs (default: logs/)
                     - mqtt_enabled: Enable MQTT publishing (default: False)
+                    - max_history: Readings kept in the in-memory ring buffer (default: 4096)
+                    - influx_batch_size: Readings buffered per InfluxDB write (default: 16)
+                    - influx_flush_interval: Max seconds a reading waits in the
+                      buffer before being written (default: 300)
+                    - crop_to_meter: Crop uploads to the detected meter face
+                      (default: True for water meters, False otherwise)
         """
         self.config = config
         self.meter_type = config.get("meter_type")
+        self.display_name = config.get("name", f"{self.meter_type}_meter")
         self.camera_ip = config.get("camera_ip")
         self.camera_user = config.get("camera_user")
         self.camera_pass = config.get("camera_pass")
@@ -76,8 +244,38 @@ class BaseMeter(ABC):
         # Temp image path
         self.temp_image = f"/tmp/{self.meter_type}_snapshot.jpg"
 
-        # Statistics
-        self.readings = []
+        # Reading log handle (opened on first write, see close())
+        self._log_fd = None
+
+        # InfluxDB write buffer (flushed by size, by a timer once the oldest
+        # reading has waited influx_flush_interval, by close() or at exit)
+        self._influx_buffer = []
+        self._influx_flush_size = config.get("influx_batch_size", 16)
+        self._influx_flush_interval = config.get("influx_flush_interval", 300)
+        self._influx_last_flush = time.monotonic()
+        self._influx_lock = threading.Lock()
+        self._influx_timer = None
+        _open_meters.add(self)
+
+        # MQTT client (created on first publish, see _get_mqtt_client())
+        self._mqtt = None
+
+        # Statistics (bounded history of Reading records)
+        self.max_history = config.get("max_history", 4096)
+        self.readings = deque(maxlen=self.max_history)
+
+        # Totals and epoch times of the history as parallel float arrays
+        # (numpy only), grown by doubling; the first _series_len slots are valid
+        self._totals = np.empty(0, dtype=np.float64) if NUMPY_AVAILABLE else None
+        self._times = np.empty(0, dtype=np.float64) if NUMPY_AVAILABLE else None
+        self._series_len = 0
+        self._summary_cache = None  # Cleared whenever a reading is recorded
+        self._summary_json = None
+
+        # First reading ever recorded (kept after the ring buffer rolls) and
+        # total count; the latest reading is always self.readings[-1]
+        self._num_readings = 0
+        self._start_anchor = None
         self.consecutive_errors = 0
 
     @abstractmethod
@@ -90,19 +288,95 @@ class BaseMeter(ABC):
         """
         pass
 
-    @abstractmethod
-    def parse_reading(self, claude_response: Dict[str, Any]) -> Dict[str, Any]:
+    def parse_reading(self, claude_response: Dict[str, Any],
+                      now: Optional[str] = None) -> Dict[str, Any]:
         """
         Parse the Claude API response into standardized reading format
 
+        Shared steps (schema check, meter type, timestamp) run here; meter
+        types customize them through _READING_SCHEMA, _REQUIRED_FIELDS and
+        _post_parse().
+
         Args:
             claude_response: Raw response from Claude API
+            now: ISO timestamp to use when the response has none (e.g. the
+                 orchestrator's tick time); defaults to the current time
 
         Returns:
             Standardized reading dictionary with meter-specific fields
+
+        Raises:
+            ValueError: If a required field is missing or invalid
+        """
+        # Check required fields and coerce types against the schema
+        check_reading_fields(claude_response, self._READING_SCHEMA, self._REQUIRED_FIELDS)
+
+        # Add meter type if not present
+        if "meter_type" not in claude_response:
+            claude_response["meter_type"] = self.meter_type
+
+        # Ensure timestamp is present
+        if "timestamp" not in claude_response:
+            claude_response["timestamp"] = now or datetime.now().isoformat()
+
+        # Parse the timestamp once here so rate calculations don't re-parse it
+        claude_response["_ts_epoch"] = timestamp_to_epoch(claude_response["timestamp"])
+
+        self._post_parse(claude_response)
+        return claude_response
+
+    def _post_parse(self, reading: Dict[str, Any]) -> None:
+        """
+        Apply meter-specific adjustments to a parsed reading (in place)
+
+        Args:
+            reading: Reading dictionary after the shared parse steps
         """
         pass
 
+    def validate_batch(self, readings: List[Dict[str, Any]]) -> "np.ndarray":
+        """
+        Validate a burst of readings (e.g. a backfill) in one vectorized pass
+
+        Applies the same range checks as validate_reading: finite, non-negative
+        totals that never decrease and change by at most max_change_per_reading.
+        Each reading is compared with the one before it in the batch (the first
+        with the latest recorded reading), whether or not that one passed.
+
+        Args:
+            readings: Parsed reading dictionaries in chronological order
+
+        Returns:
+            Boolean array, True where the reading is valid
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("validate_batch requires numpy")
+
+        totals = field_array(readings, "total_reading")
+        last_total = self.readings[-1].total_reading if self.readings else totals[:1]
+        diffs = np.diff(totals, prepend=last_total)
+
+        ok = np.isfinite(totals) & (totals >= 0)
+        ok &= (diffs >= 0) & (diffs <= self.max_change_per_reading)
+        return ok & self._validate_batch_fields(readings, totals)
+
+    def _validate_batch_fields(self, readings: List[Dict[str, Any]],
+                               totals: "np.ndarray") -> "np.ndarray":
+        """
+        Meter-specific vectorized checks for validate_batch
+
+        Args:
+            readings: Reading dictionaries being validated
+            totals: Their total_reading values (NaN where missing)
+
+        Returns:
+            Boolean array of additional checks (all True by default)
+        """
+        return np.ones(len(totals), dtype=bool)
+
     @abstractmethod
     def validate_reading(self, reading: Dict[str, Any]) -> bool:
         """
@@ -149,39 +423,52 @@ class BaseMeter(ABC):
         capture = CameraCapture(self.config)
         return capture.test_connection()
 
-    def read_meter(self) -> Dict[str, Any]:
+    def read_meter(self, now: Optional[str] = None) -> Dict[str, Any]:
         """
         Capture image and read meter using Claude API
 
+        Args:
+            now: Pre-captured ISO timestamp for this reading (None = current time)
+
         Returns:
             Dictionary containing reading data or error
         """
+        if now is None:
+            now = datetime.now().isoformat()
+
         # Capture snapshot
         if not self.capture_snapshot():
             return {
                 "error": "Failed to capture snapshot",
                 "meter_type": self.meter_type,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now
             }
 
         # Get meter-specific prompt
         prompt = self.get_claude_prompt()
 
         # Read meter with Claude
-        result = read_meter_with_claude(self.temp_image, custom_prompt=prompt)
+        result = read_meter_with_claude(
+            self.temp_image, custom_prompt=prompt,
+            crop_to_meter=self.config.get("crop_to_meter", self._CROP_TO_METER)
+        )
 
         # Add meter type to result
         if "error" not in result:
             result["meter_type"] = self.meter_type
 
+            # The parsers stamp their own wall-clock time; use the tick's, so
+            # meters read together share one timestamp
+            result["timestamp"] = now
+
             # Parse and validate reading
-            parsed = self.parse_reading(result)
+            parsed = self.parse_reading(result, now=now)
 
             if not self.validate_reading(parsed):
                 return {
                     "error": "Invalid reading - failed validation",
                     "meter_type": self.meter_type,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now,
                     "raw_reading": parsed
                 }
 
@@ -197,9 +484,12 @@ class BaseMeter(ABC):
         Args:
             reading: Reading dictionary to log
         """
-        # Log to JSONL file
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(reading) + "\n")
+        # Append to JSONL file through a persistent buffered handle
+        if self._log_fd is None:
+            self._log_fd = open(self.log_file, "ab", buffering=io.DEFAULT_BUFFER_SIZE)
+
+        self._log_fd.write(_dumps(reading) + b"\n")
+        self._log_fd.flush()
 
         # Save snapshot image with timestamp
         if os.path.exists(self.temp_image):
@@ -213,21 +503,128 @@ class BaseMeter(ABC):
                 image_filename = self.snapshot_dir / f"{timestamp}_error.jpg"
 
             try:
-                shutil.copy(self.temp_image, image_filename)
+                self._archive_snapshot(image_filename)
             except Exception as e:
                 print(f"  Warning: Could not save snapshot: {e}")
 
-    def store_reading(self, reading: Dict[str, Any]) -> bool:
+    def _archive_snapshot(self, image_filename: Path) -> None:
+        """
+        Archive the current temp snapshot under image_filename
+
+        Hardlinks the temp image into the snapshot directory when both are on
+        the same filesystem, falling back to a full copy otherwise.
+
+        Args:
+            image_filename: Destination path in the snapshot directory
+        """
+        try:
+            os.link(self.temp_image, image_filename)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EEXIST, errno.EPERM, errno.EMLINK):
+                raise
+            # copyfile skips the metadata copy and uses sendfile on Linux
+            shutil.copyfile(self.temp_image, image_filename)
+        else:
+            # Captures overwrite temp_image in place, which would clobber the
+            # linked archive - drop the temp name so the next one is a new file
+            os.unlink(self.temp_image)
+
+    def iter_archived_snapshots(self, pattern: str = "*.jpg") -> Iterator[Tuple[Path, mmap.mmap]]:
+        """
+        Iterate over archived snapshots as read-only memory maps
+
+        Pages are loaded on demand by the OS instead of being copied into
+        a Python bytes object, which keeps bulk re-analysis of the archive
+        cheap. Each map is closed when the generator advances, so consumers
+        must finish with (or copy) a buffer before requesting the next one.
+
+        Args:
+            pattern: Glob pattern for snapshot files (default: *.jpg)
+
+        Yields:
+            Tuples of (snapshot_path, memory-mapped file contents)
+        """
+        for path in sorted(self.snapshot_dir.glob(pattern)):
+            with open(path, "rb") as f:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    continue  # Empty file - nothing to map
+
+            with mapped:
+                yield path, mapped
+
+    def store_reading(self, reading: Dict[str, Any]) -> Optional[bool]:
         """
-        Store reading in InfluxDB
+        Queue reading for InfluxDB, writing the buffer once it is full or stale
+
+        A reading left in the buffer is written within influx_flush_interval
+        seconds by a background timer.
 
         Args:
             reading: Reading dictionary to store
 
         Returns:
-            True if successful, False otherwise
+            True if the buffer was written, False if the write failed, None if
+            the reading is still buffered
+        """
+        with self._influx_lock:
+            self._influx_buffer.append(reading)
+            due = (len(self._influx_buffer) >= self._influx_flush_size or
+                   time.monotonic() - self._influx_last_flush >= self._influx_flush_interval)
+            if not due and self._influx_timer is None:
+                timer = threading.Timer(self._influx_flush_interval, _flush_meter,
+                                        args=(weakref.ref(self),))
+                timer.daemon = True
+                timer.start()
+                self._influx_timer = timer
+
+        if due:
+            return self._flush_influx()
+        return None
+
+    def _flush_influx(self) -> bool:
+        """
+        Write all buffered readings to InfluxDB in one batch
+
+        Returns:
+            True if successful (or nothing to write), False otherwise
+        """
+        with self._influx_lock:
+            self._influx_last_flush = time.monotonic()
+            if self._influx_timer is not None:
+                self._influx_timer.cancel()
+                self._influx_timer = None
+
+            if not self._influx_buffer:
+                return True
+            batch, self._influx_buffer = self._influx_buffer, []
+
+        return write_readings_batch_to_influxdb(batch)
+
+    def _get_mqtt_client(self):
+        """
+        Get the meter's persistent MQTT client, connecting on first use
+
+        The client runs its network loop in a background thread and
+        reconnects on its own, so publishes never wait on a handshake.
+
+        Returns:
+            Connected (or connecting) paho MQTT client
         """
-        return write_reading_to_influxdb(reading)
+        if self._mqtt is None:
+            import paho.mqtt.client as mqtt
+
+            mqtt_broker = os.getenv("MQTT_BROKER", "localhost")
+            mqtt_port = int(os.getenv("MQTT_PORT", "1883"))
+
+            client = mqtt.Client()
+            client.reconnect_delay_set(min_delay=1, max_delay=60)
+            client.connect_async(mqtt_broker, mqtt_port, 60)
+            client.loop_start()
+            self._mqtt = client
+
+        return self._mqtt
 
     def publish_mqtt(self, reading: Dict[str, Any]) -> bool:
         """
@@ -243,24 +640,19 @@ class BaseMeter(ABC):
             return False
 
         try:
-            import paho.mqtt.client as mqtt
+            client = self._get_mqtt_client()
 
-            mqtt_broker = os.getenv("MQTT_BROKER", "localhost")
-            mqtt_port = int(os.getenv("MQTT_PORT", "1883"))
             mqtt_topic = os.getenv("MQTT_TOPIC", f"home/{self.meter_type}/meter")
 
-            client = mqtt.Client()
-            client.connect(mqtt_broker, mqtt_port, 60)
-
-            payload = json.dumps({
+            payload = _dumps({
                 "meter_type": self.meter_type,
                 "value": reading.get("total_reading"),
                 "timestamp": reading.get("timestamp"),
                 "confidence": reading.get("confidence", "unknown")
             })
 
+            # QoS 1 messages are queued while (re)connecting
             client.publish(mqtt_topic, payload, qos=1, retain=True)
-            client.disconnect()
 
             return True
         except ImportError:
@@ -269,15 +661,19 @@ class BaseMeter(ABC):
             print(f"  MQTT publish error: {e}")
             return False
 
-    def process_reading(self) -> Dict[str, Any]:
+    def process_reading(self, now: Optional[str] = None) -> Dict[str, Any]:
         """
         Complete reading workflow: capture, read, log, store
 
+        Args:
+            now: Pre-captured ISO timestamp shared by all meters read in the
+                 same tick (None = current time)
+
         Returns:
             Reading dictionary
         """
         # Read meter
-        reading = self.read_meter()
+        reading = self.read_meter(now=now)
 
         # Log reading
         self.log_reading(reading)
@@ -285,7 +681,7 @@ class BaseMeter(ABC):
         # Store in InfluxDB
         if "error" not in reading:
             self.store_reading(reading)
-            self.readings.append(reading)
+            self._record_reading(reading)
             self.consecutive_errors = 0
         else:
             self.consecutive_errors += 1
@@ -296,38 +692,180 @@ class BaseMeter(ABC):
 
         return reading
 
+    def _record_reading(self, reading: Dict[str, Any]) -> None:
+        """
+        Add a successful reading to the in-memory history
+
+        Args:
+            reading: Validated reading dictionary (stored as a Reading)
+        """
+        record = Reading.from_dict(reading)
+        self.readings.append(record)
+        self._summary_cache = None
+        self._summary_json = None
+
+        if self._start_anchor is None:
+            self._start_anchor = record
+        self._num_readings += 1
+
+        if NUMPY_AVAILABLE:
+            self._append_series(record.total_reading, record.ts_epoch)
+
+    def _append_series(self, total: float, ts_epoch: float) -> None:
+        """Append to the numpy series, compacting once it holds 2x max_history"""
+        n = self._series_len
+        if n == len(self._totals):
+            if n >= 2 * self.max_history:
+                # Drop the oldest half so the arrays stay bounded like the deque
+                keep = self.max_history
+                self._totals[:keep] = self._totals[n - keep:n]
+                self._times[:keep] = self._times[n - keep:n]
+                n = keep
+            else:
+                capacity = max(16, 2 * n)
+                self._totals = np.resize(self._totals, capacity)
+                self._times = np.resize(self._times, capacity)
+
+        self._totals[n] = total
+        self._times[n] = ts_epoch
+        self._series_len = n + 1
+
+    def rolling_rate(self, window_seconds: float) -> float:
+        """
+        Average usage rate over the most recent time window
+
+        Args:
+            window_seconds: Length of the window ending at the latest reading
+
+        Returns:
+            Usage per hour across the window (meter units), or 0 if fewer
+            than two readings fall inside it
+        """
+        if NUMPY_AVAILABLE:
+            # Same span as the readings deque
+            lo = max(0, self._series_len - self.max_history)
+            times = self._times[lo:self._series_len]
+            totals = self._totals[lo:self._series_len]
+            if len(times) < 2:
+                return 0.0
+            # Binary search for the first reading inside the window
+            start = int(np.searchsorted(times, times[-1] - window_seconds, side="left"))
+            if start >= len(times) - 1:
+                return 0.0
+            hours = (times[-1] - times[start]) / 3600
+            return float((totals[-1] - totals[start]) / hours) if hours > 0 else 0.0
+
+        if len(self.readings) < 2:
+            return 0.0
+        last = self.readings[-1]
+        first = last
+        for record in reversed(self.readings):
+            if last.ts_epoch - record.ts_epoch > window_seconds:
+                break
+            first = record
+        hours = (last.ts_epoch - first.ts_epoch) / 3600
+        return (last.total_reading - first.total_reading) / hours if hours > 0 else 0.0
+
+    @property
+    def duration_hours(self) -> float:
+        """Hours between the first and latest recorded readings"""
+        if self._num_readings == 0:
+            return 0.0
+        return (self.readings[-1].ts_epoch - self._start_anchor.ts_epoch) / 3600
+
+    @property
+    def total_usage(self) -> float:
+        """Usage between the first and latest recorded readings"""
+        if self._num_readings == 0:
+            return 0.0
+        return self.readings[-1].total_reading - self._start_anchor.total_reading
+
     def calculate_statistics(self) -> Optional[Dict[str, Any]]:
         """
-        Calculate usage statistics from readings
+        Calculate usage statistics over all recorded readings
 
         Returns:
             Dictionary with statistics or None if insufficient data
         """
-        if len(self.readings) < 2:
+        if self._num_readings < 2:
             return None
 
-        start_time = datetime.fromisoformat(self.readings[0]['timestamp'])
-        end_time = datetime.fromisoformat(self.readings[-1]['timestamp'])
-        duration_hours = (end_time - start_time).total_seconds() / 3600
-
-        start_reading = self.readings[0]['total_reading']
-        end_reading = self.readings[-1]['total_reading']
-        total_usage = end_reading - start_reading
+        start = self._start_anchor
+        end = self.readings[-1]
+        duration_hours = (end.ts_epoch - start.ts_epoch) / 3600
+        total_usage = end.total_reading - start.total_reading
 
         avg_rate = total_usage / duration_hours if duration_hours > 0 else 0
 
         return {
             "meter_type": self.meter_type,
-            "num_readings": len(self.readings),
+            "num_readings": self._num_readings,
             "duration_hours": duration_hours,
             "total_usage": total_usage,
             "average_rate": avg_rate,
-            "start_reading": start_reading,
-            "end_reading": end_reading,
-            "start_time": start_time.isoformat(),
-            "end_time": end_time.isoformat()
+            "start_reading": start.total_reading,
+            "end_reading": end.total_reading,
+            "start_time": start.timestamp,
+            "end_time": end.timestamp
         }
 
+    def get_usage_summary(self) -> Dict[str, Any]:
+        """
+        Get usage summary, recomputed only after new readings arrive
+
+        Returns:
+            Dictionary with usage statistics in meter-specific units
+        """
+        if self._summary_cache is None:
+            self._summary_cache = self._build_usage_summary()
+        return dict(self._summary_cache)
+
+    def get_usage_summary_json(self) -> bytes:
+        """
+        Get the usage summary serialized as JSON (orjson when available)
+
+        Returns:
+            UTF-8 JSON bytes, re-encoded only after new readings arrive
+        """
+        if self._summary_json is None:
+            self._summary_json = _dumps(self.get_usage_summary())
+        return self._summary_json
+
+    def _build_usage_summary(self) -> Dict[str, Any]:
+        """
+        Build the usage summary (meter types override this with their own units)
+
+        Returns:
+            Dictionary with usage statistics
+        """
+        stats = self.calculate_statistics()
+        if stats is None:
+            return {
+                "error": "Insufficient data for usage summary"
+            }
+        return stats
+
+    def close(self) -> None:
+        """Release resources held by the meter (pending InfluxDB writes, MQTT, log handle)"""
+        self._flush_influx()
+        _open_meters.discard(self)
+
+        if self._mqtt is not None:
+            self._mqtt.loop_stop()
+            self._mqtt.disconnect()
+            self._mqtt = None
+
+        if self._log_fd is not None:
+            self._log_fd.close()
+            self._log_fd = None
+
+    def __del__(self):
+        """Close open handles when the meter is garbage collected"""
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def __str__(self) -> str:
         """String representation of meter"""
         return f"{self.meter_type.capitalize()} Meter @ {self.camera_ip}"
@@ -5,37 +5,16 @@ Implements electric meter specific logic for reading and validating
 electric meter measurements in kilowatt-hours (kWh).
 """
 
-from typing import Dict, Any
-from datetime import datetime
-from .base_meter import BaseMeter
+import logging
+from typing import Dict, Any, Optional
+from .base_meter import BaseMeter, is_finite_number
+from .schemas import ElectricReadingSchema
 
+logger = logging.getLogger(__name__)
 
-class ElectricMeter(BaseMeter):
-    """Electric meter implementation for monitoring electricity usage"""
-
-    def __init__(self, config: Dict[str, Any]):
-        """
-        Initialize electric meter
-
-        Args:
-            config: Configuration dictionary (see BaseMeter for required keys)
-        """
-        # Ensure meter_type is set
-        config["meter_type"] = "electric"
-        super().__init__(config)
-
-        # Electric-specific configuration
-        self.unit = "kWh"  # kilowatt-hours
-        self.max_change_per_reading = config.get("max_change_per_reading", 50.0)  # kWh
-
-    def get_claude_prompt(self) -> str:
-        """
-        Get Claude API prompt for electric meter reading
 
-        Returns:
-            Prompt string customized for electric meters
-        """
-        return """You are analyzing an electric meter image. Please identify and read the meter display.
+# Claude prompt for electric meters (shared by all instances)
+_ELECTRIC_PROMPT = """You are analyzing an electric meter image. Please identify and read the meter display.
 
 Electric meters can have different formats:
 1. **Digital Display**: A digital LCD/LED showing kilowatt-hours (kWh)
@@ -68,43 +47,62 @@ Return your response in JSON format:
 If you cannot read the meter clearly, explain why in the notes field and set confidence to "low".
 """
 
-    def parse_reading(self, claude_response: Dict[str, Any]) -> Dict[str, Any]:
+
+class ElectricMeter(BaseMeter):
+    """Electric meter implementation for monitoring electricity usage"""
+
+    __slots__ = ()
+
+    _READING_SCHEMA = ElectricReadingSchema
+
+    def __init__(self, config: Dict[str, Any]):
         """
-        Parse Claude API response for electric meter
+        Initialize electric meter
 
         Args:
-            claude_response: Raw response from Claude API
+            config: Configuration dictionary (see BaseMeter for required keys)
+        """
+        # Ensure meter_type is set
+        config["meter_type"] = "electric"
+        super().__init__(config)
+
+        # Electric-specific configuration
+        self.unit = "kWh"  # kilowatt-hours
+        self.max_change_per_reading = config.get("max_change_per_reading", 50.0)  # kWh
+
+        self._claude_prompt = self._build_claude_prompt()
+
+    def get_claude_prompt(self) -> str:
+        """
+        Get Claude API prompt for electric meter reading
 
         Returns:
-            Standardized reading dictionary
+            Prompt string customized for electric meters
         """
-        # Add meter type if not present
-        if "meter_type" not in claude_response:
-            claude_response["meter_type"] = "electric"
+        return self._claude_prompt
+
+    def _build_claude_prompt(self) -> str:
+        """Build the Claude prompt (called once from __init__)"""
+        return _ELECTRIC_PROMPT
 
-        # Ensure timestamp is present
-        if "timestamp" not in claude_response:
-            claude_response["timestamp"] = datetime.now().isoformat()
+    def _post_parse(self, reading: Dict[str, Any]) -> None:
+        """
+        Apply the dial multiplier and fill optional fields
 
+        Args:
+            reading: Reading dictionary after the shared parse steps
+        """
         # Apply multiplier if present
-        multiplier = claude_response.get("multiplier", 1)
+        multiplier = reading.get("multiplier", 1)
         if multiplier != 1:
-            claude_response["total_reading"] = claude_response["total_reading"] * multiplier
-            claude_response["notes"] = claude_response.get("notes", "") + f" (multiplier: ×{multiplier})"
-
-        # Ensure all required fields are present
-        required_fields = ["total_reading", "confidence"]
-        for field in required_fields:
-            if field not in claude_response:
-                raise ValueError(f"Missing required field: {field}")
+            reading["total_reading"] = reading["total_reading"] * multiplier
+            reading["notes"] = (reading.get("notes") or "") + f" (multiplier: ×{multiplier})"
 
         # Set defaults for optional fields
-        if "digital_reading" not in claude_response:
-            claude_response["digital_reading"] = claude_response["total_reading"]
-        if "dial_reading" not in claude_response:
-            claude_response["dial_reading"] = 0.0
-
-        return claude_response
+        if "digital_reading" not in reading:
+            reading["digital_reading"] = reading["total_reading"]
+        if "dial_reading" not in reading:
+            reading["dial_reading"] = 0.0
 
     def validate_reading(self, reading: Dict[str, Any]) -> bool:
         """
@@ -116,40 +114,31 @@ If you cannot read the meter clearly, explain why in the notes field and set con
         Returns:
             True if reading is valid, False otherwise
         """
-        try:
-            total = reading.get("total_reading")
-
-            # Check that total is present
-            if total is None:
-                print(f"  ⚠️  Validation failed: Missing total reading")
-                return False
+        total = reading.get("total_reading")
 
-            # Check that reading is non-negative
-            if total < 0:
-                print(f"  ⚠️  Validation failed: Negative reading ({total})")
-                return False
+        # Check that total is present and numeric
+        if not is_finite_number(total):
+            logger.warning("Validation failed: Missing or non-numeric total reading (%r)", total)
+            return False
 
-            # Check if change from last reading is reasonable (if we have history)
-            if len(self.readings) > 0:
-                last_reading = self.readings[-1]["total_reading"]
-                change = total - last_reading
+        # Check that reading is non-negative
+        if total < 0:
+            logger.warning("Validation failed: Negative reading (%s)", total)
+            return False
 
-                # Electric meters should only increase (or stay same)
+        # Check change from last reading (if we have history) - electric meters
+        # only count up, so a plausible change is one range check
+        if self.readings:
+            change = total - self.readings[-1].total_reading
+            if not 0 <= change <= self.max_change_per_reading:
                 if change < 0:
-                    print(f"  ⚠️  Validation failed: Reading decreased ({change:.2f} kWh)")
-                    return False
-
-                # Check for unreasonable increase
-                if change > self.max_change_per_reading:
-                    print(f"  ⚠️  Validation failed: Excessive change ({change:.2f} kWh)")
-                    return False
-
-            # All validation checks passed
-            return True
+                    logger.warning("Validation failed: Reading decreased (%.2f kWh)", change)
+                else:
+                    logger.warning("Validation failed: Excessive change (%.2f kWh)", change)
+                return False
 
-        except Exception as e:
-            print(f"  ⚠️  Validation error: {e}")
-            return False
+        # All validation checks passed
+        return True
 
     def calculate_power_consumption(self) -> float:
         """
@@ -166,32 +155,33 @@ If you cannot read the meter clearly, explain why in the notes field and set con
         previous = self.readings[-2]
 
         # Calculate time difference in hours
-        current_time = datetime.fromisoformat(current["timestamp"])
-        previous_time = datetime.fromisoformat(previous["timestamp"])
-        time_diff_hours = (current_time - previous_time).total_seconds() / 3600
+        time_diff_hours = (current.ts_epoch - previous.ts_epoch) / 3600
 
         if time_diff_hours <= 0:
             return 0.0
 
         # Calculate energy difference in kWh
-        energy_diff = current["total_reading"] - previous["total_reading"]
+        energy_diff = current.total_reading - previous.total_reading
 
         # Calculate power in kW
         power_kw = energy_diff / time_diff_hours
 
         return power_kw
 
-    def estimate_monthly_cost(self, rate_per_kwh: float = 0.12) -> float:
+    def estimate_monthly_cost(self, rate_per_kwh: float = 0.12,
+                              stats: Optional[Dict[str, Any]] = None) -> float:
         """
         Estimate monthly electricity cost based on current usage
 
         Args:
             rate_per_kwh: Cost per kWh (default: $0.12)
+            stats: Precomputed calculate_statistics() result (computed if omitted)
 
         Returns:
             Estimated monthly cost in dollars
         """
-        stats = self.calculate_statistics()
+        if stats is None:
+            stats = self.calculate_statistics()
 
         if stats is None:
             return 0.0
@@ -207,22 +197,25 @@ If you cannot read the meter clearly, explain why in the notes field and set con
 
         return monthly_cost
 
-    def check_high_usage(self, threshold_kw: float = 5.0) -> bool:
+    def check_high_usage(self, threshold_kw: float = 5.0,
+                         power: Optional[float] = None) -> bool:
         """
         Check if current power consumption is unusually high
 
         Args:
             threshold_kw: Power threshold in kW to consider as high usage
+            power: Already-computed power consumption in kW (recalculated if None)
 
         Returns:
             True if high usage detected, False otherwise
         """
-        power = self.calculate_power_consumption()
+        if power is None:
+            power = self.calculate_power_consumption()
         return power > threshold_kw
 
-    def get_usage_summary(self) -> Dict[str, Any]:
+    def _build_usage_summary(self) -> Dict[str, Any]:
         """
-        Get electricity usage summary
+        Build electricity usage summary
 
         Returns:
             Dictionary with usage statistics in electric-specific units
@@ -236,7 +229,7 @@ If you cannot read the meter clearly, explain why in the notes field and set con
 
         # Calculate power and costs
         current_power = self.calculate_power_consumption()
-        estimated_cost = self.estimate_monthly_cost()
+        estimated_cost = self.estimate_monthly_cost(stats=stats)
 
         return {
             "meter_type": "electric",
@@ -252,7 +245,7 @@ If you cannot read the meter clearly, explain why in the notes field and set con
             "end_reading": stats["end_reading"],
             "start_time": stats["start_time"],
             "end_time": stats["end_time"],
-            "high_usage_alert": self.check_high_usage()
+            "high_usage_alert": self.check_high_usage(power=current_power)
         }
 
     def __str__(self) -> str:
@@ -5,14 +5,29 @@ Implements gas meter specific logic for reading and validating
 gas meter measurements in CCF (hundred cubic feet) or cubic meters.
 """
 
-from typing import Dict, Any
-from datetime import datetime
-from .base_meter import BaseMeter
+import logging
+from typing import Dict, Any, Optional
+from .base_meter import BaseMeter, is_finite_number
+from .schemas import GasReadingSchema
+
+logger = logging.getLogger(__name__)
+
+# 1 CCF = 100 ft³ = 2.83168 m³
+CCF_TO_M3 = 2.83168
+M3_TO_CCF = 1.0 / CCF_TO_M3
+
+# Therms per unit (varies slightly by gas composition)
+THERMS_PER_CCF = 1.037
+THERMS_PER_M3 = 0.366
 
 
 class GasMeter(BaseMeter):
     """Gas meter implementation for monitoring natural gas usage"""
 
+    __slots__ = ("use_cubic_meters", "_therms_factor", "_foreign_units", "_conversion")
+
+    _READING_SCHEMA = GasReadingSchema
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize gas meter
@@ -30,6 +45,18 @@ class GasMeter(BaseMeter):
         self.use_cubic_meters = config.get("use_cubic_meters", False)
         self.unit = "m³" if self.use_cubic_meters else "CCF"
         self.max_change_per_reading = config.get("max_change_per_reading", 100.0)
+        self._therms_factor = THERMS_PER_M3 if self.use_cubic_meters else THERMS_PER_CCF
+
+        # Units Claude may report that need converting to self.unit, plus the
+        # factor and note for that conversion (fixed per meter)
+        if self.use_cubic_meters:
+            self._foreign_units = frozenset(["ccf"])
+            self._conversion = (CCF_TO_M3, " (converted from CCF to m³)")
+        else:
+            self._foreign_units = frozenset(["m³", "m3", "cubic meters"])
+            self._conversion = (M3_TO_CCF, " (converted from m³ to CCF)")
+
+        self._claude_prompt = self._build_claude_prompt()
 
     def get_claude_prompt(self) -> str:
         """
@@ -38,6 +65,10 @@ class GasMeter(BaseMeter):
         Returns:
             Prompt string customized for gas meters
         """
+        return self._claude_prompt
+
+    def _build_claude_prompt(self) -> str:
+        """Build the Claude prompt for the configured unit (called once from __init__)"""
         unit_text = "cubic meters (m³)" if self.use_cubic_meters else "CCF (hundred cubic feet)"
 
         return f"""You are analyzing a natural gas meter image. Please identify and read the meter display.
@@ -77,48 +108,25 @@ Return your response in JSON format:
 If you cannot read the meter clearly, explain why in the notes field and set confidence to "low".
 """
 
-    def parse_reading(self, claude_response: Dict[str, Any]) -> Dict[str, Any]:
+    def _post_parse(self, reading: Dict[str, Any]) -> None:
         """
-        Parse Claude API response for gas meter
+        Convert the reading to the configured unit and fill optional fields
 
         Args:
-            claude_response: Raw response from Claude API
-
-        Returns:
-            Standardized reading dictionary
+            reading: Reading dictionary after the shared parse steps
         """
-        # Add meter type if not present
-        if "meter_type" not in claude_response:
-            claude_response["meter_type"] = "gas"
-
-        # Ensure timestamp is present
-        if "timestamp" not in claude_response:
-            claude_response["timestamp"] = datetime.now().isoformat()
-
-        # Handle unit conversion if needed
-        reported_unit = claude_response.get("unit", self.unit)
-
-        # Convert if needed (1 CCF = 100 ft³ = 2.83168 m³)
-        if self.use_cubic_meters and reported_unit.upper() == "CCF":
-            claude_response["total_reading"] = claude_response["total_reading"] * 2.83168
-            claude_response["notes"] = claude_response.get("notes", "") + " (converted from CCF to m³)"
-        elif not self.use_cubic_meters and reported_unit.lower() in ["m³", "m3", "cubic meters"]:
-            claude_response["total_reading"] = claude_response["total_reading"] / 2.83168
-            claude_response["notes"] = claude_response.get("notes", "") + " (converted from m³ to CCF)"
-
-        # Ensure all required fields are present
-        required_fields = ["total_reading", "confidence"]
-        for field in required_fields:
-            if field not in claude_response:
-                raise ValueError(f"Missing required field: {field}")
+        # Convert if Claude reported the other unit (usually it matches)
+        reported_unit = reading.get("unit") or self.unit
+        if reported_unit != self.unit and reported_unit.lower() in self._foreign_units:
+            factor, note = self._conversion
+            reading["total_reading"] = reading["total_reading"] * factor
+            reading["notes"] = (reading.get("notes") or "") + note
 
         # Set defaults for optional fields
-        if "digital_reading" not in claude_response:
-            claude_response["digital_reading"] = claude_response["total_reading"]
-        if "dial_reading" not in claude_response:
-            claude_response["dial_reading"] = 0.0
-
-        return claude_response
+        if "digital_reading" not in reading:
+            reading["digital_reading"] = reading["total_reading"]
+        if "dial_reading" not in reading:
+            reading["dial_reading"] = 0.0
 
     def validate_reading(self, reading: Dict[str, Any]) -> bool:
         """
@@ -130,40 +138,31 @@ If you cannot read the meter clearly, explain why in the notes field and set con
         Returns:
             True if reading is valid, False otherwise
         """
-        try:
-            total = reading.get("total_reading")
-
-            # Check that total is present
-            if total is None:
-                print(f"  ⚠️  Validation failed: Missing total reading")
-                return False
+        total = reading.get("total_reading")
 
-            # Check that reading is non-negative
-            if total < 0:
-                print(f"  ⚠️  Validation failed: Negative reading ({total})")
-                return False
+        # Check that total is present and numeric
+        if not is_finite_number(total):
+            logger.warning("Validation failed: Missing or non-numeric total reading (%r)", total)
+            return False
 
-            # Check if change from last reading is reasonable (if we have history)
-            if len(self.readings) > 0:
-                last_reading = self.readings[-1]["total_reading"]
-                change = total - last_reading
+        # Check that reading is non-negative
+        if total < 0:
+            logger.warning("Validation failed: Negative reading (%s)", total)
+            return False
 
-                # Gas meters should only increase (or stay same)
+        # Check change from last reading (if we have history): must be
+        # non-decreasing and within max_change_per_reading
+        if self.readings:
+            change = total - self.readings[-1].total_reading
+            if not 0 <= change <= self.max_change_per_reading:
                 if change < 0:
-                    print(f"  ⚠️  Validation failed: Reading decreased ({change:.2f} {self.unit})")
-                    return False
-
-                # Check for unreasonable increase
-                if change > self.max_change_per_reading:
-                    print(f"  ⚠️  Validation failed: Excessive change ({change:.2f} {self.unit})")
-                    return False
-
-            # All validation checks passed
-            return True
+                    logger.warning("Validation failed: Reading decreased (%.2f %s)", change, self.unit)
+                else:
+                    logger.warning("Validation failed: Excessive change (%.2f %s)", change, self.unit)
+                return False
 
-        except Exception as e:
-            print(f"  ⚠️  Validation error: {e}")
-            return False
+        # All validation checks passed
+        return True
 
     def calculate_flow_rate(self) -> float:
         """
@@ -180,32 +179,33 @@ If you cannot read the meter clearly, explain why in the notes field and set con
         previous = self.readings[-2]
 
         # Calculate time difference in hours
-        current_time = datetime.fromisoformat(current["timestamp"])
-        previous_time = datetime.fromisoformat(previous["timestamp"])
-        time_diff_hours = (current_time - previous_time).total_seconds() / 3600
+        time_diff_hours = (current.ts_epoch - previous.ts_epoch) / 3600
 
         if time_diff_hours <= 0:
             return 0.0
 
         # Calculate volume difference
-        volume_diff = current["total_reading"] - previous["total_reading"]
+        volume_diff = current.total_reading - previous.total_reading
 
         # Calculate flow rate
         flow_rate = volume_diff / time_diff_hours
 
         return flow_rate
 
-    def estimate_monthly_cost(self, rate_per_unit: float = 1.00) -> float:
+    def estimate_monthly_cost(self, rate_per_unit: float = 1.00,
+                              stats: Optional[Dict[str, Any]] = None) -> float:
         """
         Estimate monthly gas cost based on current usage
 
         Args:
             rate_per_unit: Cost per CCF or m³ (default: $1.00)
+            stats: Precomputed calculate_statistics() result (computed if omitted)
 
         Returns:
             Estimated monthly cost in dollars
         """
-        stats = self.calculate_statistics()
+        if stats is None:
+            stats = self.calculate_statistics()
 
         if stats is None:
             return 0.0
@@ -221,47 +221,48 @@ If you cannot read the meter clearly, explain why in the notes field and set con
 
         return monthly_cost
 
-    def check_high_usage(self, threshold: float = 2.0) -> bool:
+    def check_high_usage(self, threshold: float = 2.0,
+                         flow_rate: Optional[float] = None) -> bool:
         """
         Check if current gas consumption is unusually high
 
         Args:
             threshold: Flow rate threshold to consider as high usage
                       (CCF/hour or m³/hour depending on configuration)
+            flow_rate: Already-computed flow rate (recalculated if None)
 
         Returns:
             True if high usage detected, False otherwise
         """
-        flow_rate = self.calculate_flow_rate()
+        if flow_rate is None:
+            flow_rate = self.calculate_flow_rate()
         return flow_rate > threshold
 
-    def convert_to_therms(self, value: float = None) -> float:
+    def convert_to_therms(self, value: float = None,
+                          stats: Optional[Dict[str, Any]] = None) -> float:
         """
         Convert gas reading to therms (common for billing)
 
         Args:
             value: Value to convert (uses total usage if not provided)
+            stats: Precomputed calculate_statistics() result used when value
+                   is omitted (computed if omitted)
 
         Returns:
             Value in therms
         """
         if value is None:
-            stats = self.calculate_statistics()
+            if stats is None:
+                stats = self.calculate_statistics()
             if stats is None:
                 return 0.0
             value = stats["total_usage"]
 
-        # Conversion factors:
-        # 1 CCF ≈ 1.037 therms (varies by gas composition)
-        # 1 m³ ≈ 0.366 therms
-        if self.use_cubic_meters:
-            return value * 0.366
-        else:
-            return value * 1.037
+        return value * self._therms_factor
 
-    def get_usage_summary(self) -> Dict[str, Any]:
+    def _build_usage_summary(self) -> Dict[str, Any]:
         """
-        Get gas usage summary
+        Build gas usage summary
 
         Returns:
             Dictionary with usage statistics in gas-specific units
@@ -275,8 +276,8 @@ If you cannot read the meter clearly, explain why in the notes field and set con
 
         # Calculate flow rate and costs
         current_flow = self.calculate_flow_rate()
-        estimated_cost = self.estimate_monthly_cost()
-        therms = self.convert_to_therms()
+        estimated_cost = self.estimate_monthly_cost(stats=stats)
+        therms = self.convert_to_therms(stats=stats)
 
         return {
             "meter_type": "gas",
@@ -293,7 +294,7 @@ If you cannot read the meter clearly, explain why in the notes field and set con
             "end_reading": stats["end_reading"],
             "start_time": stats["start_time"],
             "end_time": stats["end_time"],
-            "high_usage_alert": self.check_high_usage()
+            "high_usage_alert": self.check_high_usage(flow_rate=current_flow)
         }
 
     def __str__(self) -> str:
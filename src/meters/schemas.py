@@ -0,0 +1,85 @@
+"""
+Reading Schemas
+
+Field schemas for the JSON each meter type asks Claude to return. With
+msgspec installed, a response is checked and coerced against its schema in
+a single C-level pass; without it, only the required fields are checked.
+"""
+
+from typing import Dict, Any, Optional, Tuple, Union
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+if MSGSPEC_AVAILABLE:
+    # Optional fields default to None so absent keys stay absent in the reading
+
+    class ElectricReadingSchema(msgspec.Struct):
+        """Electric meter response fields"""
+        total_reading: float
+        confidence: Union[str, float]
+        digital_reading: Optional[Union[int, float]] = None
+        dial_reading: float = 0.0
+        multiplier: Union[int, float] = 1
+        notes: Optional[str] = None
+        timestamp: Optional[str] = None
+
+    class GasReadingSchema(msgspec.Struct):
+        """Gas meter response fields"""
+        total_reading: float
+        confidence: Union[str, float]
+        digital_reading: Optional[Union[int, float]] = None
+        dial_reading: float = 0.0
+        unit: Optional[str] = None
+        notes: Optional[str] = None
+        timestamp: Optional[str] = None
+
+    class WaterReadingSchema(msgspec.Struct):
+        """Water meter response fields"""
+        digital_reading: Union[int, float]
+        dial_reading: float
+        total_reading: float
+        confidence: Union[str, float]
+        notes: Optional[str] = None
+        timestamp: Optional[str] = None
+
+else:
+    ElectricReadingSchema = GasReadingSchema = WaterReadingSchema = None
+
+
+def check_reading_fields(response: Dict[str, Any], schema,
+                         required_fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Check a Claude response against its reading schema
+
+    Args:
+        response: Parsed JSON response (updated in place with coerced values
+                  and schema defaults; unknown keys are kept)
+        schema: msgspec Struct type for the meter, or None
+        required_fields: Fields checked by hand when msgspec is unavailable
+
+    Returns:
+        The updated response dictionary
+
+    Raises:
+        ValueError: If a required field is missing or has the wrong type
+    """
+    if schema is None:
+        for field in required_fields:
+            if field not in response:
+                raise ValueError(f"Missing required field: {field}")
+        return response
+
+    try:
+        validated = msgspec.convert(response, type=schema, strict=False)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Invalid reading: {e}") from e
+
+    for field, value in msgspec.structs.asdict(validated).items():
+        if value is not None:
+            response[field] = value
+    return response
@@ -5,37 +5,24 @@ Implements water meter specific logic for reading and validating
 water meter measurements in cubic meters (m³).
 """
 
-from typing import Dict, Any
-from datetime import datetime
-from .base_meter import BaseMeter
+import logging
+from typing import Dict, Any, List
+from .base_meter import BaseMeter, field_array, is_finite_number
+from .schemas import WaterReadingSchema
 
+try:
+    import numpy as np
+except ImportError:
+    pass  # validate_batch raises before the water checks run
 
-class WaterMeter(BaseMeter):
-    """Water meter implementation for monitoring water usage"""
-
-    def __init__(self, config: Dict[str, Any]):
-        """
-        Initialize water meter
-
-        Args:
-            config: Configuration dictionary (see BaseMeter for required keys)
-        """
-        # Ensure meter_type is set
-        config["meter_type"] = "water"
-        super().__init__(config)
+logger = logging.getLogger(__name__)
 
-        # Water-specific configuration
-        self.unit = "m³"  # cubic meters
-        self.max_change_per_reading = config.get("max_change_per_reading", 10.0)  # m³
+M3_TO_LITERS = 1000.0
+M3_TO_US_GALLONS = 264.172  # US gallons
 
-    def get_claude_prompt(self) -> str:
-        """
-        Get Claude API prompt for water meter reading
 
-        Returns:
-            Prompt string customized for water meters
-        """
-        return """You are analyzing a water meter image. Please identify and read both components:
+# Claude prompt for water meters (shared by all instances)
+_WATER_PROMPT = """You are analyzing a water meter image. Please identify and read both components:
 
 1. **Digital Display**: The main numerical display showing cubic meters (usually 4-5 digits)
 2. **Dial/Analog Component**: The circular dial with a needle (shows fractional cubic meters, usually 0.000-0.999)
@@ -59,32 +46,47 @@ Return your response in JSON format:
 If you cannot read the meter clearly, explain why in the notes field and set confidence to "low".
 """
 
-    def parse_reading(self, claude_response: Dict[str, Any]) -> Dict[str, Any]:
+
+class WaterMeter(BaseMeter):
+    """Water meter implementation for monitoring water usage"""
+
+    __slots__ = ()
+
+    # Water responses are already in the standard format, so there is no
+    # _post_parse step - only the extra required fields
+    _READING_SCHEMA = WaterReadingSchema
+    _REQUIRED_FIELDS = ("digital_reading", "dial_reading", "total_reading", "confidence")
+    _CROP_TO_METER = True
+
+    def __init__(self, config: Dict[str, Any]):
         """
-        Parse Claude API response for water meter
+        Initialize water meter
 
         Args:
-            claude_response: Raw response from Claude API
-
-        Returns:
-            Standardized reading dictionary
+            config: Configuration dictionary (see BaseMeter for required keys)
         """
-        # Water meter reading is already in the format we expect
-        # Just add the meter type if not present
-        if "meter_type" not in claude_response:
-            claude_response["meter_type"] = "water"
+        # Ensure meter_type is set
+        config["meter_type"] = "water"
+        super().__init__(config)
+
+        # Water-specific configuration
+        self.unit = "m³"  # cubic meters
+        self.max_change_per_reading = config.get("max_change_per_reading", 10.0)  # m³
 
-        # Ensure timestamp is present
-        if "timestamp" not in claude_response:
-            claude_response["timestamp"] = datetime.now().isoformat()
+        self._claude_prompt = self._build_claude_prompt()
 
-        # Ensure all required fields are present
-        required_fields = ["digital_reading", "dial_reading", "total_reading", "confidence"]
-        for field in required_fields:
-            if field not in claude_response:
-                raise ValueError(f"Missing required field: {field}")
+    def get_claude_prompt(self) -> str:
+        """
+        Get Claude API prompt for water meter reading
+
+        Returns:
+            Prompt string customized for water meters
+        """
+        return self._claude_prompt
 
-        return claude_response
+    def _build_claude_prompt(self) -> str:
+        """Build the Claude prompt (called once from __init__)"""
+        return _WATER_PROMPT
 
     def validate_reading(self, reading: Dict[str, Any]) -> bool:
         """
@@ -96,53 +98,64 @@ If you cannot read the meter clearly, explain why in the notes field and set con
         Returns:
             True if reading is valid, False otherwise
         """
-        try:
-            total = reading.get("total_reading")
-            digital = reading.get("digital_reading")
-            dial = reading.get("dial_reading")
-
-            # Check that all values are present
-            if total is None or digital is None or dial is None:
-                print(f"  ⚠️  Validation failed: Missing values")
-                return False
+        total = reading.get("total_reading")
+        digital = reading.get("digital_reading")
+        dial = reading.get("dial_reading")
+
+        # Check that all values are present and numeric
+        if not (is_finite_number(total) and is_finite_number(digital)
+                and is_finite_number(dial)):
+            logger.warning("Validation failed: Missing or non-numeric values")
+            return False
 
-            # Check that total = digital + dial (within tolerance)
-            expected_total = digital + dial
-            if abs(total - expected_total) > 0.01:
-                print(f"  ⚠️  Validation failed: Total mismatch ({total} != {expected_total})")
-                return False
+        # Check that total = digital + dial (within tolerance)
+        expected_total = digital + dial
+        if abs(total - expected_total) > 0.01:
+            logger.warning("Validation failed: Total mismatch (%s != %s)", total, expected_total)
+            return False
 
-            # Check that dial is in valid range [0, 1)
-            if dial < 0 or dial >= 1.0:
-                print(f"  ⚠️  Validation failed: Dial out of range ({dial})")
-                return False
+        # Check that dial is in valid range [0, 1)
+        if dial < 0 or dial >= 1.0:
+            logger.warning("Validation failed: Dial out of range (%s)", dial)
+            return False
+
+        # Check that digital reading is non-negative
+        if digital < 0:
+            logger.warning("Validation failed: Negative digital reading (%s)", digital)
+            return False
 
-            # Check that digital reading is non-negative
-            if digital < 0:
-                print(f"  ⚠️  Validation failed: Negative digital reading ({digital})")
+        # Check if change from last reading is reasonable (if we have history);
+        # both bounds are tested at once and only split up to report a failure
+        if self.readings:
+            change = total - self.readings[-1].total_reading
+            if not 0 <= change <= self.max_change_per_reading:
+                if change < 0:
+                    logger.warning("Validation failed: Reading decreased (%.3f m³)", change)
+                else:
+                    logger.warning("Validation failed: Excessive change (%.3f m³)", change)
                 return False
 
-            # Check if change from last reading is reasonable (if we have history)
-            if len(self.readings) > 0:
-                last_reading = self.readings[-1]["total_reading"]
-                change = total - last_reading
+        # All validation checks passed
+        return True
 
-                # Water meters should only increase (or stay same)
-                if change < 0:
-                    print(f"  ⚠️  Validation failed: Reading decreased ({change:.3f} m³)")
-                    return False
+    def _validate_batch_fields(self, readings: List[Dict[str, Any]],
+                               totals: "np.ndarray") -> "np.ndarray":
+        """
+        Vectorized dial-range and digit/dial consistency checks
 
-                # Check for unreasonable increase
-                if change > self.max_change_per_reading:
-                    print(f"  ⚠️  Validation failed: Excessive change ({change:.3f} m³)")
-                    return False
+        Args:
+            readings: Reading dictionaries being validated
+            totals: Their total_reading values (NaN where missing)
 
-            # All validation checks passed
-            return True
+        Returns:
+            Boolean array, True where digital and dial readings are consistent
+        """
+        digital = field_array(readings, "digital_reading")
+        dial = field_array(readings, "dial_reading")
 
-        except Exception as e:
-            print(f"  ⚠️  Validation error: {e}")
-            return False
+        # NaN compares False, so missing fields fail every check below
+        return ((dial >= 0) & (dial < 1.0) & (digital >= 0)
+                & (np.abs(totals - (digital + dial)) <= 0.01))
 
     def calculate_flow_rate(self) -> float:
         """
@@ -159,18 +172,16 @@ If you cannot read the meter clearly, explain why in the notes field and set con
         previous = self.readings[-2]
 
         # Calculate time difference in minutes
-        current_time = datetime.fromisoformat(current["timestamp"])
-        previous_time = datetime.fromisoformat(previous["timestamp"])
-        time_diff_minutes = (current_time - previous_time).total_seconds() / 60
+        time_diff_minutes = (current.ts_epoch - previous.ts_epoch) / 60
 
         if time_diff_minutes <= 0:
             return 0.0
 
         # Calculate volume difference in cubic meters
-        volume_diff = current["total_reading"] - previous["total_reading"]
+        volume_diff = current.total_reading - previous.total_reading
 
-        # Convert to liters per minute (1 m³ = 1000 L)
-        flow_rate = (volume_diff * 1000) / time_diff_minutes
+        # Convert to liters per minute
+        flow_rate = (volume_diff * M3_TO_LITERS) / time_diff_minutes
 
         return flow_rate
 
@@ -193,9 +204,9 @@ If you cannot read the meter clearly, explain why in the notes field and set con
 
         return False
 
-    def get_usage_summary(self) -> Dict[str, Any]:
+    def _build_usage_summary(self) -> Dict[str, Any]:
         """
-        Get water usage summary
+        Build water usage summary
 
         Returns:
             Dictionary with usage statistics in water-specific units
@@ -207,17 +218,20 @@ If you cannot read the meter clearly, explain why in the notes field and set con
                 "error": "Insufficient data for usage summary"
             }
 
+        total_usage = stats["total_usage"]
+        average_rate = stats["average_rate"]
+
         # Convert to water-specific units
         return {
             "meter_type": "water",
             "num_readings": stats["num_readings"],
             "duration_hours": stats["duration_hours"],
-            "total_usage_m3": stats["total_usage"],
-            "total_usage_liters": stats["total_usage"] * 1000,
-            "total_usage_gallons": stats["total_usage"] * 264.172,  # US gallons
-            "average_rate_m3_per_hour": stats["average_rate"],
-            "average_rate_liters_per_hour": stats["average_rate"] * 1000,
-            "average_rate_gallons_per_hour": stats["average_rate"] * 264.172,
+            "total_usage_m3": total_usage,
+            "total_usage_liters": total_usage * M3_TO_LITERS,
+            "total_usage_gallons": total_usage * M3_TO_US_GALLONS,
+            "average_rate_m3_per_hour": average_rate,
+            "average_rate_liters_per_hour": average_rate * M3_TO_LITERS,
+            "average_rate_gallons_per_hour": average_rate * M3_TO_US_GALLONS,
             "start_reading": stats["start_reading"],
             "end_reading": stats["end_reading"],
             "start_time": stats["start_time"],
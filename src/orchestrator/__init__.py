@@ -4,6 +4,13 @@ Multi-Meter Orchestrator
 Coordinates monitoring of multiple utility meters simultaneously.
 """
 
-from .meter_orchestrator import MeterOrchestrator
-
 __all__ = ['MeterOrchestrator']
+
+
+def __getattr__(name):
+    # Imported on first access (PEP 562) so importing the package stays cheap
+    if name == 'MeterOrchestrator':
+        from .meter_orchestrator import MeterOrchestrator
+        globals()[name] = MeterOrchestrator
+        return MeterOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
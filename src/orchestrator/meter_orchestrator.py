@@ -5,12 +5,15 @@ Manages and coordinates multiple utility meters for simultaneous monitoring.
 """
 
 import time
+import asyncio
 import threading
+import concurrent.futures
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import logging
 
-from meters import WaterMeter, ElectricMeter, GasMeter, BaseMeter
+import meters
+from meters import BaseMeter
 from utils.logging_utils import setup_logger, format_reading_summary
 
 
@@ -33,14 +36,22 @@ class MeterOrchestrator:
         self.config = config
         self.logger = logger or setup_logger("orchestrator")
         self.meters: List[BaseMeter] = []
-        self.threads: Dict[str, threading.Thread] = {}
         self.running = False
-        self.stop_event = threading.Event()
 
-        # Statistics
-        self.total_readings = 0
-        self.successful_readings = 0
-        self.failed_readings = 0
+        # Continuous monitoring runs one asyncio task per meter on a single
+        # background event loop thread (see start())
+        self.tasks: Dict[str, concurrent.futures.Future] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._stop_async: Optional[asyncio.Event] = None
+
+        # Worker threads for one-off fan-out calls such as test_connections()
+        # (created on first use, shut down by stop())
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+        # Statistics: one counter cell per meter, each written only by that
+        # meter's task and summed when read (see get_statistics())
+        self._stats_cells: Dict[str, Dict[str, int]] = {}
         self.start_time = None
 
         # Initialize meters from config
@@ -58,13 +69,14 @@ class MeterOrchestrator:
             try:
                 meter = self._create_meter(meter_config)
                 self.meters.append(meter)
-                self.logger.info(f"Initialized {meter}")
+                self.logger.info("Initialized %s", meter)
             except Exception as e:
                 self.logger.error(
-                    f"Failed to initialize meter {meter_config.get('name', 'unknown')}: {e}"
+                    "Failed to initialize meter %s: %s",
+                    meter_config.get('name', 'unknown'), e
                 )
 
-        self.logger.info(f"Initialized {len(self.meters)} meter(s)")
+        self.logger.info("Initialized %d meter(s)", len(self.meters))
 
     def _create_meter(self, config: Dict[str, Any]) -> BaseMeter:
         """
@@ -81,24 +93,41 @@ class MeterOrchestrator:
         """
         meter_type = config['type'].lower()
 
-        # Map meter type to class
+        # Map meter type to class name (looked up lazily, so only the meter
+        # modules actually configured get imported)
         meter_classes = {
-            'water': WaterMeter,
-            'electric': ElectricMeter,
-            'gas': GasMeter
+            'water': 'WaterMeter',
+            'electric': 'ElectricMeter',
+            'gas': 'GasMeter'
         }
 
-        meter_class = meter_classes.get(meter_type)
+        class_name = meter_classes.get(meter_type)
 
-        if not meter_class:
+        if not class_name:
             raise ValueError(f"Invalid meter type: {meter_type}")
 
-        return meter_class(config)
+        return getattr(meters, class_name)(config)
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get the fan-out thread pool, creating it on first use"""
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(4, len(self.meters)),
+                thread_name_prefix="meter_fanout"
+            )
+        return self._pool
 
-    def test_connections(self) -> Dict[str, bool]:
+    def test_connections(self, timeout: float = 5.0) -> Dict[str, bool]:
         """
         Test connectivity to all configured cameras
 
+        All cameras are tested at once, so the whole check takes about as
+        long as the slowest camera, and never much longer than timeout.
+
+        Args:
+            timeout: Seconds to wait for the cameras; any still testing after
+                     that are reported as failed
+
         Returns:
             Dictionary mapping meter names to connection status
         """
@@ -106,78 +135,118 @@ class MeterOrchestrator:
 
         self.logger.info("Testing camera connections...")
 
-        for meter in self.meters:
-            meter_name = meter.config.get('name', f'{meter.meter_type}_meter')
-            self.logger.info(f"Testing {meter_name}...")
+        pool = self._get_pool()
+        futures = [(meter, pool.submit(meter.test_connection)) for meter in self.meters]
+        deadline = time.monotonic() + timeout
+
+        for meter, future in futures:
+            meter_name = meter.display_name
+            self.logger.info("Testing %s...", meter_name)
 
             try:
-                success = meter.test_connection()
+                success = future.result(timeout=max(0.0, deadline - time.monotonic()))
                 results[meter_name] = success
 
                 if success:
-                    self.logger.info(f"  ✓ {meter_name} connection successful")
+                    self.logger.info("  ✓ %s connection successful", meter_name)
                 else:
-                    self.logger.error(f"  ✗ {meter_name} connection failed")
+                    self.logger.error("  ✗ %s connection failed", meter_name)
+
+            except concurrent.futures.TimeoutError:
+                # The stuck call keeps its pool thread until it returns
+                future.cancel()
+                results[meter_name] = False
+                self.logger.error("  ✗ %s connection timed out after %ss", meter_name, timeout)
 
             except Exception as e:
                 results[meter_name] = False
-                self.logger.error(f"  ✗ {meter_name} connection error: {e}")
+                self.logger.error("  ✗ %s connection error: %s", meter_name, e)
 
         # Summary
         successful = sum(1 for v in results.values() if v)
         total = len(results)
         self.logger.info(
-            f"Connection test complete: {successful}/{total} successful"
+            "Connection test complete: %d/%d successful", successful, total
         )
 
         return results
 
-    def _monitor_meter(self, meter: BaseMeter) -> None:
+    async def _monitor_meter(self, meter: BaseMeter) -> None:
         """
-        Monitor a single meter (runs in separate thread)
+        Monitor a single meter (runs as a task on the orchestrator event loop)
 
         Args:
             meter: Meter instance to monitor
         """
-        meter_name = meter.config.get('name', f'{meter.meter_type}_meter')
+        meter_name = meter.display_name
         interval = meter.get_reading_interval()
+        cell = self._stats_cells.setdefault(meter_name, {'total': 0, 'ok': 0, 'fail': 0})
 
-        self.logger.info(
-            f"Starting monitoring for {meter_name} "
-            f"(interval: {interval}s)"
-        )
+        # Bound once; the loop body runs for the lifetime of the orchestrator
+        log_info = self.logger.info
+        stop_requested = self._stop_async.is_set
+        stop_wait = self._stop_async.wait
+        _now = datetime.now
+        clock = asyncio.get_running_loop().time
+
+        log_info("Starting monitoring for %s (interval: %ss)", meter_name, interval)
+
+        # Readings are due at fixed multiples of the interval from the start,
+        # so time spent taking a reading doesn't push later readings back
+        next_due = clock()
+
+        while not stop_requested():
+            # One timestamp per tick, shared by the reading and any error dict
+            tick_ts = _now().isoformat()
 
-        while not self.stop_event.is_set():
             try:
-                # Take reading
-                self.logger.info(f"[{meter_name}] Taking reading...")
-                reading = meter.process_reading()
+                # Take reading (camera and Claude calls block, so run them in
+                # a worker thread to keep the loop free for other meters)
+                log_info("[%s] Taking reading...", meter_name)
+                reading = await asyncio.to_thread(meter.process_reading, now=tick_ts)
 
                 # Update statistics
-                self.total_readings += 1
+                cell['total'] += 1
 
                 if 'error' in reading:
-                    self.failed_readings += 1
+                    cell['fail'] += 1
                     self.logger.error(
-                        f"[{meter_name}] Reading failed: {reading['error']}"
+                        "[%s] Reading failed: %s", meter_name, reading['error']
                     )
                 else:
-                    self.successful_readings += 1
-                    self.logger.info(
-                        f"[{meter_name}] {format_reading_summary(reading)}"
-                    )
+                    cell['ok'] += 1
+                    # Only build the summary if INFO is actually emitted
+                    if self.logger.isEnabledFor(logging.INFO):
+                        log_info("[%s] %s", meter_name, format_reading_summary(reading))
 
             except Exception as e:
-                self.failed_readings += 1
+                cell['fail'] += 1
                 self.logger.error(
-                    f"[{meter_name}] Unexpected error: {e}",
+                    "[%s] Unexpected error: %s", meter_name, e,
                     exc_info=True
                 )
 
-            # Wait for next reading (with interruptible sleep)
-            self.stop_event.wait(interval)
+            # Next due time; if a slow reading overran it, skip the missed
+            # slots rather than firing them back to back
+            next_due += interval
+            if next_due < clock():
+                next_due = clock() + interval
+
+            # Wait for next reading (returns early when stop() is called)
+            try:
+                await asyncio.wait_for(stop_wait(), timeout=next_due - clock())
+            except asyncio.TimeoutError:
+                pass
+
+        log_info("Stopped monitoring %s", meter_name)
 
-        self.logger.info(f"Stopped monitoring {meter_name}")
+    def _run_loop(self) -> None:
+        """Run the orchestrator event loop until stop() stops it"""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
 
     def start(self) -> None:
         """Start monitoring all meters"""
@@ -192,87 +261,173 @@ class MeterOrchestrator:
         self.logger.info("Starting multi-meter orchestrator...")
         self.running = True
         self.start_time = datetime.now()
-        self.stop_event.clear()
 
-        # Start a monitoring thread for each meter
+        # One loop thread drives every meter
+        self._loop = asyncio.new_event_loop()
+        self._stop_async = asyncio.Event()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop,
+            name="orchestrator_loop",
+            daemon=True
+        )
+        self._loop_thread.start()
+
+        # Start a monitoring task for each meter
         for meter in self.meters:
-            meter_name = meter.config.get('name', f'{meter.meter_type}_meter')
-            thread = threading.Thread(
-                target=self._monitor_meter,
-                args=(meter,),
-                name=f"monitor_{meter_name}",
-                daemon=True
+            meter_name = meter.display_name
+            self.tasks[meter_name] = asyncio.run_coroutine_threadsafe(
+                self._monitor_meter(meter), self._loop
             )
-            thread.start()
-            self.threads[meter_name] = thread
 
         self.logger.info(
-            f"Orchestrator started with {len(self.threads)} meter(s)"
+            "Orchestrator started with %d meter(s)", len(self.tasks)
         )
 
     def stop(self) -> None:
         """Stop monitoring all meters"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
         if not self.running:
             self.logger.warning("Orchestrator is not running")
             return
 
         self.logger.info("Stopping orchestrator...")
         self.running = False
-        self.stop_event.set()
+        self._loop.call_soon_threadsafe(self._stop_async.set)
 
-        # Wait for all threads to finish (with timeout)
-        for name, thread in self.threads.items():
-            self.logger.debug(f"Waiting for {name} thread to stop...")
-            thread.join(timeout=5.0)
+        # Wait for all monitoring tasks to finish (with timeout)
+        for name, task in self.tasks.items():
+            self.logger.debug("Waiting for %s task to stop...", name)
+            try:
+                task.result(timeout=5.0)
+            except concurrent.futures.TimeoutError:
+                self.logger.warning("Task %s did not stop cleanly", name)
+                task.cancel()
+            except Exception as e:
+                self.logger.warning("Task %s ended with error: %s", name, e)
 
-            if thread.is_alive():
-                self.logger.warning(f"Thread {name} did not stop cleanly")
+        self.tasks.clear()
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5.0)
+        self._loop = self._loop_thread = self._stop_async = None
+
+        # Release per-meter handles (reopened lazily on next start)
+        for meter in self.meters:
+            meter.close()
 
-        self.threads.clear()
         self.logger.info("Orchestrator stopped")
 
     def run_once(self) -> Dict[str, Any]:
         """
-        Take a single reading from all meters (synchronously)
+        Take a single reading from all meters (blocks until all finish)
+
+        Returns:
+            Dictionary mapping meter names to readings
+        """
+        return asyncio.run(self.poll_all())
+
+    async def poll_all(self, max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Take a single reading from all meters concurrently
+
+        Each meter's capture + Claude round-trip runs in a worker thread, so a
+        polling round takes about as long as the slowest meter rather than the
+        sum of all of them.
+
+        Args:
+            max_concurrency: Maximum number of meters read at once (defaults
+                             to the 'max_concurrency' config value, or 4)
 
         Returns:
             Dictionary mapping meter names to readings
         """
         self.logger.info("Taking single reading from all meters...")
-        results = {}
 
-        for meter in self.meters:
-            meter_name = meter.config.get('name', f'{meter.meter_type}_meter')
+        if max_concurrency is None:
+            max_concurrency = self.config.get('max_concurrency', 4)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
-            try:
-                self.logger.info(f"[{meter_name}] Reading...")
-                reading = meter.process_reading()
+        # One timestamp for the whole tick instead of one clock read per meter
+        tick_ts = datetime.now().isoformat()
+
+        readings = await asyncio.gather(
+            *(self._poll_one(meter, semaphore, tick_ts) for meter in self.meters)
+        )
 
-                results[meter_name] = reading
+        return {
+            meter.display_name: reading
+            for meter, reading in zip(self.meters, readings)
+        }
+
+    async def _poll_one(self, meter: BaseMeter, semaphore: asyncio.Semaphore,
+                        tick_ts: str) -> Dict[str, Any]:
+        """
+        Take one reading from a meter, bounded by the shared semaphore
+
+        Args:
+            meter: Meter instance to read
+            semaphore: Limits how many meters are read at once
+            tick_ts: Timestamp shared by all meters in this round
+
+        Returns:
+            Reading dictionary (or error dictionary)
+        """
+        meter_name = meter.display_name
+
+        async with semaphore:
+            try:
+                self.logger.info("[%s] Reading...", meter_name)
+                # The camera and Claude clients are synchronous
+                reading = await asyncio.to_thread(meter.process_reading, now=tick_ts)
 
                 if 'error' in reading:
                     self.logger.error(
-                        f"[{meter_name}] Error: {reading['error']}"
+                        "[%s] Error: %s", meter_name, reading['error']
                     )
-                else:
+                elif self.logger.isEnabledFor(logging.INFO):
                     self.logger.info(
-                        f"[{meter_name}] {format_reading_summary(reading)}"
+                        "[%s] %s", meter_name, format_reading_summary(reading)
                     )
 
+                return reading
+
             except Exception as e:
-                self.logger.error(f"[{meter_name}] Exception: {e}", exc_info=True)
-                results[meter_name] = {
+                self.logger.error("[%s] Exception: %s", meter_name, e, exc_info=True)
+                return {
                     'error': str(e),
                     'meter_type': meter.meter_type,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': tick_ts
                 }
 
-        return results
+    def _sum_stat(self, key: str) -> int:
+        """Sum one counter across the per-meter cells"""
+        return sum(cell[key] for cell in list(self._stats_cells.values()))
+
+    @property
+    def total_readings(self) -> int:
+        """Readings attempted by the monitoring tasks"""
+        return self._sum_stat('total')
+
+    @property
+    def successful_readings(self) -> int:
+        """Readings that completed without error"""
+        return self._sum_stat('ok')
+
+    @property
+    def failed_readings(self) -> int:
+        """Readings that returned an error or raised"""
+        return self._sum_stat('fail')
 
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get orchestrator statistics
 
+        Counters are summed from the per-meter cells at call time, so a
+        reading finishing concurrently may or may not be included yet.
+
         Returns:
             Dictionary with orchestrator statistics
         """
@@ -280,15 +435,18 @@ class MeterOrchestrator:
         if self.start_time:
             uptime = (datetime.now() - self.start_time).total_seconds()
 
+        total = self.total_readings
+        successful = self.successful_readings
+
         return {
             'running': self.running,
             'num_meters': len(self.meters),
-            'total_readings': self.total_readings,
-            'successful_readings': self.successful_readings,
+            'total_readings': total,
+            'successful_readings': successful,
             'failed_readings': self.failed_readings,
             'success_rate': (
-                self.successful_readings / self.total_readings * 100
-                if self.total_readings > 0 else 0
+                successful / total * 100
+                if total > 0 else 0
             ),
             'uptime_seconds': uptime,
             'start_time': self.start_time.isoformat() if self.start_time else None
@@ -304,13 +462,13 @@ class MeterOrchestrator:
         results = {}
 
         for meter in self.meters:
-            meter_name = meter.config.get('name', f'{meter.meter_type}_meter')
+            meter_name = meter.display_name
 
             try:
                 stats = meter.calculate_statistics()
                 results[meter_name] = stats
             except Exception as e:
-                self.logger.error(f"Error getting stats for {meter_name}: {e}")
+                self.logger.error("Error getting stats for %s: %s", meter_name, e)
                 results[meter_name] = {'error': str(e)}
 
         return results
@@ -325,13 +483,13 @@ class MeterOrchestrator:
         results = {}
 
         for meter in self.meters:
-            meter_name = meter.config.get('name', f'{meter.meter_type}_meter')
+            meter_name = meter.display_name
 
             try:
                 summary = meter.get_usage_summary()
                 results[meter_name] = summary
             except Exception as e:
-                self.logger.error(f"Error getting summary for {meter_name}: {e}")
+                self.logger.error("Error getting summary for %s: %s", meter_name, e)
                 results[meter_name] = {'error': str(e)}
 
         return results
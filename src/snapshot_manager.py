@@ -5,11 +5,96 @@ Manages meter snapshot archiving with timestamps and metadata
 """
 
 import os
+import re
 import json
+import errno
+import heapq
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Pattern
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def _copy_file(source_path: str, dest_path: Path) -> None:
+    """
+    Copy a file, in-kernel where possible, keeping its timestamps
+
+    copy_file_range lets the filesystem share extents (reflink on Btrfs/XFS)
+    or copy without a round trip through user space; anything that doesn't
+    support it falls back to shutil.copyfileobj.
+    """
+    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+        st = os.fstat(src.fileno())
+        try:
+            remaining = st.st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst)
+
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _tail_lines(path: Path, count: Optional[int], block_size: int = 8192) -> List[bytes]:
+    """
+    Read the last lines of a file by reading backwards from the end
+
+    Args:
+        path: File to read
+        count: Number of lines wanted (None for all)
+        block_size: Bytes read per step
+
+    Returns:
+        Up to count non-empty lines, oldest first
+    """
+    with open(path, 'rb') as f:
+        if count is None:
+            return [line for line in f.read().split(b'\n') if line.strip()]
+
+        end = f.seek(0, os.SEEK_END)
+        data = b''
+        # count + 1 newlines guarantees count complete lines after the first
+        while end > 0 and data.count(b'\n') <= count:
+            start = max(0, end - block_size)
+            f.seek(start)
+            data = f.read(end - start) + data
+            end = start
+
+    if end > 0:
+        data = data[data.index(b'\n') + 1:]  # Drop the partial first line
+    lines = [line for line in data.split(b'\n') if line.strip()]
+    return lines[-count:] if count > 0 else []
+
+
+def _parse_index_line(line: bytes) -> Optional[Dict]:
+    """Parse one reading index line, or None if it is truncated or corrupt"""
+    # Cheap shape check first: a line cut off by a crash mid-append can't
+    # end with the closing brace
+    if not (line.startswith(b'{') and line.rstrip().endswith(b'}')):
+        return None
+    try:
+        return orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+    except ValueError:
+        return None
 
 
 class SnapshotManager:
@@ -24,6 +109,7 @@ class SnapshotManager:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._pattern_cache: Dict[str, Pattern[str]] = {}
 
     def get_meter_dir(self, meter_name: str) -> Path:
         """Get the directory for a specific meter"""
@@ -31,6 +117,29 @@ class SnapshotManager:
         meter_dir.mkdir(parents=True, exist_ok=True)
         return meter_dir
 
+    def _snapshot_pattern(self, meter_name: str) -> Pattern[str]:
+        """Get the (cached) filename regex for a meter's snapshots"""
+        pattern = self._pattern_cache.get(meter_name)
+        if pattern is None:
+            pattern = re.compile(re.escape(meter_name) + r"_\d{8}_\d{6}\.jpg$")
+            self._pattern_cache[meter_name] = pattern
+        return pattern
+
+    def _iter_snapshot_names(self, meter_dir: Path, meter_name: str) -> Iterator[str]:
+        """
+        Yield snapshot filenames in a meter directory (unordered)
+
+        Only names produced by generate_snapshot_filename() match, so stray
+        files (other meters sharing a prefix, temp files) are skipped. Names
+        embed a %Y%m%d_%H%M%S timestamp, so comparing them as strings orders
+        them by time without any stat() calls.
+        """
+        match = self._snapshot_pattern(meter_name).match
+        with os.scandir(meter_dir) as entries:
+            for entry in entries:
+                if match(entry.name):
+                    yield entry.name
+
     def generate_snapshot_filename(self, meter_name: str, timestamp: datetime = None) -> str:
         """
         Generate timestamped filename for snapshot
@@ -51,7 +160,8 @@ class SnapshotManager:
     def save_snapshot(self,
                      source_path: str,
                      meter_name: str,
-                     timestamp: datetime = None) -> Path:
+                     timestamp: datetime = None,
+                     preserve_source: bool = True) -> Path:
         """
         Save snapshot to archive with timestamp
 
@@ -59,6 +169,8 @@ class SnapshotManager:
             source_path: Path to source image file
             meter_name: Name of the meter
             timestamp: Timestamp for the snapshot (default: now)
+            preserve_source: Copy the file (True) or move it into the archive
+                             (False - a rename when on the same filesystem)
 
         Returns:
             Path to archived snapshot
@@ -70,8 +182,18 @@ class SnapshotManager:
         filename = self.generate_snapshot_filename(meter_name, timestamp)
         dest_path = meter_dir / filename
 
-        # Copy file to archive
-        shutil.copy2(source_path, dest_path)
+        if not preserve_source:
+            try:
+                os.rename(source_path, dest_path)
+                return dest_path
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+
+        # Copy file to archive (source kept, or on another filesystem)
+        _copy_file(source_path, dest_path)
+        if not preserve_source:
+            os.unlink(source_path)
 
         return dest_path
 
@@ -92,7 +214,7 @@ class SnapshotManager:
         Returns:
             Path to metadata file
         """
-        metadata_path = snapshot_path.with_suffix('.json')
+        metadata_path = self._meta_path(snapshot_path)
 
         metadata = {
             'snapshot': {
@@ -123,12 +245,100 @@ class SnapshotManager:
         if camera_info:
             metadata['camera'] = camera_info
 
-        # Write metadata file
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        return self.write_metadata(snapshot_path, metadata)
+
+    def write_metadata(self, snapshot_path: Path, metadata: Dict) -> Path:
+        """
+        Write (or rewrite) the metadata sidecar for a snapshot
+
+        Every sidecar writer should go through here so the meter's reading
+        index sees the change.
+
+        Args:
+            snapshot_path: Path to the snapshot image
+            metadata: Complete metadata dictionary
+
+        Returns:
+            Path to metadata file
+        """
+        snapshot_path = Path(snapshot_path)
+        metadata_path = self._meta_path(snapshot_path)
+
+        # Write metadata file atomically (readers never see a partial file)
+        tmp_path = metadata_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_bytes(metadata, indent=True))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, metadata_path)
+
+        # Append the history fields to the meter's reading index (a rewrite
+        # appends a newer record for the same snapshot, which wins on read)
+        self._append_index(snapshot_path.parent, self._index_record(snapshot_path, metadata))
 
         return metadata_path
 
+    @staticmethod
+    def _meta_path(snapshot_path: Path) -> Path:
+        """Path of a snapshot's metadata sidecar (.jpg -> .json)"""
+        path = os.fspath(snapshot_path)
+        if path.endswith('.jpg'):
+            return Path(path[:-4] + '.json')
+        return snapshot_path.with_suffix('.json')
+
+    def get_index_path(self, meter_name: str) -> Path:
+        """Get the JSONL reading index for a meter (one line per snapshot)"""
+        return self.get_meter_dir(meter_name) / f"{meter_name}.jsonl"
+
+    @staticmethod
+    def _index_record(snapshot_path: Path, metadata: Dict) -> Dict:
+        """Flatten snapshot metadata into a reading index record"""
+        meter_reading = metadata.get('meter_reading') or {}
+        return {
+            'snapshot_path': str(snapshot_path),
+            'timestamp': (metadata.get('snapshot') or {}).get('timestamp'),
+            'total_reading': meter_reading.get('total_reading'),
+            'confidence': meter_reading.get('confidence'),
+            'temperature': (metadata.get('temperature') or {}).get('celsius')
+        }
+
+    @staticmethod
+    def _append_index(meter_dir: Path, record: Dict) -> None:
+        """Append one record to the reading index in a meter directory"""
+        with open(meter_dir / f"{meter_dir.name}.jsonl", 'ab') as f:
+            f.write(_json_bytes(record) + b"\n")
+
+    def rebuild_index(self, meter_name: str) -> int:
+        """
+        Rebuild a meter's reading index from its metadata sidecar files
+
+        The index is only a cache (history reads check it against the
+        sidecars); rebuilding compacts it after rewrites or deletions.
+
+        Args:
+            meter_name: Name of the meter
+
+        Returns:
+            Number of records written
+        """
+        index_path = self.get_index_path(meter_name)
+        snapshots = self.get_snapshots(meter_name)
+        count = 0
+
+        tmp_path = index_path.with_suffix('.jsonl.tmp')
+        with open(tmp_path, 'wb') as f:
+            for snapshot_path in reversed(snapshots):  # Oldest first
+                try:
+                    metadata = self.get_metadata(snapshot_path)
+                except ValueError:
+                    continue  # Unreadable sidecar
+                if metadata:
+                    f.write(_json_bytes(self._index_record(snapshot_path, metadata)) + b"\n")
+                    count += 1
+        os.replace(tmp_path, index_path)
+
+        return count
+
     def get_latest_snapshot(self, meter_name: str) -> Optional[Path]:
         """
         Get the most recent snapshot for a meter
@@ -140,9 +350,9 @@ class SnapshotManager:
             Path to latest snapshot or None
         """
         meter_dir = self.get_meter_dir(meter_name)
-        snapshots = sorted(meter_dir.glob(f"{meter_name}_*.jpg"), reverse=True)
+        latest = max(self._iter_snapshot_names(meter_dir, meter_name), default=None)
 
-        return snapshots[0] if snapshots else None
+        return meter_dir / latest if latest else None
 
     def get_snapshots(self,
                      meter_name: str,
@@ -158,12 +368,15 @@ class SnapshotManager:
             List of snapshot paths (newest first)
         """
         meter_dir = self.get_meter_dir(meter_name)
-        snapshots = sorted(meter_dir.glob(f"{meter_name}_*.jpg"), reverse=True)
+        names = self._iter_snapshot_names(meter_dir, meter_name)
 
+        # Partial selection when only the newest few are wanted
         if limit:
-            snapshots = snapshots[:limit]
+            names = heapq.nlargest(limit, names)
+        else:
+            names = sorted(names, reverse=True)
 
-        return snapshots
+        return [meter_dir / name for name in names]
 
     def get_metadata(self, snapshot_path: Path) -> Optional[Dict]:
         """
@@ -175,13 +388,13 @@ class SnapshotManager:
         Returns:
             Metadata dictionary or None
         """
-        metadata_path = snapshot_path.with_suffix('.json')
+        metadata_path = self._meta_path(snapshot_path)
 
         if not metadata_path.exists():
             return None
 
-        with open(metadata_path, 'r') as f:
-            return json.load(f)
+        with open(metadata_path, 'rb') as f:
+            return json.loads(f.read())
 
     def get_reading_history(self, meter_name: str, limit: int = 10) -> list:
         """
@@ -192,21 +405,45 @@ class SnapshotManager:
             limit: Maximum number of readings to return
 
         Returns:
-            List of reading data with metadata
+            List of reading data with metadata (newest first)
         """
+        # The sidecars are the source of truth: take the newest snapshots from
+        # the directory and use the index only as a cache of their fields
         snapshots = self.get_snapshots(meter_name, limit=limit)
-        history = []
+        if not snapshots:
+            return []
+
+        index_path = self.get_index_path(meter_name)
+        try:
+            index_mtime = index_path.stat().st_mtime_ns
+        except OSError:
+            index_mtime = None
+
+        cached = {}
+        if index_mtime is not None:
+            for line in _tail_lines(index_path, limit):
+                record = _parse_index_line(line)
+                if record is not None:
+                    cached[record.get('snapshot_path')] = record  # Later lines win
 
+        history = []
         for snapshot_path in snapshots:
-            metadata = self.get_metadata(snapshot_path)
+            record = cached.get(str(snapshot_path))
+            if record is not None:
+                # Sidecars rewritten after the last index write (by a tool
+                # that bypassed write_metadata) are read directly
+                try:
+                    if self._meta_path(snapshot_path).stat().st_mtime_ns <= index_mtime:
+                        history.append(record)
+                        continue
+                except OSError:
+                    continue  # Sidecar deleted
+            try:
+                metadata = self.get_metadata(snapshot_path)
+            except ValueError:
+                continue  # Unreadable sidecar
             if metadata:
-                history.append({
-                    'snapshot_path': str(snapshot_path),
-                    'timestamp': metadata['snapshot']['timestamp'],
-                    'total_reading': metadata['meter_reading']['total_reading'],
-                    'confidence': metadata['meter_reading']['confidence'],
-                    'temperature': metadata.get('temperature', {}).get('celsius')
-                })
+                history.append(self._index_record(snapshot_path, metadata))
 
         return history
 
@@ -8,25 +8,79 @@ import os
 import sys
 import time
 import json
+import queue
+from collections import OrderedDict
+from fnmatch import fnmatch
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional
-from dotenv import load_dotenv
 
-# Load environment
-load_dotenv()
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Close-after-write events only exist with the inotify backend (Linux); on
+# other platforms watchdog's observer can't tell when a snapshot written in
+# place is complete, so the worker polls there instead
+CLOSE_EVENTS_AVAILABLE = WATCHDOG_AVAILABLE and Observer.__name__ == 'InotifyObserver'
+
+if __name__ == "__main__":
+    # Run as a script: load .env before the imports below read their settings.
+    # (Importers load their own environment and put src/ on the path.)
+    from dotenv import load_dotenv
+    load_dotenv()
 
 from snapshot_manager import SnapshotManager
 from llm_reader import read_meter_with_claude
 from temperature_reader import get_temperature
 
+# Snapshot keys remembered by the polling watcher (oldest evicted first)
+MAX_PROCESSED = 4096
+
+
+if CLOSE_EVENTS_AVAILABLE:
+    class _SnapshotEventHandler(FileSystemEventHandler):
+        """Queues snapshot files once they are completely written"""
+
+        def __init__(self, pattern: str, paths: "queue.Queue[Path]"):
+            super().__init__()
+            self.pattern = pattern
+            self.paths = paths
+
+        def _enqueue(self, path: str):
+            if fnmatch(os.path.basename(path), self.pattern):
+                self.paths.put(Path(path))
+
+        def on_closed(self, event):
+            # Close after write (IN_CLOSE_WRITE): the file is complete
+            if not event.is_directory:
+                self._enqueue(event.src_path)
+
+        def on_moved(self, event):
+            # Files written elsewhere and renamed into place
+            if not event.is_directory:
+                self._enqueue(event.dest_path)
+
 
 class SnapshotMetadataWorker:
     """Worker that processes snapshots and adds metadata"""
 
+    # Per-snapshot dict skeletons, copied and filled in by process_snapshot
+    _CAMERA_INFO_TEMPLATE = {
+        'source_file': None,
+        'model': 'Wyze Cam V2 (Thingino)',
+        'ip': None
+    }
+    _RESULT_TEMPLATE = {
+        'success': False,
+        'meter_name': None,
+        'snapshot_path': None,
+        'timestamp': None
+    }
+
     def __init__(self,
                  watch_dir: str = "/tmp",
                  archive_dir: str = "logs/meter_snapshots"):
@@ -39,12 +93,19 @@ class SnapshotMetadataWorker:
         """
         self.watch_dir = Path(watch_dir)
         self.manager = SnapshotManager(base_dir=archive_dir)
-        self.processed = set()
+        # (inode, mtime_ns) of snapshots already processed, as an LRU; a file
+        # rewritten under the same name gets a new key and is processed again
+        self.processed: "OrderedDict[tuple, None]" = OrderedDict()
+
+        # Last archived total_reading per meter (loaded from the archive on
+        # first use, then kept current as snapshots are processed)
+        self._last_reading: Dict[str, float] = {}
 
     def process_snapshot(self,
                         snapshot_path: Path,
                         meter_name: str,
-                        capture_temperature: bool = True) -> Dict:
+                        capture_temperature: bool = True,
+                        keep_source: bool = True) -> Dict:
         """
         Process a snapshot: analyze, archive, and add metadata
 
@@ -52,16 +113,15 @@ class SnapshotMetadataWorker:
             snapshot_path: Path to the snapshot file
             meter_name: Name of the meter
             capture_temperature: Whether to attempt temperature capture
+            keep_source: Copy the snapshot into the archive (True) or move it
 
         Returns:
             Processing result dictionary
         """
-        result = {
-            'success': False,
-            'meter_name': meter_name,
-            'snapshot_path': str(snapshot_path),
-            'timestamp': datetime.now().isoformat()
-        }
+        result = self._RESULT_TEMPLATE.copy()
+        result['meter_name'] = meter_name
+        result['snapshot_path'] = str(snapshot_path)
+        result['timestamp'] = datetime.now().isoformat()
 
         try:
             print(f"\n{'='*60}")
@@ -83,10 +143,9 @@ class SnapshotMetadataWorker:
 
             # Validate against previous readings (water meters should only increase)
             print("\n[1.5/4] Validating against previous readings...")
-            recent_readings = self.manager.get_reading_history(meter_name, limit=5)
+            last_reading = self._get_last_reading(meter_name)
 
-            if recent_readings:
-                last_reading = recent_readings[0]['total_reading']
+            if last_reading is not None:
                 print(f"  Last reading: {last_reading} m³")
 
                 # Check if reading is lower than last reading
@@ -125,17 +184,16 @@ class SnapshotMetadataWorker:
             archived_path = self.manager.save_snapshot(
                 str(snapshot_path),
                 meter_name,
-                timestamp=timestamp
+                timestamp=timestamp,
+                preserve_source=keep_source
             )
             print(f"  ✓ Archived to: {archived_path}")
 
             # 4. Create metadata file
             print("\n[4/4] Creating metadata...")
-            camera_info = {
-                'source_file': snapshot_path.name,
-                'model': 'Wyze Cam V2 (Thingino)',
-                'ip': os.getenv('WATER_CAM_IP', '10.10.10.207')
-            }
+            camera_info = self._CAMERA_INFO_TEMPLATE.copy()
+            camera_info['source_file'] = snapshot_path.name
+            camera_info['ip'] = os.getenv('WATER_CAM_IP', '10.10.10.207')
 
             metadata_path = self.manager.create_metadata_file(
                 archived_path,
@@ -144,6 +202,7 @@ class SnapshotMetadataWorker:
                 camera_info=camera_info
             )
             print(f"  ✓ Metadata saved: {metadata_path.name}")
+            self._last_reading[meter_name] = current_reading
 
             # Success!
             result['success'] = True
@@ -164,6 +223,25 @@ class SnapshotMetadataWorker:
 
         return result
 
+    def _get_last_reading(self, meter_name: str) -> Optional[float]:
+        """
+        Get the most recently archived reading for a meter
+
+        Args:
+            meter_name: Name of the meter
+
+        Returns:
+            Last total_reading, or None if nothing has been archived yet
+        """
+        if meter_name not in self._last_reading:
+            # Cold cache: fall back to the archive once
+            recent_readings = self.manager.get_reading_history(meter_name, limit=5)
+            if not recent_readings:
+                return None
+            self._last_reading[meter_name] = recent_readings[0]['total_reading']
+
+        return self._last_reading[meter_name]
+
     def watch_and_process(self,
                          meter_name: str = "water_main",
                          pattern: str = "meter_snapshot_*.jpg",
@@ -171,42 +249,90 @@ class SnapshotMetadataWorker:
         """
         Watch directory for new snapshots and process them
 
+        Uses close-after-write filesystem events (watchdog on Linux) when
+        available, so snapshots are processed as soon as they are written;
+        otherwise polls the directory.
+
         Args:
             meter_name: Name of the meter
             pattern: File pattern to watch for
-            interval: Check interval in seconds
+            interval: Check interval in seconds (polling fallback only)
         """
         print(f"👀 Watching {self.watch_dir} for {pattern}")
-        print(f"   Checking every {interval} seconds")
+        if CLOSE_EVENTS_AVAILABLE:
+            print(f"   Using filesystem events")
+        else:
+            print(f"   Checking every {interval} seconds")
         print(f"   Press Ctrl+C to stop\n")
 
         try:
-            while True:
-                # Find matching snapshots
-                snapshots = list(self.watch_dir.glob(pattern))
+            if CLOSE_EVENTS_AVAILABLE:
+                self._watch_events(meter_name, pattern)
+            else:
+                self._watch_polling(meter_name, pattern, interval)
 
-                for snapshot in snapshots:
-                    # Skip if already processed
-                    if snapshot in self.processed:
-                        continue
+        except KeyboardInterrupt:
+            print("\n\n⏹  Worker stopped by user")
 
-                    # Process the snapshot
-                    result = self.process_snapshot(snapshot, meter_name)
+    def _process_and_log(self, snapshot: Path, meter_name: str):
+        """Process one snapshot and print the outcome"""
+        # Watched snapshots are disposable, so move them into the archive
+        result = self.process_snapshot(snapshot, meter_name, keep_source=False)
 
-                    # Mark as processed
-                    self.processed.add(snapshot)
+        # Log result
+        if result['success']:
+            print(f"✓ Processed: {snapshot.name}")
+        else:
+            print(f"✗ Failed: {snapshot.name} - {result.get('error')}")
 
-                    # Log result
-                    if result['success']:
-                        print(f"✓ Processed: {snapshot.name}")
-                    else:
-                        print(f"✗ Failed: {snapshot.name} - {result.get('error')}")
+    def _watch_events(self, meter_name: str, pattern: str):
+        """Process snapshots as close-after-write events arrive"""
+        paths: "queue.Queue[Path]" = queue.Queue()
+        observer = Observer()
+        observer.schedule(_SnapshotEventHandler(pattern, paths), str(self.watch_dir))
+        observer.start()
 
-                # Wait before next check
-                time.sleep(interval)
+        try:
+            # Snapshots that landed before the observer started
+            for snapshot in self.watch_dir.glob(pattern):
+                paths.put(snapshot)
 
-        except KeyboardInterrupt:
-            print("\n\n⏹  Worker stopped by user")
+            while True:
+                snapshot = paths.get()
+                if snapshot.exists():
+                    self._process_and_log(snapshot, meter_name)
+        finally:
+            observer.stop()
+            observer.join()
+
+    def _watch_polling(self, meter_name: str, pattern: str, interval: int):
+        """Poll the watch directory for snapshots (used without close events)"""
+        while True:
+            # Find matching snapshots
+            snapshots = list(self.watch_dir.glob(pattern))
+
+            for snapshot in snapshots:
+                try:
+                    st = snapshot.stat()
+                except FileNotFoundError:
+                    continue  # Removed since the glob
+                key = (st.st_ino, st.st_mtime_ns)
+
+                # Skip if already processed
+                if key in self.processed:
+                    self.processed.move_to_end(key)
+                    continue
+
+                # Process the snapshot
+                self._process_and_log(snapshot, meter_name)
+
+                # Mark as processed
+                self.processed[key] = None
+                if len(self.processed) > MAX_PROCESSED:
+                    self.processed.popitem(last=False)
+
+            # Wait before next check
+            time.sleep(interval)
 
 
 def process_single_snapshot(snapshot_path: str,
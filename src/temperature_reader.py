@@ -5,14 +5,189 @@ Captures temperature data from camera or alternative sources
 """
 
 import os
+import shutil
 import subprocess
-from typing import Optional, Dict
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 
+try:
+    import paramiko
+    PARAMIKO_AVAILABLE = True
+except ImportError:
+    PARAMIKO_AVAILABLE = False
+
+# Temperature sources on the camera, in order of preference
+TEMPERATURE_PROBES = (
+    # Linux thermal zone (most reliable)
+    "cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null",
+    # Thingino built-in command
+    "temperature 2>/dev/null",
+    # Hardware monitoring
+    "cat /sys/class/hwmon/hwmon0/temp1_input 2>/dev/null",
+    # Ingenic-specific
+    "cat /proc/jz/temperature 2>/dev/null",
+)
+
+# With paramiko, one client connection per (camera, user) stays open between
+# calls; each has its own lock so cameras can be probed concurrently
+_ssh_clients: Dict[Tuple[str, str], "paramiko.SSHClient"] = {}
+_ssh_client_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_ssh_clients_lock = threading.Lock()
+
+# Without it, ssh connections are multiplexed: the first call leaves a master
+# connection running for SSH_CONTROL_PERSIST seconds and later calls reuse
+# its socket, skipping the handshake and login (so sshpass only matters for
+# that first call in each window)
+SSH_CONTROL_DIR = os.path.join(tempfile.gettempdir(), f"meter-ssh-{os.getuid()}")
+SSH_CONTROL_PERSIST = 600
+_SSH_CONTROL_PATH = os.path.join(SSH_CONTROL_DIR, "%r@%h:%p")
+_SSH_OPTIONS = (
+    "-o", "StrictHostKeyChecking=no", "-o", "UserKnownHostsFile=/dev/null",
+    "-o", "ConnectTimeout=3", "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={_SSH_CONTROL_PATH}", "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+)
+
+# Without sshpass, ssh falls back to key authentication
+SSHPASS_PATH = shutil.which("sshpass")
+
+# Camera temperature changes slowly, so results are reused for
+# WATER_TEMP_CACHE_TTL seconds (failures for at most _ERROR_CACHE_TTL, so a
+# transient problem clears quickly): (camera_ip, source) -> (expires, fields)
+DEFAULT_CACHE_TTL = 30.0
+_ERROR_CACHE_TTL = 5.0
+_temperature_cache: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+
+# Cameras probed at once by poll_all(), kept under sshd's default
+# MaxStartups of 10
+MAX_POLL_WORKERS = 8
+
+# All probes run in one SSH session; each one's output follows a marker line
+_PROBE_MARKER = "__TEMP_PROBE__"
+_PROBE_COMMAND = "; ".join(f"echo {_PROBE_MARKER}; {probe}" for probe in TEMPERATURE_PROBES)
+
+
+def parse_temperature(temp_str: str) -> Optional[float]:
+    """
+    Parse a temperature probe's output
+
+    Args:
+        temp_str: Stripped probe output
+
+    Returns:
+        Temperature in Celsius, or None if the output isn't a usable reading
+    """
+    # sysfs reports whole millidegrees, so most output is a plain integer:
+    # parse it once rather than via isdigit() + int() + float()
+    if temp_str.isdecimal():
+        value = int(temp_str)
+        # If value is in millidegrees (like 45000 for 45°C)
+        if value > 200:
+            return value / 1000.0
+        temp = float(value)
+    else:
+        # Try to parse as float directly
+        try:
+            temp = float(temp_str)
+        except ValueError:
+            return None
+
+    # Sanity check: temperature should be between -40 and 85°C for electronics
+    if -40 <= temp <= 85:
+        return temp
+    return None
+
+
+def _connect_paramiko(camera_ip: str, user: str, password: str) -> "paramiko.SSHClient":
+    """Open an SSH client connection to a camera"""
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    try:
+        client.connect(camera_ip, username=user, password=password, timeout=3,
+                       banner_timeout=3, auth_timeout=3, compress=False)
+    except Exception:
+        client.close()
+        raise
+    return client
+
+
+def _run_probes_paramiko(camera_ip: str, user: str, password: str) -> Optional[str]:
+    """
+    Run the probe command over a long-lived paramiko connection
+
+    The connection is kept open between calls; if it has gone stale it is
+    dropped and reopened once.
+
+    Returns:
+        Command output, or None if the camera couldn't be reached
+    """
+    key = (camera_ip, user)
+    with _ssh_clients_lock:
+        lock = _ssh_client_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        client = _ssh_clients.pop(key, None)
+        reused = client is not None
+
+        while True:
+            try:
+                if client is None:
+                    client = _connect_paramiko(camera_ip, user, password)
+                _, stdout, _ = client.exec_command(_PROBE_COMMAND, timeout=5)
+                output = stdout.read().decode('utf-8', 'replace')
+            except (paramiko.SSHException, OSError):
+                if client is not None:
+                    client.close()
+                    client = None
+                if not reused:
+                    return None
+                reused = False
+                continue
+
+            _ssh_clients[key] = client
+            return output
+
+
+def _run_probes_ssh(camera_ip: str, user: str, password: str) -> Optional[str]:
+    """
+    Run the probe command with the ssh client, over the shared master connection
+
+    Returns:
+        Command output, or None if ssh couldn't be run
+    """
+    ssh_cmd = ["ssh", *_SSH_OPTIONS, f"{user}@{camera_ip}", _PROBE_COMMAND]
+    env = None
+    if SSHPASS_PATH:
+        # sshpass -e reads the password from the environment, keeping it
+        # out of the process list
+        ssh_cmd = [SSHPASS_PATH, "-e", *ssh_cmd]
+        env = {**os.environ, "SSHPASS": password}
+
+    # Only stdout is captured: a newly started master runs on in the
+    # background and may hold stderr open, which would block run() until
+    # it exits
+    try:
+        os.makedirs(SSH_CONTROL_DIR, mode=0o700, exist_ok=True)
+        result = subprocess.run(ssh_cmd, env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, timeout=5)
+    except Exception:
+        return None
+
+    return result.stdout
+
+
 def get_camera_temperature_ssh(camera_ip: str, user: str, password: str) -> Optional[float]:
     """
     Get temperature from camera via SSH
 
+    Every probe in TEMPERATURE_PROBES runs in a single SSH session; the first
+    probe with a usable value wins. With paramiko installed the session runs
+    on a connection kept open in-process, otherwise the ssh client is run
+    over a shared master connection.
+
     Args:
         camera_ip: Camera IP address
         user: SSH username
@@ -21,62 +196,71 @@ def get_camera_temperature_ssh(camera_ip: str, user: str, password: str) -> Opti
     Returns:
         Temperature in Celsius, or None if unavailable
     """
-    # Try different temperature sources in order of preference
-    commands = [
-        # Linux thermal zone (most reliable)
-        "cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null",
-        # Thingino built-in command
-        "temperature 2>/dev/null",
-        # Hardware monitoring
-        "cat /sys/class/hwmon/hwmon0/temp1_input 2>/dev/null",
-        # Ingenic-specific
-        "cat /proc/jz/temperature 2>/dev/null",
-    ]
-
-    for cmd in commands:
-        try:
-            # Try with sshpass if available
-            ssh_cmd = f'sshpass -p "{password}" ssh -o StrictHostKeyChecking=no -o UserKnownHostsFile=/dev/null -o ConnectTimeout=3 {user}@{camera_ip} "{cmd}"'
-            result = subprocess.run(ssh_cmd, shell=True, capture_output=True, text=True, timeout=5)
-
-            if result.returncode == 127:  # sshpass not found
-                # Try without sshpass (requires SSH key setup)
-                ssh_cmd = f'ssh -o StrictHostKeyChecking=no -o UserKnownHostsFile=/dev/null -o ConnectTimeout=3 {user}@{camera_ip} "{cmd}"'
-                result = subprocess.run(ssh_cmd, shell=True, capture_output=True, text=True, timeout=5)
-
-            if result.returncode == 0 and result.stdout.strip():
-                # Parse temperature value
-                temp_str = result.stdout.strip()
-
-                # If value is in millidegrees (like 45000 for 45°C)
-                if temp_str.isdigit() and int(temp_str) > 200:
-                    return float(temp_str) / 1000.0
-
-                # Try to parse as float directly
-                try:
-                    temp = float(temp_str)
-                    # Sanity check: temperature should be between -40 and 85°C for electronics
-                    if -40 <= temp <= 85:
-                        return temp
-                except ValueError:
-                    continue
-
-        except Exception:
-            continue
+    if PARAMIKO_AVAILABLE:
+        output = _run_probes_paramiko(camera_ip, user, password)
+    else:
+        output = _run_probes_ssh(camera_ip, user, password)
+
+    if not output:
+        return None
+
+    # The remote shell's exit status is the last probe's, so judge each
+    # probe by its output instead
+    for probe_output in output.split(_PROBE_MARKER)[1:]:
+        temp_str = probe_output.strip()
+        if temp_str:
+            temp = parse_temperature(temp_str)
+            if temp is not None:
+                return temp
 
     return None
 
 
+def close_ssh_master(camera_ip: str, user: str) -> bool:
+    """
+    Shut down the shared SSH connection to a camera
+
+    Masters exit on their own SSH_CONTROL_PERSIST seconds after last use;
+    call this to close one sooner, e.g. on shutdown. A paramiko connection
+    to the camera is closed as well.
+
+    Args:
+        camera_ip: Camera IP address
+        user: SSH username
+
+    Returns:
+        True if a connection was closed
+    """
+    closed = False
+    with _ssh_clients_lock:
+        client = _ssh_clients.pop((camera_ip, user), None)
+    if client is not None:
+        client.close()
+        closed = True
+
+    ssh_cmd = ["ssh", "-O", "exit", "-o", f"ControlPath={_SSH_CONTROL_PATH}", f"{user}@{camera_ip}"]
+    try:
+        result = subprocess.run(ssh_cmd, capture_output=True, timeout=5)
+    except Exception:
+        return closed
+    return closed or result.returncode == 0
+
+
 def get_temperature(camera_ip: str = None, user: str = None, password: str = None,
-                   source: str = "camera") -> Dict:
+                   source: str = "camera", timestamp: Optional[str] = None) -> Dict:
     """
     Get temperature from configured source
 
+    Camera readings are cached per camera for WATER_TEMP_CACHE_TTL seconds
+    (default 30; 0 disables the cache).
+
     Args:
         camera_ip: Camera IP address (default: from env WATER_CAM_IP)
         user: SSH username (default: from env WATER_CAM_USER)
         password: SSH password (default: from env WATER_CAM_PASS)
         source: Temperature source - "camera", "weather_api", "external", etc.
+        timestamp: ISO timestamp to record (default: now); lets a batch of
+                   calls share one
 
     Returns:
         Dictionary with temperature data:
@@ -97,7 +281,7 @@ def get_temperature(camera_ip: str = None, user: str = None, password: str = Non
         'temperature_c': None,
         'temperature_f': None,
         'source': source,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': timestamp or datetime.now().isoformat(),
         'available': False
     }
 
@@ -106,14 +290,30 @@ def get_temperature(camera_ip: str = None, user: str = None, password: str = Non
             result['error'] = "Camera credentials not configured"
             return result
 
+        cache_key = (camera_ip, source)
+        now = time.monotonic()
+        cached = _temperature_cache.get(cache_key)
+        if cached is not None and now < cached[0]:
+            result.update(cached[1])
+            return result
+
         temp_c = get_camera_temperature_ssh(camera_ip, user, password)
 
         if temp_c is not None:
-            result['temperature_c'] = round(temp_c, 1)
-            result['temperature_f'] = round((temp_c * 9/5) + 32, 1)
-            result['available'] = True
+            fields = {
+                'temperature_c': round(temp_c, 1),
+                'temperature_f': round((temp_c * 9/5) + 32, 1),
+                'available': True
+            }
         else:
-            result['error'] = "SSH not available or no temperature sensor found"
+            fields = {'error': "SSH not available or no temperature sensor found"}
+        result.update(fields)
+
+        ttl = float(os.getenv("WATER_TEMP_CACHE_TTL", DEFAULT_CACHE_TTL))
+        if not result['available']:
+            ttl = min(ttl, _ERROR_CACHE_TTL)
+        if ttl > 0:
+            _temperature_cache[cache_key] = (now + ttl, fields)
 
     elif source == "weather_api":
         # TODO: Implement weather API integration
@@ -129,6 +329,60 @@ def get_temperature(camera_ip: str = None, user: str = None, password: str = Non
     return result
 
 
+def poll_all(meter_configs: List[Dict], timeout: float = 10.0) -> Dict[str, Dict]:
+    """
+    Get camera temperatures for several meters at once
+
+    Cameras are probed in parallel (at most MAX_POLL_WORKERS at a time), so
+    the call takes about as long as the slowest camera rather than the sum.
+
+    Args:
+        meter_configs: Meter configurations (name, camera_ip, and optionally
+                       camera_user / camera_pass; see get_meter_configs())
+        timeout: Seconds to wait for all cameras; any still pending after
+                 that are reported as unavailable
+
+    Returns:
+        Dictionary mapping meter names to get_temperature() results
+    """
+    if not meter_configs:
+        return {}
+
+    # One timestamp for the whole poll
+    timestamp = datetime.now().isoformat()
+
+    pool = ThreadPoolExecutor(max_workers=min(len(meter_configs), MAX_POLL_WORKERS),
+                              thread_name_prefix="temperature")
+    try:
+        futures = [
+            (meter['name'], pool.submit(get_temperature,
+                                        camera_ip=meter.get('camera_ip'),
+                                        user=meter.get('camera_user'),
+                                        password=meter.get('camera_pass'),
+                                        timestamp=timestamp))
+            for meter in meter_configs
+        ]
+        deadline = time.monotonic() + timeout
+
+        results = {}
+        for name, future in futures:
+            try:
+                results[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                results[name] = {
+                    'temperature_c': None,
+                    'temperature_f': None,
+                    'source': "camera",
+                    'timestamp': timestamp,
+                    'available': False,
+                    'error': f"Timed out after {timeout}s"
+                }
+        return results
+    finally:
+        # Don't wait for stuck probes; their own SSH timeouts end them
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def format_temperature(temp_data: Dict) -> str:
     """
     Format temperature data for display
@@ -5,15 +5,42 @@ Loads and validates YAML configuration files for multi-meter monitoring.
 """
 
 import os
+import re
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from .config_schema import matches_config_schema
+
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# ${VAR_NAME} or ${VAR_NAME:default}
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Meter config checks
+_REQUIRED_METER_FIELDS = ('name', 'type', 'camera_ip')
+_REQUIRED_METER_FIELD_SET = frozenset(_REQUIRED_METER_FIELDS)
+_VALID_METER_TYPES = frozenset({'water', 'electric', 'gas'})
+
+# Loaded configs by path: ((st_mtime_ns, st_size), names of the environment
+# variables the file refers to, their values at load time, config)
+_config_cache: Dict[Path, Tuple[Tuple[int, int], Tuple[str, ...],
+                                Tuple[Optional[str], ...], Dict[str, Any]]] = {}
 
 
 def load_config(config_path: str = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file
 
+    The parsed, validated config is cached until the file changes (by
+    modification time or size) or one of the environment variables it refers
+    to changes; each call returns its own copy.
+
     Args:
         config_path: Path to configuration file (default: config/meters.yaml)
 
@@ -30,12 +57,32 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         config_path = project_root / "config" / "meters.yaml"
 
     config_path = Path(config_path)
+    cache_key = config_path.absolute()
+
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        _config_cache.pop(cache_key, None)
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(cache_key)
+    if (cached is not None and cached[0] == signature
+            and tuple(map(os.environ.get, cached[1])) == cached[2]):
+        return copy.deepcopy(cached[3])
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    with open(config_path, 'rb') as f:
+        raw = f.read()
 
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    # Every ${VAR} in the file (comments included), so a change to any of
+    # them invalidates the cached expansion
+    env_names = tuple(sorted({
+        match.group(1).split(':', 1)[0]
+        for match in _ENV_VAR_PATTERN.finditer(raw.decode('utf-8', 'replace'))
+    }))
+    env_values = tuple(map(os.environ.get, env_names))
+
+    config = yaml.load(raw, Loader=_YamlLoader)
 
     # Expand environment variables in configuration
     config = expand_env_vars(config)
@@ -43,52 +90,83 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     # Validate configuration
     validate_config(config)
 
-    return config
+    _config_cache[cache_key] = (signature, env_names, env_values, config)
+    return copy.deepcopy(config)
 
 
 def expand_env_vars(config: Any) -> Any:
     """
-    Recursively expand environment variables in configuration
+    Expand environment variables throughout a configuration
 
-    Supports ${VAR_NAME} and ${VAR_NAME:default_value} syntax
+    Supports ${VAR_NAME} and ${VAR_NAME:default_value} syntax. Nested dicts
+    and lists are walked with an explicit stack, so deep configs can't hit
+    the recursion limit.
 
     Args:
         config: Configuration value (can be dict, list, str, etc.)
 
     Returns:
-        Configuration with expanded environment variables
+        Configuration with expanded environment variables (new dicts/lists;
+        the input is not modified)
     """
-    if isinstance(config, dict):
-        return {k: expand_env_vars(v) for k, v in config.items()}
-    elif isinstance(config, list):
-        return [expand_env_vars(item) for item in config]
-    elif isinstance(config, str):
-        # Handle ${VAR_NAME:default} syntax
-        import re
-
-        def replace_env_var(match):
-            var_expr = match.group(1)
-            if ':' in var_expr:
-                var_name, default = var_expr.split(':', 1)
-                return os.getenv(var_name, default)
+    if not isinstance(config, (dict, list)):
+        return _expand_value(config)
+
+    root = {} if isinstance(config, dict) else []
+    stack = [(config, root)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                # Filled in when popped; list order is kept by adding it now
+                expanded = {} if isinstance(value, dict) else []
+                stack.append((value, expanded))
+            else:
+                expanded = _expand_value(value)
+
+            if isinstance(target, dict):
+                target[key] = expanded
             else:
-                return os.getenv(var_expr, match.group(0))
+                target.append(expanded)
+
+    return root
+
+
+def _expand_value(value: Any) -> Any:
+    """Expand environment variables in a scalar config value"""
+    # Most strings hold no variables; skip the regex for those
+    if not isinstance(value, str) or '${' not in value:
+        return value
+    return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
+
 
-        return re.sub(r'\$\{([^}]+)\}', replace_env_var, config)
+def _replace_env_var(match: re.Match) -> str:
+    """Substitute one ${VAR_NAME} / ${VAR_NAME:default} match"""
+    var_expr = match.group(1)
+    if ':' in var_expr:
+        var_name, default = var_expr.split(':', 1)
+        return os.getenv(var_name, default)
     else:
-        return config
+        return os.getenv(var_expr, match.group(0))
 
 
 def validate_config(config: Dict[str, Any]) -> None:
     """
     Validate configuration structure
 
+    With msgspec installed, a valid config is accepted in one schema check;
+    the checks below then only run to explain what is wrong.
+
     Args:
         config: Configuration dictionary to validate
 
     Raises:
         ValueError: If configuration is invalid
     """
+    if matches_config_schema(config):
+        return
+
     # Check for required top-level keys
     if 'meters' not in config:
         raise ValueError("Configuration must contain 'meters' section")
@@ -124,20 +202,19 @@ def validate_meter_config(meter: Dict[str, Any], index: int) -> None:
     Raises:
         ValueError: If meter configuration is invalid
     """
-    required_fields = ['name', 'type', 'camera_ip']
-
-    for field in required_fields:
-        if field not in meter:
-            raise ValueError(f"Meter {index}: Missing required field '{field}'")
+    missing = _REQUIRED_METER_FIELD_SET - meter.keys()
+    if missing:
+        # Report the first missing field in declaration order
+        field = next(f for f in _REQUIRED_METER_FIELDS if f in missing)
+        raise ValueError(f"Meter {index}: Missing required field '{field}'")
 
     # Validate meter type
-    valid_types = ['water', 'electric', 'gas']
     meter_type = meter['type']
 
-    if meter_type not in valid_types:
+    if not isinstance(meter_type, str) or meter_type not in _VALID_METER_TYPES:
         raise ValueError(
             f"Meter {index}: Invalid type '{meter_type}'. "
-            f"Must be one of: {', '.join(valid_types)}"
+            f"Must be one of: water, electric, gas"
         )
 
     # Validate camera configuration
@@ -261,10 +338,17 @@ def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, A
     """
     result = base.copy()
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
+    # Walk nested sections with an explicit stack; only dicts that are
+    # merged into get copied, so base is never modified
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
 
     return result
@@ -0,0 +1,93 @@
+"""
+Configuration Schema
+
+msgspec schema for meters.yaml. With msgspec installed, a whole config is
+checked in a single C-level pass; configs it rejects are re-checked by the
+hand-written validators in config_loader, which produce the error messages.
+The schema is never more permissive than those validators.
+"""
+
+from typing import Any, List, Union
+
+try:
+    import msgspec
+    from msgspec import Meta, UNSET, UnsetType
+    from typing import Annotated
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+if MSGSPEC_AVAILABLE:
+    NonEmptyStr = Annotated[str, Meta(min_length=1)]
+    ReadingInterval = Annotated[int, Meta(ge=60)]
+
+    # Meter entries are told apart by their 'type' field; other keys pass through
+
+    class _MeterConfig(msgspec.Struct, kw_only=True, tag_field="type"):
+        """Fields shared by every meter type"""
+        name: Any
+        camera_ip: NonEmptyStr
+        reading_interval: ReadingInterval = 60
+
+    class WaterMeterConfig(_MeterConfig, tag="water"):
+        """Water meter entry"""
+
+    class ElectricMeterConfig(_MeterConfig, tag="electric"):
+        """Electric meter entry"""
+
+    class GasMeterConfig(_MeterConfig, tag="gas"):
+        """Gas meter entry"""
+        use_cubic_meters: bool = False
+
+    class InfluxDBConfig(msgspec.Struct, kw_only=True):
+        """InfluxDB section"""
+        url: NonEmptyStr
+        token: NonEmptyStr
+        org: NonEmptyStr
+        bucket: NonEmptyStr
+
+    class MQTTConfig(msgspec.Struct, kw_only=True):
+        """MQTT section (broker and port are only required when enabled)"""
+        enabled: bool = False
+        broker: Any = UNSET
+        port: Union[int, UnsetType] = UNSET
+
+        def __post_init__(self):
+            if self.enabled:
+                if self.broker is UNSET or self.port is UNSET:
+                    raise ValueError("broker and port are required when enabled")
+                if not 1 <= self.port <= 65535:
+                    raise ValueError("port must be between 1 and 65535")
+
+    class ConfigSchema(msgspec.Struct, kw_only=True):
+        """Top-level configuration"""
+        meters: Annotated[
+            List[Union[WaterMeterConfig, ElectricMeterConfig, GasMeterConfig]],
+            Meta(min_length=1)
+        ]
+        influxdb: Union[InfluxDBConfig, UnsetType] = UNSET
+        mqtt: Union[MQTTConfig, UnsetType] = UNSET
+
+else:
+    ConfigSchema = None
+
+
+def matches_config_schema(config: Any) -> bool:
+    """
+    Check a configuration against the schema
+
+    Args:
+        config: Parsed configuration
+
+    Returns:
+        True if the config is valid; False if msgspec is unavailable or the
+        config needs the detailed validators
+    """
+    if ConfigSchema is None:
+        return False
+    try:
+        msgspec.convert(config, type=ConfigSchema)
+    except msgspec.ValidationError:
+        return False
+    return True
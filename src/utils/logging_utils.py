@@ -4,12 +4,64 @@ Logging Utilities
 Provides logging utilities for the meter monitoring system.
 """
 
+import atexit
 import logging
 import json
+import os
+import re
+import struct
 import sys
+import tempfile
+import threading
+import time
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, IO
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Settings each logger was last set up with, by logger name
+_logger_settings: Dict[str, tuple] = {}
+
+# Open reading logs, keyed by path (closed at exit). Writes are buffered
+# and flushed once a second's or 64 KB's worth has built up.
+_log_handles: Dict[str, '_ReadingLog'] = {}
+_log_handles_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+_FLUSH_INTERVAL = 1.0
+_FLUSH_BYTES = 1 << 16
+
+# Per-meter-type offset index next to a reading log
+# (readings.jsonl -> readings.<type>.offsets): a header holding how many
+# bytes of the log have been indexed plus the log's inode and a checksum of
+# its first line (to notice a replaced or rewritten log), then one uint64
+# line offset per reading of that type. Only types safe to put in a
+# filename are indexed.
+_OFFSET = struct.Struct('<Q')
+_INDEX_HEADER = struct.Struct('<QQQ')
+_INDEXABLE_TYPE = re.compile(r'[A-Za-z0-9_-]+')
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
 def setup_logger(
@@ -21,6 +73,9 @@ def setup_logger(
     """
     Set up a logger with console and/or file output
 
+    Calling this again with the same settings returns the logger as is,
+    without reopening its log file.
+
     Args:
         name: Logger name
         log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -32,18 +87,20 @@ def setup_logger(
     """
     logger = logging.getLogger(name)
 
+    settings = (log_level, log_file, log_to_console)
+    if logger.handlers and _logger_settings.get(name) == settings:
+        return logger
+
     # Clear existing handlers
-    logger.handlers.clear()
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
 
     # Set log level
     level = getattr(logging, log_level.upper(), logging.INFO)
     logger.setLevel(level)
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = _LOG_FORMATTER
 
     # Add console handler if requested
     if log_to_console:
@@ -62,25 +119,286 @@ def setup_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
+    _logger_settings[name] = settings
     return logger
 
 
+class _ReadingLog:
+    """An open reading log with the lines written since its last flush"""
+
+    __slots__ = ('path', 'file', 'inode', 'flushed_size', 'pending',
+                 'pending_index', 'last_flush')
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.file = open(path, 'ab', buffering=_FLUSH_BYTES)
+        st = os.fstat(self.file.fileno())
+        self.inode = st.st_ino
+        self.flushed_size = st.st_size
+        self.pending = 0
+        self.pending_index: List[tuple] = []
+        self.last_flush = time.monotonic()
+
+    def is_current(self) -> bool:
+        """Check the path still names the open file (not rotated or replaced)"""
+        try:
+            return os.stat(self.path).st_ino == self.inode
+        except OSError:
+            return False
+
+    def write(self, line: bytes, index_path: Optional[Path]) -> None:
+        """Buffer a line, noting where it will land for the offset index"""
+        offset = self.flushed_size + self.pending
+        self.file.write(line)
+        self.pending += len(line)
+        if index_path is not None:
+            self.pending_index.append((index_path, offset, len(line)))
+
+    def flush(self) -> None:
+        """Write out buffered lines and record them in their offset indexes"""
+        if self.pending:
+            self.file.flush()
+            size = os.fstat(self.file.fileno()).st_size
+            # If another writer got in between, leave it to the next reader
+            # to catch the indexes up from the log itself
+            if size == self.flushed_size + self.pending:
+                for index_path, offset, length in self.pending_index:
+                    _index_appended_line(index_path, offset, length)
+            self.flushed_size = size
+            self.pending = 0
+            self.pending_index.clear()
+        self.last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the file"""
+        self.flush()
+        self.file.close()
+
+
+def _flush_reading_logs() -> None:
+    """Flush every open reading log (run by the flush timer)"""
+    global _flush_timer
+    with _log_handles_lock:
+        for log in _log_handles.values():
+            log.flush()
+        _flush_timer = None
+
+
+def _schedule_flush() -> None:
+    """Make sure buffered lines are flushed within _FLUSH_INTERVAL"""
+    global _flush_timer
+    if _flush_timer is None:
+        _flush_timer = threading.Timer(_FLUSH_INTERVAL, _flush_reading_logs)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
 def log_reading(
     reading: Dict[str, Any],
-    log_file: str = "logs/readings.jsonl"
+    log_file: str = "logs/readings.jsonl",
+    timestamp: Optional[str] = None
 ) -> None:
     """
     Log a meter reading to a JSON Lines file
 
+    The file is kept open between calls (and reopened if it is rotated or
+    replaced). Lines are flushed once a second or every 64 KB, whichever
+    comes first; get_recent_readings() flushes before reading.
+
     Args:
         reading: Reading dictionary to log
         log_file: Path to JSONL log file
+        timestamp: ISO timestamp recorded for readings that lack one, so a
+                   batch of readings can share one (optional)
     """
-    log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    if timestamp is not None and 'timestamp' not in reading:
+        reading = {**reading, 'timestamp': timestamp}
+
+    line = _dumps(reading) + b'\n'
+
+    meter_type = reading.get('meter_type')
+    index_path = None
+    if isinstance(meter_type, str) and _INDEXABLE_TYPE.fullmatch(meter_type):
+        index_path = _offsets_path(log_file, meter_type)
+
+    with _log_handles_lock:
+        log = _log_handles.get(log_file)
+        if log is not None and not log.is_current():
+            # Buffered lines belong to the old file; its index entries don't
+            log.pending_index.clear()
+            log.close()
+            log = None
+        if log is None:
+            log = _log_handles[log_file] = _ReadingLog(Path(log_file))
+
+        log.write(line, index_path)
+        if (log.pending >= _FLUSH_BYTES
+                or time.monotonic() - log.last_flush >= _FLUSH_INTERVAL):
+            log.flush()
+        else:
+            _schedule_flush()
+
+
+def _offsets_path(log_file: str, meter_type: str) -> Path:
+    """Get the offset index path for one meter type's readings"""
+    return Path(log_file).with_suffix(f".{meter_type}.offsets")
+
+
+def _index_appended_line(index_path: Path, offset: int, length: int) -> None:
+    """
+    Record a just-flushed log line in its type's offset index
+
+    Only done when the index is current up to that line; otherwise (no
+    index yet, or other lines in between) the next reader catches the
+    index up from the log itself.
+    """
+    try:
+        with open(index_path, 'r+b') as index:
+            if _OFFSET.unpack(index.read(_OFFSET.size))[0] != offset:
+                return
+            index.seek(0, os.SEEK_END)
+            index.write(_OFFSET.pack(offset))
+            index.seek(0)
+            index.write(_OFFSET.pack(offset + length))
+    except (OSError, struct.error):
+        pass
+
+
+def _update_offsets(log_path: Path, index_path: Path, meter_type: str) -> None:
+    """
+    Bring a type's offset index up to date with the end of the log
+
+    The updated index is written to a temporary file and renamed over the
+    old one, so this needs no lock: readers and log_reading() always see
+    a complete index, and at worst an update is redone by the next reader.
+    """
+    with open(log_path, 'rb') as log:
+        identity = (os.fstat(log.fileno()).st_ino, zlib.crc32(log.readline(4096)))
+        log_size = log.seek(0, os.SEEK_END)
+
+        indexed_to, offsets = 0, b''
+        try:
+            with open(index_path, 'rb') as index:
+                data = index.read()
+        except FileNotFoundError:
+            data = b''
+        if len(data) >= _INDEX_HEADER.size and not len(data) % _OFFSET.size:
+            header_to, *header_identity = _INDEX_HEADER.unpack_from(data)
+            # Otherwise a new index, or the log was replaced, truncated or
+            # rewritten: start over
+            if tuple(header_identity) == identity and header_to <= log_size:
+                indexed_to = header_to
+                offsets = data[_INDEX_HEADER.size:]
+                # Drop entries a writer appended before moving the header
+                while offsets and _OFFSET.unpack_from(offsets, len(offsets) - _OFFSET.size)[0] >= indexed_to:
+                    offsets = offsets[:-_OFFSET.size]
+        if data and indexed_to == log_size:
+            return
+
+        needle = meter_type.encode('utf-8')
+        new_offsets = []
+        log.seek(indexed_to)
+        for line in log:
+            if not line.endswith(b'\n'):
+                break  # Partial last line: index it once it is complete
+            if needle in line:
+                try:
+                    reading = _loads(line)
+                except ValueError:
+                    reading = None
+                if isinstance(reading, dict) and reading.get('meter_type') == meter_type:
+                    new_offsets.append(indexed_to)
+            indexed_to += len(line)
+
+    fd, tmp_path = tempfile.mkstemp(dir=index_path.parent, prefix=index_path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as index:
+            index.write(_INDEX_HEADER.pack(indexed_to, *identity))
+            index.write(offsets)
+            index.write(b''.join(_OFFSET.pack(offset) for offset in new_offsets))
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _recent_readings_by_offsets(log_path: Path, limit: int,
+                                meter_type: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get a meter type's most recent readings through its offset index
+
+    Returns:
+        Readings, most recent first, or None if the index turned out to be
+        stale (it is removed, to be rebuilt on the next call)
+    """
+    index_path = _offsets_path(str(log_path), meter_type)
+    _update_offsets(log_path, index_path, meter_type)
+
+    with open(index_path, 'rb') as index:
+        (indexed_to,) = _OFFSET.unpack(index.read(_OFFSET.size))
+        end = index.seek(0, os.SEEK_END)
+        start = _INDEX_HEADER.size
+        if limit > 0:
+            # One spare entry, in case a writer is between appending an
+            # offset and moving the header past it
+            start = max(start, end - (limit + 1) * _OFFSET.size)
+        index.seek(start)
+        data = index.read(end - start)
+
+    offsets = [offset for (offset,) in _OFFSET.iter_unpack(data) if offset < indexed_to]
+    if limit > 0:
+        offsets = offsets[-limit:]
 
-    with open(log_path, 'a') as f:
-        f.write(json.dumps(reading) + '\n')
+    readings = []
+    with open(log_path, 'rb') as log:
+        for offset in reversed(offsets):
+            log.seek(offset)
+            try:
+                reading = _loads(log.readline())
+            except ValueError:
+                reading = None
+            if not isinstance(reading, dict) or reading.get('meter_type') != meter_type:
+                index_path.unlink(missing_ok=True)
+                return None
+            readings.append(reading)
+    return readings
+
+
+def close_reading_logs() -> None:
+    """Flush and close the reading log files held open by log_reading()"""
+    global _flush_timer
+    with _log_handles_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        for log in _log_handles.values():
+            log.close()
+        _log_handles.clear()
+
+
+atexit.register(close_reading_logs)
+
+
+def _iter_lines_reversed(f: IO[bytes], block_size: int = 65536):
+    """
+    Yield the lines of a binary file, last line first
+
+    The file is read backwards in block_size chunks, so a caller that stops
+    early only reads the tail of the file.
+    """
+    end = f.seek(0, os.SEEK_END)
+    partial = b''
+    while end > 0:
+        start = max(0, end - block_size)
+        f.seek(start)
+        lines = (f.read(end - start) + partial).split(b'\n')
+        end = start
+
+        # The first piece may continue in the block before this one
+        partial = lines[0]
+        yield from reversed(lines[1:])
+    yield partial
 
 
 def get_recent_readings(
@@ -91,9 +409,14 @@ def get_recent_readings(
     """
     Get recent readings from log file
 
+    The file is read from the end, stopping once limit readings are found.
+    When filtering by meter type, the readings are located through that
+    type's offset index instead (built from the log on first use), so other
+    meters' readings in between aren't read at all.
+
     Args:
         log_file: Path to JSONL log file
-        limit: Maximum number of readings to return
+        limit: Maximum number of readings to return (0 for all)
         meter_type: Filter by meter type (optional)
 
     Returns:
@@ -101,26 +424,78 @@ def get_recent_readings(
     """
     log_path = Path(log_file)
 
+    # Readings this process logged may still be buffered
+    with _log_handles_lock:
+        log = _log_handles.get(log_file)
+        if log is not None:
+            log.flush()
+
     if not log_path.exists():
         return []
 
+    if meter_type and _INDEXABLE_TYPE.fullmatch(meter_type):
+        try:
+            readings = _recent_readings_by_offsets(log_path, limit, meter_type)
+        except (OSError, struct.error):
+            readings = None
+        if readings is not None:
+            return readings
+
     readings = []
 
-    with open(log_path, 'r') as f:
-        for line in f:
+    with open(log_path, 'rb') as f:
+        for line in _iter_lines_reversed(f):
+            if not line.strip():
+                continue
             try:
-                reading = json.loads(line.strip())
-
-                # Filter by meter type if specified
-                if meter_type and reading.get('meter_type') != meter_type:
-                    continue
+                reading = _loads(line)
+            except ValueError:
+                continue
 
-                readings.append(reading)
-            except json.JSONDecodeError:
+            # Filter by meter type if specified
+            if meter_type and reading.get('meter_type') != meter_type:
                 continue
 
-    # Return most recent readings first
-    return readings[-limit:][::-1]
+            readings.append(reading)
+            if len(readings) == limit:
+                break
+
+    return readings
+
+
+def _format_water_summary(reading: Dict[str, Any]) -> str:
+    """Summary line for a water reading"""
+    return (
+        f"[WATER] {reading.get('total_reading', 0):.3f} m³ "
+        f"(confidence: {reading.get('confidence', 'unknown')}) "
+        f"at {reading.get('timestamp', 'unknown')}"
+    )
+
+
+def _format_electric_summary(reading: Dict[str, Any]) -> str:
+    """Summary line for an electric reading"""
+    return (
+        f"[ELECTRIC] {reading.get('total_reading', 0):.2f} kWh "
+        f"(confidence: {reading.get('confidence', 'unknown')}) "
+        f"at {reading.get('timestamp', 'unknown')}"
+    )
+
+
+def _format_gas_summary(reading: Dict[str, Any]) -> str:
+    """Summary line for a gas reading"""
+    return (
+        f"[GAS] {reading.get('total_reading', 0):.2f} {reading.get('unit', 'CCF')} "
+        f"(confidence: {reading.get('confidence', 'unknown')}) "
+        f"at {reading.get('timestamp', 'unknown')}"
+    )
+
+
+# Reading summary formatters by (upper-cased) meter type
+_SUMMARY_FORMATTERS = {
+    'WATER': _format_water_summary,
+    'ELECTRIC': _format_electric_summary,
+    'GAS': _format_gas_summary,
+}
 
 
 def format_reading_summary(reading: Dict[str, Any]) -> str:
@@ -133,36 +508,52 @@ def format_reading_summary(reading: Dict[str, Any]) -> str:
     Returns:
         Formatted summary string
     """
+    meter_type = reading.get('meter_type', 'unknown').upper()
+
     if 'error' in reading:
-        return (
-            f"[{reading.get('meter_type', 'unknown').upper()}] "
-            f"ERROR: {reading['error']}"
-        )
+        return f"[{meter_type}] ERROR: {reading['error']}"
+
+    formatter = _SUMMARY_FORMATTERS.get(meter_type)
+    if formatter is not None:
+        return formatter(reading)
 
-    meter_type = reading.get('meter_type', 'unknown').upper()
     total = reading.get('total_reading', 0)
     confidence = reading.get('confidence', 'unknown')
     timestamp = reading.get('timestamp', 'unknown')
-
-    # Format based on meter type
-    if meter_type == 'WATER':
-        return (
-            f"[WATER] {total:.3f} m³ "
-            f"(confidence: {confidence}) at {timestamp}"
-        )
-    elif meter_type == 'ELECTRIC':
-        return (
-            f"[ELECTRIC] {total:.2f} kWh "
-            f"(confidence: {confidence}) at {timestamp}"
-        )
-    elif meter_type == 'GAS':
-        unit = reading.get('unit', 'CCF')
-        return (
-            f"[GAS] {total:.2f} {unit} "
-            f"(confidence: {confidence}) at {timestamp}"
-        )
-    else:
-        return f"[{meter_type}] {total} (confidence: {confidence}) at {timestamp}"
+    return f"[{meter_type}] {total} (confidence: {confidence}) at {timestamp}"
+
+
+# Meter-specific lines in format_statistics, by meter type:
+# (label, stats key, value format, default). Gas keys and formats use the
+# meter's unit ({unit}).
+_STATISTICS_FIELDS = {
+    'WATER': (
+        ("Total usage", 'total_usage_m3', "{:.3f} m³", 0),
+        ("Total usage", 'total_usage_liters', "{:.1f} L", 0),
+        ("Total usage", 'total_usage_gallons', "{:.1f} gallons", 0),
+        ("Average rate", 'average_rate_m3_per_hour', "{:.3f} m³/hour", 0),
+        ("Current flow", 'current_flow_rate_lpm', "{:.2f} L/min", 0),
+        ("Leak detected", 'potential_leak', "{}", False),
+    ),
+    'ELECTRIC': (
+        ("Total usage", 'total_usage_kwh', "{:.2f} kWh", 0),
+        ("Average rate", 'average_rate_kwh_per_hour', "{:.3f} kWh/hour", 0),
+        ("Average daily", 'average_rate_kwh_per_day', "{:.2f} kWh/day", 0),
+        ("Current power", 'current_power_kw', "{:.3f} kW", 0),
+        ("Current power", 'current_power_watts', "{:.1f} W", 0),
+        ("Estimated monthly cost", 'estimated_monthly_cost', "${:.2f}", 0),
+        ("High usage alert", 'high_usage_alert', "{}", False),
+    ),
+    'GAS': (
+        ("Total usage", 'total_usage_{unit}', "{:.2f} {unit}", 0),
+        ("Total usage", 'total_usage_therms', "{:.2f} therms", 0),
+        ("Average rate", 'average_rate_{unit}_per_hour', "{:.3f} {unit}/hour", 0),
+        ("Average daily", 'average_rate_{unit}_per_day', "{:.2f} {unit}/day", 0),
+        ("Current flow", 'current_flow_rate_{unit}_per_hour', "{:.3f} {unit}/hour", 0),
+        ("Estimated monthly cost", 'estimated_monthly_cost', "${:.2f}", 0),
+        ("High usage alert", 'high_usage_alert', "{}", False),
+    ),
+}
 
 
 def format_statistics(stats: Dict[str, Any]) -> str:
@@ -191,36 +582,11 @@ def format_statistics(stats: Dict[str, Any]) -> str:
     ]
 
     # Add meter-specific statistics
-    if meter_type == 'WATER':
-        lines.extend([
-            f"Total usage: {stats.get('total_usage_m3', 0):.3f} m³",
-            f"Total usage: {stats.get('total_usage_liters', 0):.1f} L",
-            f"Total usage: {stats.get('total_usage_gallons', 0):.1f} gallons",
-            f"Average rate: {stats.get('average_rate_m3_per_hour', 0):.3f} m³/hour",
-            f"Current flow: {stats.get('current_flow_rate_lpm', 0):.2f} L/min",
-            f"Leak detected: {stats.get('potential_leak', False)}"
-        ])
-    elif meter_type == 'ELECTRIC':
-        lines.extend([
-            f"Total usage: {stats.get('total_usage_kwh', 0):.2f} kWh",
-            f"Average rate: {stats.get('average_rate_kwh_per_hour', 0):.3f} kWh/hour",
-            f"Average daily: {stats.get('average_rate_kwh_per_day', 0):.2f} kWh/day",
-            f"Current power: {stats.get('current_power_kw', 0):.3f} kW",
-            f"Current power: {stats.get('current_power_watts', 0):.1f} W",
-            f"Estimated monthly cost: ${stats.get('estimated_monthly_cost', 0):.2f}",
-            f"High usage alert: {stats.get('high_usage_alert', False)}"
-        ])
-    elif meter_type == 'GAS':
-        unit = stats.get('unit', 'CCF').lower()
-        lines.extend([
-            f"Total usage: {stats.get(f'total_usage_{unit}', 0):.2f} {stats.get('unit', 'CCF')}",
-            f"Total usage: {stats.get('total_usage_therms', 0):.2f} therms",
-            f"Average rate: {stats.get(f'average_rate_{unit}_per_hour', 0):.3f} {stats.get('unit', 'CCF')}/hour",
-            f"Average daily: {stats.get(f'average_rate_{unit}_per_day', 0):.2f} {stats.get('unit', 'CCF')}/day",
-            f"Current flow: {stats.get(f'current_flow_rate_{unit}_per_hour', 0):.3f} {stats.get('unit', 'CCF')}/hour",
-            f"Estimated monthly cost: ${stats.get('estimated_monthly_cost', 0):.2f}",
-            f"High usage alert: {stats.get('high_usage_alert', False)}"
-        ])
+    unit = stats.get('unit', 'CCF')
+    unit_key = unit.lower()
+    for label, key, value_format, default in _STATISTICS_FIELDS.get(meter_type, ()):
+        value = stats.get(key.format(unit=unit_key), default)
+        lines.append(f"{label}: " + value_format.format(value, unit=unit))
 
     lines.append("=" * 50)
     return "\n".join(lines)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Vision Response Cache Module
+Caches vision model results keyed by a hash of (image bytes, prompt, model)
+so repeat reads of an unchanged image skip the API call entirely
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    import hashlib
+
+    def _hasher(data: bytes):
+        return hashlib.blake2b(data, digest_size=32)
+
+
+DEFAULT_CACHE_PATH = os.getenv('VISION_CACHE_PATH', '/tmp/vision_cache.sqlite')
+
+
+def make_cache_key(image_bytes: bytes, prompt: str, model: str) -> str:
+    """
+    Build a cache key for a vision request
+
+    Args:
+        image_bytes: Raw image bytes sent to the model
+        prompt: Prompt text
+        model: Model identifier (include anything else that changes the output)
+
+    Returns:
+        64-character hex digest (32-byte BLAKE3, or BLAKE2b if blake3 is missing)
+    """
+    hasher = _hasher(image_bytes)
+    hasher.update(b'\0' + prompt.encode('utf-8'))
+    hasher.update(b'\0' + model.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+class VisionCache:
+    """SQLite-backed cache of vision model results"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH):
+        """
+        Initialize vision cache
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Autocommit + WAL so concurrent readers don't block each other;
+        # the lock serializes use of the shared connection across threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, result_json TEXT NOT NULL, created_at INTEGER NOT NULL)'
+        )
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result for a key, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT result_json FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, result: Dict):
+        """Store a result under a key (replacing any previous entry)"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache (key, result_json, created_at) VALUES (?, ?, ?)',
+                (key, json.dumps(result), int(time.time()))
+            )
+
+    def clear(self):
+        """Remove all cached results"""
+        with self._lock:
+            self._conn.execute('DELETE FROM cache')
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
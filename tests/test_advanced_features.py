@@ -10,8 +10,10 @@ Tests all five feature areas:
 5. Sound Feedback System
 """
 
+import os
 import unittest
 import json
+import shutil
 import tempfile
 import base64
 from pathlib import Path
@@ -28,28 +30,75 @@ from advanced_features_api import AdvancedFeaturesAPI
 # Import Flask for testing
 from flask import Flask
 
+# One app for every test: requests only need its context, and no test
+# stores state on it
+APP = Flask(__name__)
+APP.testing = True
 
-class TestSnapshotOptimization(unittest.TestCase):
+# Keep test files in RAM where a tmpfs is available (Linux)
+TEST_TMP_ROOT = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+
+
+def _make_test_image_base64():
+    """Encode a small red JPEG as base64, as a device would push it"""
+    buffer = BytesIO()
+    Image.new('RGB', (100, 100), color='red').save(buffer, format='JPEG')
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+TEST_IMAGE_BASE64 = _make_test_image_base64()
+
+
+def _make_snapshot_jpeg():
+    """Encode the 640x480 blue snapshot used by the snapshot tests"""
+    buffer = BytesIO()
+    Image.new('RGB', (640, 480), color='blue').save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+SNAPSHOT_JPEG = _make_snapshot_jpeg()
+
+
+class AdvancedFeaturesTestCase(unittest.TestCase):
+    """Base class sharing one API instance and log directory per test class"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by the class's tests"""
+        cls.test_dir = tempfile.mkdtemp(dir=TEST_TMP_ROOT)
+        cls.api = AdvancedFeaturesAPI(log_dir=cls.test_dir)
+        cls.app = APP
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared log directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+
+    def setUp(self):
+        """Start each test with an empty device registry"""
+        self.api.device_registry = {
+            'devices': {},
+            'qr_codes': {}
+        }
+
+
+class TestSnapshotOptimization(AdvancedFeaturesTestCase):
     """Test snapshot and ML optimization features"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.test_dir = tempfile.mkdtemp()
-        self.api = AdvancedFeaturesAPI(log_dir=self.test_dir)
-        self.app = Flask(__name__)
-        self.app.testing = True
+        super().setUpClass()
         
         # Create test snapshot
-        self.create_test_snapshot('water')
+        cls.create_test_snapshot('water')
     
-    def create_test_snapshot(self, meter_type):
+    @classmethod
+    def create_test_snapshot(cls, meter_type):
         """Create a test snapshot image"""
-        snapshot_dir = Path(self.test_dir) / "meter_snapshots" / meter_type
+        snapshot_dir = Path(cls.test_dir) / "meter_snapshots" / meter_type
         snapshot_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create a simple test image
-        img = Image.new('RGB', (640, 480), color='blue')
-        img.save(snapshot_dir / f"{meter_type}_test.jpg")
+        (snapshot_dir / f"{meter_type}_test.jpg").write_bytes(SNAPSHOT_JPEG)
     
     def test_clean_snapshot_exists(self):
         """Test getting clean snapshot when it exists"""
@@ -74,16 +123,9 @@ class TestSnapshotOptimization(unittest.TestCase):
             self.assertEqual(data['status'], 'error')
 
 
-class TestPushDataCapabilities(unittest.TestCase):
+class TestPushDataCapabilities(AdvancedFeaturesTestCase):
     """Test push data capabilities"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_dir = tempfile.mkdtemp()
-        self.api = AdvancedFeaturesAPI(log_dir=self.test_dir)
-        self.app = Flask(__name__)
-        self.app.testing = True
-    
     def test_device_registration(self):
         """Test device registration"""
         with self.app.test_request_context(
@@ -126,10 +168,7 @@ class TestPushDataCapabilities(unittest.TestCase):
             auth_token = reg_data['auth_token']
         
         # Now push data
-        test_image = Image.new('RGB', (100, 100), color='red')
-        buffer = BytesIO()
-        test_image.save(buffer, format='JPEG')
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
+        image_base64 = TEST_IMAGE_BASE64
         
         with self.app.test_request_context(
             json={
@@ -172,16 +211,9 @@ class TestPushDataCapabilities(unittest.TestCase):
             self.assertIn('Invalid auth token', data['message'])
 
 
-class TestQROnboarding(unittest.TestCase):
+class TestQROnboarding(AdvancedFeaturesTestCase):
     """Test QR-based device onboarding"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_dir = tempfile.mkdtemp()
-        self.api = AdvancedFeaturesAPI(log_dir=self.test_dir)
-        self.app = Flask(__name__)
-        self.app.testing = True
-    
     def test_generate_qr_code(self):
         """Test QR code generation"""
         with self.app.test_request_context(
@@ -283,15 +315,12 @@ class TestQROnboarding(unittest.TestCase):
             self.assertIn('already been used', data['message'])
 
 
-class TestGeolocation(unittest.TestCase):
+class TestGeolocation(AdvancedFeaturesTestCase):
     """Test geolocation integration"""
     
     def setUp(self):
         """Set up test fixtures"""
-        self.test_dir = tempfile.mkdtemp()
-        self.api = AdvancedFeaturesAPI(log_dir=self.test_dir)
-        self.app = Flask(__name__)
-        self.app.testing = True
+        super().setUp()
         
         # Register a test device
         with self.app.test_request_context(
@@ -376,16 +405,9 @@ class TestGeolocation(unittest.TestCase):
             self.assertGreater(len(data['devices']), 0)
 
 
-class TestSoundFeedback(unittest.TestCase):
+class TestSoundFeedback(AdvancedFeaturesTestCase):
     """Test sound feedback system"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_dir = tempfile.mkdtemp()
-        self.api = AdvancedFeaturesAPI(log_dir=self.test_dir)
-        self.app = Flask(__name__)
-        self.app.testing = True
-    
     def test_get_audio_feedback_no_file(self):
         """Test audio feedback when file doesn't exist"""
         with self.app.test_request_context():
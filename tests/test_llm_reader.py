@@ -0,0 +1,64 @@
+import base64
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import llm_reader
+from llm_reader import encode_image
+
+try:
+    from PIL import Image
+    import numpy as np
+except ImportError:
+    Image = None
+
+
+@unittest.skipUnless(Image is not None and llm_reader.IMAGE_PROCESSING_AVAILABLE,
+                     "image processing dependencies not installed")
+class EncodeImageTests(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+
+    def _jpeg(self, name, width, height):
+        # Noise compresses poorly, so size tracks the pixel count
+        pixels = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+        path = str(Path(self.test_dir) / name)
+        Image.fromarray(pixels).save(path, format="JPEG", quality=95)
+        return path
+
+    def test_recompress_uploads_small_files_unchanged(self):
+        path = self._jpeg("small.jpg", 64, 48)
+        self.assertLessEqual(Path(path).stat().st_size, llm_reader.RECOMPRESS_THRESHOLD_BYTES)
+
+        data, media_type = encode_image(path, recompress=True)
+
+        self.assertEqual(media_type, "image/jpeg")
+        self.assertEqual(base64.b64decode(data), Path(path).read_bytes())
+
+    def test_recompress_reencodes_large_files(self):
+        path = self._jpeg("large.jpg", 1600, 1200)
+        self.assertGreater(Path(path).stat().st_size, llm_reader.RECOMPRESS_THRESHOLD_BYTES)
+
+        data, media_type = encode_image(path, recompress=True)
+
+        self.assertEqual(media_type, llm_reader.UPLOAD_MEDIA_TYPE)
+        with Image.open(io.BytesIO(base64.b64decode(data))) as img:
+            self.assertLessEqual(max(img.size), llm_reader.MAX_LONG_EDGE)
+
+    def test_crop_keeps_image_without_a_dial(self):
+        path = str(Path(self.test_dir) / "plain.jpg")
+        Image.new("RGB", (640, 480), (90, 90, 90)).save(path, format="JPEG")
+
+        data, _ = encode_image(path, crop_to_meter=True, downscale=False)
+
+        with Image.open(io.BytesIO(base64.b64decode(data))) as img:
+            self.assertEqual(img.size, (640, 480))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from utils.logging_utils import close_reading_logs, get_recent_readings, log_reading
+
+
+class RecentReadingsByTypeTests(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+        self.addCleanup(close_reading_logs)
+        self.log_file = str(Path(self.test_dir) / "readings.jsonl")
+
+    def test_only_matching_meter_type_is_returned(self):
+        log_reading({"meter_type": "water", "total_reading": 1.0}, self.log_file)
+        # Mentions the type without being a reading of that type
+        log_reading({"meter_type": "gas", "notes": "water heater", "total_reading": 2.0},
+                    self.log_file)
+        log_reading({"meter_type": "water", "total_reading": 3.0}, self.log_file)
+
+        readings = get_recent_readings(self.log_file, limit=10, meter_type="water")
+        self.assertEqual([r["total_reading"] for r in readings], [3.0, 1.0])
+
+        # Later readings are picked up by the existing index
+        log_reading({"meter_type": "water", "total_reading": 4.0}, self.log_file)
+        readings = get_recent_readings(self.log_file, limit=2, meter_type="water")
+        self.assertEqual([r["total_reading"] for r in readings], [4.0, 3.0])
+
+    def test_index_is_rebuilt_after_log_is_replaced(self):
+        for total in (1.0, 2.0):
+            log_reading({"meter_type": "water", "total_reading": total}, self.log_file)
+        self.assertEqual(len(get_recent_readings(self.log_file, meter_type="water")), 2)
+
+        replacement = Path(self.test_dir) / "replacement.jsonl"
+        replacement.write_text('{"meter_type": "electric", "total_reading": 5.0}\n'
+                               '{"meter_type": "water", "total_reading": 9.0}\n')
+        os.replace(replacement, self.log_file)
+
+        readings = get_recent_readings(self.log_file, meter_type="water")
+        self.assertEqual([r["total_reading"] for r in readings], [9.0])
+
+        # The writer follows the new file too
+        log_reading({"meter_type": "water", "total_reading": 10.0}, self.log_file)
+        readings = get_recent_readings(self.log_file, meter_type="water")
+        self.assertEqual([r["total_reading"] for r in readings], [10.0, 9.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from meters import ElectricMeter, GasMeter, WaterMeter
+from meters.schemas import MSGSPEC_AVAILABLE
+
+
+class ValidateBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _meter(self, meter_class, **config):
+        meter = meter_class({"name": "test", "log_dir": self.test_dir, **config})
+        self.addCleanup(meter.close)
+        return meter
+
+    def test_matches_single_reading_checks(self):
+        meter = self._meter(GasMeter, max_change_per_reading=5.0)
+        readings = [
+            {"total_reading": 10.0},
+            {"total_reading": 12.0},
+            {"total_reading": 11.0},   # decreased
+            {"total_reading": 30.0},   # excessive change
+            {"total_reading": None},   # missing
+        ]
+        self.assertEqual(meter.validate_batch(readings).tolist(),
+                         [True, True, False, False, False])
+
+    def test_first_reading_compared_with_history(self):
+        meter = self._meter(GasMeter, max_change_per_reading=5.0)
+        meter._record_reading({"total_reading": 100.0, "timestamp": "2024-01-01T00:00:00"})
+        self.assertEqual(meter.validate_batch([{"total_reading": 90.0}]).tolist(), [False])
+
+    def test_water_digit_and_dial_checks(self):
+        meter = self._meter(WaterMeter)
+        readings = [
+            {"total_reading": 1.5, "digital_reading": 1, "dial_reading": 0.5},
+            {"total_reading": 1.9, "digital_reading": 1, "dial_reading": 0.6},  # mismatch
+            {"total_reading": 3.0, "digital_reading": 2, "dial_reading": 1.0},  # dial range
+        ]
+        self.assertEqual(meter.validate_batch(readings).tolist(), [True, False, False])
+
+
+class ParseReadingTests(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _meter(self, meter_class):
+        meter = meter_class({"name": "test", "log_dir": self.test_dir})
+        self.addCleanup(meter.close)
+        return meter
+
+    def test_fractional_multiplier_is_applied(self):
+        meter = self._meter(ElectricMeter)
+        reading = meter.parse_reading({"total_reading": 1200.0, "confidence": "high",
+                                       "multiplier": 0.1})
+        self.assertAlmostEqual(reading["total_reading"], 120.0)
+        self.assertEqual(reading["digital_reading"], reading["total_reading"])
+
+    def test_missing_required_field_raises_value_error(self):
+        meter = self._meter(ElectricMeter)
+        with self.assertRaises(ValueError):
+            meter.parse_reading({"confidence": "high"})
+
+    @unittest.skipUnless(MSGSPEC_AVAILABLE, "msgspec not installed")
+    def test_numeric_strings_are_coerced(self):
+        meter = self._meter(ElectricMeter)
+        reading = meter.parse_reading({"total_reading": "1200.5", "confidence": "high",
+                                       "multiplier": "10", "api_usage": {}})
+        self.assertEqual(reading["total_reading"], 12005.0)
+        self.assertEqual(reading["multiplier"], 10)
+        self.assertIn("api_usage", reading)
+
+    @unittest.skipUnless(MSGSPEC_AVAILABLE, "msgspec not installed")
+    def test_wrong_type_raises_value_error(self):
+        meter = self._meter(WaterMeter)
+        with self.assertRaises(ValueError):
+            meter.parse_reading({"total_reading": 1.5, "confidence": "high",
+                                 "digital_reading": "one", "dial_reading": 0.5})
+
+
+class ReadMeterTests(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+
+    def test_meters_read_in_one_tick_share_its_timestamp(self):
+        responses = iter([
+            {"total_reading": 100.0, "confidence": "high", "timestamp": "2024-01-01T00:00:01"},
+            {"total_reading": 200.0, "confidence": "high", "timestamp": "2024-01-01T00:00:02"},
+        ])
+        tick = "2024-01-01T00:00:00"
+
+        with mock.patch.object(ElectricMeter, "capture_snapshot", return_value=True), \
+                mock.patch("meters.base_meter.read_meter_with_claude",
+                           side_effect=lambda *args, **kwargs: next(responses)):
+            readings = []
+            for name in ("first", "second"):
+                meter = ElectricMeter({"name": name, "log_dir": self.test_dir})
+                self.addCleanup(meter.close)
+                readings.append(meter.read_meter(now=tick))
+
+        self.assertEqual([r["timestamp"] for r in readings], [tick, tick])
+
+
+if __name__ == "__main__":
+    unittest.main()
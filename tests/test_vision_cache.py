@@ -0,0 +1,46 @@
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from vision_cache import VisionCache, make_cache_key
+
+
+class VisionCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+        self.cache = VisionCache(db_path=str(Path(self.test_dir) / "cache.sqlite"))
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_key_depends_on_image_prompt_and_model(self):
+        base = make_cache_key(b"image", "prompt", "model")
+
+        self.assertEqual(base, make_cache_key(b"image", "prompt", "model"))
+        self.assertNotEqual(base, make_cache_key(b"other", "prompt", "model"))
+        self.assertNotEqual(base, make_cache_key(b"image", "other", "model"))
+        self.assertNotEqual(base, make_cache_key(b"image", "prompt", "other"))
+        self.assertEqual(len(base), 64)
+
+    def test_round_trip_and_miss(self):
+        key = make_cache_key(b"image", "prompt", "model")
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, {"total_reading": 2271.37, "confidence": "high"})
+
+        self.assertEqual(self.cache.get(key), {"total_reading": 2271.37, "confidence": "high"})
+
+    def test_put_replaces_existing_entry(self):
+        key = make_cache_key(b"image", "prompt", "model")
+        self.cache.put(key, {"total_reading": 1.0})
+        self.cache.put(key, {"total_reading": 2.0})
+
+        self.assertEqual(self.cache.get(key)["total_reading"], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()